@@ -357,7 +357,7 @@ def render_overview_tab() -> None:
         if HUBSPOT_AVAILABLE:
             client = get_hubspot_client() if 'get_hubspot_client' in dir() else None
             if client:
-                status = client.test_connection()
+                status = client.connection_status()
                 hubspot_connected = status.get("connected", False)
         
         st.markdown(f"""
@@ -8,11 +8,17 @@ Author: rockITdata LLC
 Version: 2.0.0
 """
 
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import cache
+from itertools import chain
+from typing import Iterator, NamedTuple, Optional
 from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
 import random
+import sys
 
 # =============================================================================
 # ENUMS
@@ -141,6 +147,15 @@ class Deal:
     created_at: str = ""
     updated_at: str = ""
 
+    def __post_init__(self):
+        # Low-cardinality fields used in filters; interning lets equal values
+        # share one object and compare by identity.
+        self.agency = sys.intern(self.agency)
+        self.phase = sys.intern(self.phase)
+        self.stage = sys.intern(self.stage)
+        self.set_aside = sys.intern(self.set_aside)
+        self.contract_type = sys.intern(self.contract_type)
+
 
 @dataclass
 class Artifact:
@@ -159,6 +174,9 @@ class Artifact:
     file_path: str = ""
     description: str = ""
 
+    def __post_init__(self):
+        self.artifact_type = sys.intern(self.artifact_type)
+
 
 @dataclass
 class Requirement:
@@ -175,6 +193,9 @@ class Requirement:
     assignee: str = ""
     notes: str = ""
 
+    def __post_init__(self):
+        self.volume = sys.intern(self.volume)
+
 
 @dataclass
 class Review:
@@ -260,452 +281,469 @@ class User:
 # =============================================================================
 # SEED DATA
 # =============================================================================
-
-DEALS_DATA: list[Deal] = [
-    Deal(
-        id="D001",
-        name="CCN Next Gen",
-        customer="DHA/TMA",
-        agency="DHA",
-        value=850_000_000,
-        p_win=75,
-        phase="P3",
-        stage="RED",
-        priority=DealPriority.HIGH,
-        status=DealStatus.ON_TRACK,
-        due_date="2026-03-15",
-        capture_manager="Mary Womack",
-        proposal_manager="John Smith",
-        risk_score=6,
-        description="Next generation Community Care Network contract for TRICARE beneficiaries",
-        solicitation_number="HT9402-25-R-0001",
-        contract_type="IDIQ",
-        set_aside="Full & Open",
-    ),
-    Deal(
-        id="D002",
-        name="EHRM Restart",
-        customer="VA OIT",
-        agency="VA",
-        value=120_000_000,
-        p_win=65,
-        phase="P2",
-        stage="PINK",
-        priority=DealPriority.HIGH,
-        status=DealStatus.AT_RISK,
-        due_date="2026-04-01",
-        capture_manager="John Smith",
-        proposal_manager="Sarah Davis",
-        risk_score=8,
-        description="Electronic Health Record Modernization support services",
-        solicitation_number="36C10B25R0042",
-        contract_type="T&M",
-        set_aside="SDVOSB",
-    ),
-    Deal(
-        id="D003",
-        name="IHT 2.0",
-        customer="VA/IHS",
-        agency="VA",
-        value=45_000_000,
-        p_win=80,
-        phase="P1",
-        stage="BLUE",
-        priority=DealPriority.MEDIUM,
-        status=DealStatus.ON_TRACK,
-        due_date="2026-06-15",
-        capture_manager="Mary Womack",
-        risk_score=3,
-        description="Interoperability & Health Technology modernization",
-        solicitation_number="TBD",
-        contract_type="FFP",
-        set_aside="SDVOSB",
-    ),
-    Deal(
-        id="D004",
-        name="DHA Data Governance",
-        customer="DHA CIO",
-        agency="DHA",
-        value=25_000_000,
-        p_win=60,
-        phase="P0",
-        stage="G1",
-        priority=DealPriority.LOW,
-        status=DealStatus.NEW,
-        due_date="2026-08-01",
-        capture_manager="Sarah Davis",
-        risk_score=5,
-        description="Enterprise data governance and analytics platform",
-        solicitation_number="TBD",
-        contract_type="FFP",
-        set_aside="8(a)",
-    ),
-    Deal(
-        id="D005",
-        name="PPI MEDIC Zone 2",
-        customer="CMS/OIT",
-        agency="CMS",
-        value=180_000_000,
-        p_win=55,
-        phase="P1",
-        stage="CAP",
-        priority=DealPriority.HIGH,
-        status=DealStatus.ON_TRACK,
-        due_date="2026-05-20",
-        capture_manager="Mary Womack",
-        risk_score=7,
-        description="Program & Provider Integrity MEDIC Zone 2 contract",
-        solicitation_number="75FCMC25R0018",
-        contract_type="CPFF",
-        set_aside="Full & Open",
-    ),
-]
-
-ARTIFACTS_DATA: list[Artifact] = [
-    Artifact(
-        id="A001",
-        name="CCN Technical Volume Draft",
-        artifact_type="Vol I",
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        version="v2.3",
-        status=ArtifactStatus.IN_REVIEW,
-        owner="Mary Womack",
-        last_modified="2026-01-14",
-        size="2.4 MB",
-        compliance_pct=85,
-    ),
-    Artifact(
-        id="A002",
-        name="CCN Compliance Matrix",
-        artifact_type="Matrix",
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        version="v1.8",
-        status=ArtifactStatus.CURRENT,
-        owner="John Smith",
-        last_modified="2026-01-13",
-        size="156 KB",
-        compliance_pct=100,
-    ),
-    Artifact(
-        id="A003",
-        name="EHRM Win Strategy Brief",
-        artifact_type="Strategy",
-        deal_id="D002",
-        deal_name="EHRM Restart",
-        version="v1.0",
-        status=ArtifactStatus.APPROVED,
-        owner="Sarah Davis",
-        last_modified="2026-01-10",
-        size="1.1 MB",
-    ),
-    Artifact(
-        id="A004",
-        name="IHT Teaming Agreement Template",
-        artifact_type="Legal",
-        deal_id="D003",
-        deal_name="IHT 2.0",
-        version="v1.2",
-        status=ArtifactStatus.DRAFT,
-        owner="Legal Team",
-        last_modified="2026-01-12",
-        size="890 KB",
-    ),
-    Artifact(
-        id="A005",
-        name="Past Performance - DHA MIDS",
-        artifact_type="PP",
-        deal_id="MULTI",
-        deal_name="Multiple",
-        version="v3.0",
-        status=ArtifactStatus.APPROVED,
-        owner="Mary Womack",
-        last_modified="2026-01-08",
-        size="3.2 MB",
-    ),
-    Artifact(
-        id="A006",
-        name="CCN Management Volume Draft",
-        artifact_type="Vol II",
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        version="v2.1",
-        status=ArtifactStatus.IN_REVIEW,
-        owner="John Smith",
-        last_modified="2026-01-14",
-        size="1.8 MB",
-        compliance_pct=78,
-    ),
-    Artifact(
-        id="A007",
-        name="CCN Past Performance Volume",
-        artifact_type="Vol III",
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        version="v1.5",
-        status=ArtifactStatus.APPROVED,
-        owner="Mary Womack",
-        last_modified="2026-01-11",
-        size="2.1 MB",
-        compliance_pct=100,
-    ),
-]
-
-REQUIREMENTS_DATA: list[Requirement] = [
-    Requirement(
-        id="REQ-001",
-        deal_id="D001",
-        section="L.5.1",
-        text="The Offeror shall demonstrate understanding of DHA healthcare IT environment",
-        req_type=RequirementType.SHALL,
-        status=RequirementStatus.ADDRESSED,
-        volume="Technical",
-        page=12,
-        evidence_count=3,
-        assignee="Mary Womack",
-    ),
-    Requirement(
-        id="REQ-002",
-        deal_id="D001",
-        section="L.5.2",
-        text="Technical approach shall include transition-in plan not exceeding 90 days",
-        req_type=RequirementType.SHALL,
-        status=RequirementStatus.ADDRESSED,
-        volume="Technical",
-        page=24,
-        evidence_count=2,
-        assignee="John Smith",
-    ),
-    Requirement(
-        id="REQ-003",
-        deal_id="D001",
-        section="L.5.3",
-        text="Offeror should describe experience with Cerner/Oracle Health integration",
-        req_type=RequirementType.SHOULD,
-        status=RequirementStatus.PARTIAL,
-        volume="Technical",
-        evidence_count=1,
-        assignee="Sarah Davis",
-    ),
-    Requirement(
-        id="REQ-004",
-        deal_id="D001",
-        section="M.2.1",
-        text="Technical approach will be evaluated for innovation and risk mitigation strategies",
-        req_type=RequirementType.EVAL,
-        status=RequirementStatus.ADDRESSED,
-        volume="Technical",
-        page=8,
-        evidence_count=4,
-        assignee="Mary Womack",
-    ),
-    Requirement(
-        id="REQ-005",
-        deal_id="D001",
-        section="L.6.1",
-        text="Past performance shall include minimum 3 relevant contracts of similar scope",
-        req_type=RequirementType.SHALL,
-        status=RequirementStatus.NOT_STARTED,
-        volume="Past Perf",
-        evidence_count=0,
-        assignee="Mary Womack",
-    ),
-    Requirement(
-        id="REQ-006",
-        deal_id="D001",
-        section="L.7.1",
-        text="Key Personnel resumes shall not exceed 2 pages each",
-        req_type=RequirementType.SHALL,
-        status=RequirementStatus.ADDRESSED,
-        volume="Management",
-        page=15,
-        evidence_count=5,
-        assignee="HR Team",
-    ),
-    Requirement(
-        id="REQ-007",
-        deal_id="D001",
-        section="L.8.1",
-        text="Pricing shall be submitted using provided templates",
-        req_type=RequirementType.SHALL,
-        status=RequirementStatus.PARTIAL,
-        volume="Pricing",
-        evidence_count=1,
-        assignee="Finance Team",
-    ),
-]
-
-REVIEWS_DATA: list[Review] = [
-    Review(
-        id="RV001",
-        review_type=ReviewType.PINK,
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        status=ReviewStatus.COMPLETED,
-        scheduled_date="2026-01-10",
-        findings_count=12,
-        critical_count=2,
-        resolved_count=10,
-        lead="External SME",
-        participants=["Mary Womack", "John Smith", "External SME"],
-    ),
-    Review(
-        id="RV002",
-        review_type=ReviewType.RED,
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        status=ReviewStatus.IN_PROGRESS,
-        scheduled_date="2026-01-18",
-        findings_count=8,
-        critical_count=3,
-        resolved_count=2,
-        lead="John Smith",
-        participants=["Mary Womack", "John Smith", "Sarah Davis"],
-    ),
-    Review(
-        id="RV003",
-        review_type=ReviewType.GOLD,
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        status=ReviewStatus.SCHEDULED,
-        scheduled_date="2026-01-25",
-        findings_count=0,
-        critical_count=0,
-        resolved_count=0,
-        lead="Mary Womack",
-    ),
-    Review(
-        id="RV004",
-        review_type=ReviewType.BLUE,
-        deal_id="D002",
-        deal_name="EHRM Restart",
-        status=ReviewStatus.COMPLETED,
-        scheduled_date="2026-01-05",
-        findings_count=5,
-        critical_count=0,
-        resolved_count=5,
-        lead="Sarah Davis",
-    ),
-]
-
-ISSUES_DATA: list[Issue] = [
-    Issue(
-        id="ISS-001",
-        title="Technical approach lacks specificity on AI governance framework",
-        description="Section 3.2 discusses AI capabilities but doesn't address governance, oversight, or ethical considerations required by DHA policy.",
-        severity=IssueSeverity.CRITICAL,
-        status=IssueStatus.OPEN,
-        review_id="RV002",
-        review_type="RED",
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        assignee="Mary Womack",
-        due_date="2026-01-16",
-    ),
-    Issue(
-        id="ISS-002",
-        title="Missing clearance verification for Key Personnel #3",
-        description="Resume for Program Manager does not include clearance level or verification date.",
-        severity=IssueSeverity.MAJOR,
-        status=IssueStatus.IN_PROGRESS,
-        review_id="RV002",
-        review_type="RED",
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        assignee="HR Team",
-        due_date="2026-01-17",
-    ),
-    Issue(
-        id="ISS-003",
-        title="Page count exceeds limit by 2 pages in Vol II",
-        description="Management Volume is 52 pages but limit is 50. Need to trim content.",
-        severity=IssueSeverity.MINOR,
-        status=IssueStatus.RESOLVED,
-        review_id="RV002",
-        review_type="RED",
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        assignee="John Smith",
-        due_date="2026-01-15",
-        resolution="Consolidated sections 4.2 and 4.3, removed redundant org chart",
-    ),
-    Issue(
-        id="ISS-004",
-        title="Win theme not consistently reinforced across volumes",
-        description="Primary win theme 'Seamless Transition' appears in Tech Vol but not in Management or Executive Summary.",
-        severity=IssueSeverity.MAJOR,
-        status=IssueStatus.OPEN,
-        review_id="RV002",
-        review_type="RED",
-        deal_id="D001",
-        deal_name="CCN Next Gen",
-        assignee="Mary Womack",
-        due_date="2026-01-17",
-    ),
-]
-
-PARTNERS_DATA: list[Partner] = [
-    Partner(
-        id="P001",
-        name="TriWest Healthcare",
-        partner_type=PartnerType.MAJOR_SUB,
-        status=PartnerStatus.ACTIVE,
-        deals=["CCN Next Gen"],
-        workshare_pct=35,
-        ta_status=TAStatus.EXECUTED,
-        risk_level="MEDIUM",
-        contact_name="Jane Wilson",
-        contact_email="jane.wilson@triwest.com",
-        capabilities=["Claims Processing", "Provider Network", "Care Coordination"],
-    ),
-    Partner(
-        id="P002",
-        name="Peraton",
-        partner_type=PartnerType.PRIME,
-        status=PartnerStatus.ACTIVE,
-        deals=["PPI MEDIC Zone 2"],
-        workshare_pct=60,
-        ta_status=TAStatus.EXECUTED,
-        risk_level="LOW",
-        contact_name="Mike Johnson",
-        contact_email="mike.johnson@peraton.com",
-        capabilities=["Program Management", "Data Analytics", "Fraud Detection"],
-    ),
-    Partner(
-        id="P003",
-        name="TISTA Science",
-        partner_type=PartnerType.MINOR_SUB,
-        status=PartnerStatus.CONDITIONAL,
-        deals=["IHT 2.0"],
-        workshare_pct=15,
-        ta_status=TAStatus.NEGOTIATING,
-        risk_level="HIGH",
-        contact_name="Robert Chen",
-        contact_email="robert.chen@tistascience.com",
-        capabilities=["Interoperability", "FHIR Implementation", "EHR Integration"],
-        notes="Sized out of SB - need to verify eligibility",
-    ),
-    Partner(
-        id="P004",
-        name="Leidos",
-        partner_type=PartnerType.MAJOR_SUB,
-        status=PartnerStatus.PROSPECTIVE,
-        deals=["DHA Data Governance"],
-        workshare_pct=40,
-        ta_status=TAStatus.NOT_STARTED,
-        risk_level="LOW",
-        contact_name="TBD",
-        capabilities=["Data Governance", "Cloud Infrastructure", "Cybersecurity"],
-    ),
-]
-
-PLAYBOOK_DATA: list[PlaybookLesson] = [
-    PlaybookLesson(
-        id="L001",
-        title="DHA Modernization Win Theme",
-        category=LessonCategory.WIN_THEME,
-        content="""**Win Theme: Seamless Modernization, Zero Disruption**
+# Each seed collection is built on first use and cached, so importing this
+# module doesn't pay for constructing every record. The public *_DATA names
+# are resolved lazily through the module-level __getattr__ below.
+
+@cache
+def _build_deals() -> tuple[Deal, ...]:
+    return (
+        Deal(
+            id="D001",
+            name="CCN Next Gen",
+            customer="DHA/TMA",
+            agency="DHA",
+            value=850_000_000,
+            p_win=75,
+            phase="P3",
+            stage="RED",
+            priority=DealPriority.HIGH,
+            status=DealStatus.ON_TRACK,
+            due_date="2026-03-15",
+            capture_manager="Mary Womack",
+            proposal_manager="John Smith",
+            risk_score=6,
+            description="Next generation Community Care Network contract for TRICARE beneficiaries",
+            solicitation_number="HT9402-25-R-0001",
+            contract_type="IDIQ",
+            set_aside="Full & Open",
+        ),
+        Deal(
+            id="D002",
+            name="EHRM Restart",
+            customer="VA OIT",
+            agency="VA",
+            value=120_000_000,
+            p_win=65,
+            phase="P2",
+            stage="PINK",
+            priority=DealPriority.HIGH,
+            status=DealStatus.AT_RISK,
+            due_date="2026-04-01",
+            capture_manager="John Smith",
+            proposal_manager="Sarah Davis",
+            risk_score=8,
+            description="Electronic Health Record Modernization support services",
+            solicitation_number="36C10B25R0042",
+            contract_type="T&M",
+            set_aside="SDVOSB",
+        ),
+        Deal(
+            id="D003",
+            name="IHT 2.0",
+            customer="VA/IHS",
+            agency="VA",
+            value=45_000_000,
+            p_win=80,
+            phase="P1",
+            stage="BLUE",
+            priority=DealPriority.MEDIUM,
+            status=DealStatus.ON_TRACK,
+            due_date="2026-06-15",
+            capture_manager="Mary Womack",
+            risk_score=3,
+            description="Interoperability & Health Technology modernization",
+            solicitation_number="TBD",
+            contract_type="FFP",
+            set_aside="SDVOSB",
+        ),
+        Deal(
+            id="D004",
+            name="DHA Data Governance",
+            customer="DHA CIO",
+            agency="DHA",
+            value=25_000_000,
+            p_win=60,
+            phase="P0",
+            stage="G1",
+            priority=DealPriority.LOW,
+            status=DealStatus.NEW,
+            due_date="2026-08-01",
+            capture_manager="Sarah Davis",
+            risk_score=5,
+            description="Enterprise data governance and analytics platform",
+            solicitation_number="TBD",
+            contract_type="FFP",
+            set_aside="8(a)",
+        ),
+        Deal(
+            id="D005",
+            name="PPI MEDIC Zone 2",
+            customer="CMS/OIT",
+            agency="CMS",
+            value=180_000_000,
+            p_win=55,
+            phase="P1",
+            stage="CAP",
+            priority=DealPriority.HIGH,
+            status=DealStatus.ON_TRACK,
+            due_date="2026-05-20",
+            capture_manager="Mary Womack",
+            risk_score=7,
+            description="Program & Provider Integrity MEDIC Zone 2 contract",
+            solicitation_number="75FCMC25R0018",
+            contract_type="CPFF",
+            set_aside="Full & Open",
+        ),
+    )
+
+@cache
+def _build_artifacts() -> tuple[Artifact, ...]:
+    return (
+        Artifact(
+            id="A001",
+            name="CCN Technical Volume Draft",
+            artifact_type="Vol I",
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            version="v2.3",
+            status=ArtifactStatus.IN_REVIEW,
+            owner="Mary Womack",
+            last_modified="2026-01-14",
+            size="2.4 MB",
+            compliance_pct=85,
+        ),
+        Artifact(
+            id="A002",
+            name="CCN Compliance Matrix",
+            artifact_type="Matrix",
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            version="v1.8",
+            status=ArtifactStatus.CURRENT,
+            owner="John Smith",
+            last_modified="2026-01-13",
+            size="156 KB",
+            compliance_pct=100,
+        ),
+        Artifact(
+            id="A003",
+            name="EHRM Win Strategy Brief",
+            artifact_type="Strategy",
+            deal_id="D002",
+            deal_name="EHRM Restart",
+            version="v1.0",
+            status=ArtifactStatus.APPROVED,
+            owner="Sarah Davis",
+            last_modified="2026-01-10",
+            size="1.1 MB",
+        ),
+        Artifact(
+            id="A004",
+            name="IHT Teaming Agreement Template",
+            artifact_type="Legal",
+            deal_id="D003",
+            deal_name="IHT 2.0",
+            version="v1.2",
+            status=ArtifactStatus.DRAFT,
+            owner="Legal Team",
+            last_modified="2026-01-12",
+            size="890 KB",
+        ),
+        Artifact(
+            id="A005",
+            name="Past Performance - DHA MIDS",
+            artifact_type="PP",
+            deal_id="MULTI",
+            deal_name="Multiple",
+            version="v3.0",
+            status=ArtifactStatus.APPROVED,
+            owner="Mary Womack",
+            last_modified="2026-01-08",
+            size="3.2 MB",
+        ),
+        Artifact(
+            id="A006",
+            name="CCN Management Volume Draft",
+            artifact_type="Vol II",
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            version="v2.1",
+            status=ArtifactStatus.IN_REVIEW,
+            owner="John Smith",
+            last_modified="2026-01-14",
+            size="1.8 MB",
+            compliance_pct=78,
+        ),
+        Artifact(
+            id="A007",
+            name="CCN Past Performance Volume",
+            artifact_type="Vol III",
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            version="v1.5",
+            status=ArtifactStatus.APPROVED,
+            owner="Mary Womack",
+            last_modified="2026-01-11",
+            size="2.1 MB",
+            compliance_pct=100,
+        ),
+    )
+
+@cache
+def _build_requirements() -> tuple[Requirement, ...]:
+    return (
+        Requirement(
+            id="REQ-001",
+            deal_id="D001",
+            section="L.5.1",
+            text="The Offeror shall demonstrate understanding of DHA healthcare IT environment",
+            req_type=RequirementType.SHALL,
+            status=RequirementStatus.ADDRESSED,
+            volume="Technical",
+            page=12,
+            evidence_count=3,
+            assignee="Mary Womack",
+        ),
+        Requirement(
+            id="REQ-002",
+            deal_id="D001",
+            section="L.5.2",
+            text="Technical approach shall include transition-in plan not exceeding 90 days",
+            req_type=RequirementType.SHALL,
+            status=RequirementStatus.ADDRESSED,
+            volume="Technical",
+            page=24,
+            evidence_count=2,
+            assignee="John Smith",
+        ),
+        Requirement(
+            id="REQ-003",
+            deal_id="D001",
+            section="L.5.3",
+            text="Offeror should describe experience with Cerner/Oracle Health integration",
+            req_type=RequirementType.SHOULD,
+            status=RequirementStatus.PARTIAL,
+            volume="Technical",
+            evidence_count=1,
+            assignee="Sarah Davis",
+        ),
+        Requirement(
+            id="REQ-004",
+            deal_id="D001",
+            section="M.2.1",
+            text="Technical approach will be evaluated for innovation and risk mitigation strategies",
+            req_type=RequirementType.EVAL,
+            status=RequirementStatus.ADDRESSED,
+            volume="Technical",
+            page=8,
+            evidence_count=4,
+            assignee="Mary Womack",
+        ),
+        Requirement(
+            id="REQ-005",
+            deal_id="D001",
+            section="L.6.1",
+            text="Past performance shall include minimum 3 relevant contracts of similar scope",
+            req_type=RequirementType.SHALL,
+            status=RequirementStatus.NOT_STARTED,
+            volume="Past Perf",
+            evidence_count=0,
+            assignee="Mary Womack",
+        ),
+        Requirement(
+            id="REQ-006",
+            deal_id="D001",
+            section="L.7.1",
+            text="Key Personnel resumes shall not exceed 2 pages each",
+            req_type=RequirementType.SHALL,
+            status=RequirementStatus.ADDRESSED,
+            volume="Management",
+            page=15,
+            evidence_count=5,
+            assignee="HR Team",
+        ),
+        Requirement(
+            id="REQ-007",
+            deal_id="D001",
+            section="L.8.1",
+            text="Pricing shall be submitted using provided templates",
+            req_type=RequirementType.SHALL,
+            status=RequirementStatus.PARTIAL,
+            volume="Pricing",
+            evidence_count=1,
+            assignee="Finance Team",
+        ),
+    )
+
+@cache
+def _build_reviews() -> tuple[Review, ...]:
+    return (
+        Review(
+            id="RV001",
+            review_type=ReviewType.PINK,
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            status=ReviewStatus.COMPLETED,
+            scheduled_date="2026-01-10",
+            findings_count=12,
+            critical_count=2,
+            resolved_count=10,
+            lead="External SME",
+            participants=["Mary Womack", "John Smith", "External SME"],
+        ),
+        Review(
+            id="RV002",
+            review_type=ReviewType.RED,
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            status=ReviewStatus.IN_PROGRESS,
+            scheduled_date="2026-01-18",
+            findings_count=8,
+            critical_count=3,
+            resolved_count=2,
+            lead="John Smith",
+            participants=["Mary Womack", "John Smith", "Sarah Davis"],
+        ),
+        Review(
+            id="RV003",
+            review_type=ReviewType.GOLD,
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            status=ReviewStatus.SCHEDULED,
+            scheduled_date="2026-01-25",
+            findings_count=0,
+            critical_count=0,
+            resolved_count=0,
+            lead="Mary Womack",
+        ),
+        Review(
+            id="RV004",
+            review_type=ReviewType.BLUE,
+            deal_id="D002",
+            deal_name="EHRM Restart",
+            status=ReviewStatus.COMPLETED,
+            scheduled_date="2026-01-05",
+            findings_count=5,
+            critical_count=0,
+            resolved_count=5,
+            lead="Sarah Davis",
+        ),
+    )
+
+@cache
+def _build_issues() -> tuple[Issue, ...]:
+    return (
+        Issue(
+            id="ISS-001",
+            title="Technical approach lacks specificity on AI governance framework",
+            description="Section 3.2 discusses AI capabilities but doesn't address governance, oversight, or ethical considerations required by DHA policy.",
+            severity=IssueSeverity.CRITICAL,
+            status=IssueStatus.OPEN,
+            review_id="RV002",
+            review_type="RED",
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            assignee="Mary Womack",
+            due_date="2026-01-16",
+        ),
+        Issue(
+            id="ISS-002",
+            title="Missing clearance verification for Key Personnel #3",
+            description="Resume for Program Manager does not include clearance level or verification date.",
+            severity=IssueSeverity.MAJOR,
+            status=IssueStatus.IN_PROGRESS,
+            review_id="RV002",
+            review_type="RED",
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            assignee="HR Team",
+            due_date="2026-01-17",
+        ),
+        Issue(
+            id="ISS-003",
+            title="Page count exceeds limit by 2 pages in Vol II",
+            description="Management Volume is 52 pages but limit is 50. Need to trim content.",
+            severity=IssueSeverity.MINOR,
+            status=IssueStatus.RESOLVED,
+            review_id="RV002",
+            review_type="RED",
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            assignee="John Smith",
+            due_date="2026-01-15",
+            resolution="Consolidated sections 4.2 and 4.3, removed redundant org chart",
+        ),
+        Issue(
+            id="ISS-004",
+            title="Win theme not consistently reinforced across volumes",
+            description="Primary win theme 'Seamless Transition' appears in Tech Vol but not in Management or Executive Summary.",
+            severity=IssueSeverity.MAJOR,
+            status=IssueStatus.OPEN,
+            review_id="RV002",
+            review_type="RED",
+            deal_id="D001",
+            deal_name="CCN Next Gen",
+            assignee="Mary Womack",
+            due_date="2026-01-17",
+        ),
+    )
+
+@cache
+def _build_partners() -> tuple[Partner, ...]:
+    return (
+        Partner(
+            id="P001",
+            name="TriWest Healthcare",
+            partner_type=PartnerType.MAJOR_SUB,
+            status=PartnerStatus.ACTIVE,
+            deals=["CCN Next Gen"],
+            workshare_pct=35,
+            ta_status=TAStatus.EXECUTED,
+            risk_level="MEDIUM",
+            contact_name="Jane Wilson",
+            contact_email="jane.wilson@triwest.com",
+            capabilities=["Claims Processing", "Provider Network", "Care Coordination"],
+        ),
+        Partner(
+            id="P002",
+            name="Peraton",
+            partner_type=PartnerType.PRIME,
+            status=PartnerStatus.ACTIVE,
+            deals=["PPI MEDIC Zone 2"],
+            workshare_pct=60,
+            ta_status=TAStatus.EXECUTED,
+            risk_level="LOW",
+            contact_name="Mike Johnson",
+            contact_email="mike.johnson@peraton.com",
+            capabilities=["Program Management", "Data Analytics", "Fraud Detection"],
+        ),
+        Partner(
+            id="P003",
+            name="TISTA Science",
+            partner_type=PartnerType.MINOR_SUB,
+            status=PartnerStatus.CONDITIONAL,
+            deals=["IHT 2.0"],
+            workshare_pct=15,
+            ta_status=TAStatus.NEGOTIATING,
+            risk_level="HIGH",
+            contact_name="Robert Chen",
+            contact_email="robert.chen@tistascience.com",
+            capabilities=["Interoperability", "FHIR Implementation", "EHR Integration"],
+            notes="Sized out of SB - need to verify eligibility",
+        ),
+        Partner(
+            id="P004",
+            name="Leidos",
+            partner_type=PartnerType.MAJOR_SUB,
+            status=PartnerStatus.PROSPECTIVE,
+            deals=["DHA Data Governance"],
+            workshare_pct=40,
+            ta_status=TAStatus.NOT_STARTED,
+            risk_level="LOW",
+            contact_name="TBD",
+            capabilities=["Data Governance", "Cloud Infrastructure", "Cybersecurity"],
+        ),
+    )
+
+@cache
+def _build_playbook() -> tuple[PlaybookLesson, ...]:
+    return (
+        PlaybookLesson(
+            id="L001",
+            title="DHA Modernization Win Theme",
+            category=LessonCategory.WIN_THEME,
+            content="""**Win Theme: Seamless Modernization, Zero Disruption**
 
 Feature: Our proven transition methodology reduces deployment risk through parallel operations.
 
@@ -717,18 +755,18 @@ Proof: On [CONTRACT], we migrated 2.3M records with 99.97% accuracy and zero dow
 - Emphasize 'zero disruption' for risk-averse evaluators
 - Include specific metrics from past performance
 - Tie to DHA's stated priority of continuity of care""",
-        rating=5,
-        uses=23,
-        last_used="2026-01-12",
-        source="CCN Original Win",
-        tags=["DHA", "modernization", "transition", "healthcare"],
-        created_by="Mary Womack",
-    ),
-    PlaybookLesson(
-        id="L002",
-        title="VA Interoperability Discriminator",
-        category=LessonCategory.DISCRIMINATOR,
-        content="""**Discriminator: Native FHIR R4 Implementation**
+            rating=5,
+            uses=23,
+            last_used="2026-01-12",
+            source="CCN Original Win",
+            tags=["DHA", "modernization", "transition", "healthcare"],
+            created_by="Mary Womack",
+        ),
+        PlaybookLesson(
+            id="L002",
+            title="VA Interoperability Discriminator",
+            category=LessonCategory.DISCRIMINATOR,
+            content="""**Discriminator: Native FHIR R4 Implementation**
 
 Unlike competitors who bolt on interoperability, our platform was built ground-up on FHIR R4 standards.
 
@@ -741,18 +779,18 @@ Unlike competitors who bolt on interoperability, our platform was built ground-u
 - First vendor certified on VA Lighthouse sandbox (2024)
 - 15 production FHIR integrations across VA, DHA, IHS
 - Zero failed interoperability tests in 3 years""",
-        rating=4,
-        uses=18,
-        last_used="2026-01-10",
-        source="EHRM Win",
-        tags=["VA", "interoperability", "FHIR", "integration"],
-        created_by="John Smith",
-    ),
-    PlaybookLesson(
-        id="L003",
-        title="SDVOSB Compliance Boilerplate",
-        category=LessonCategory.BOILERPLATE,
-        content="""rockITdata is a verified Service-Disabled Veteran-Owned Small Business (SDVOSB) and Woman-Owned Small Business (WOSB), registered in SAM.gov (UEI: [NUMBER]) and verified through the SBA VetCert program.
+            rating=4,
+            uses=18,
+            last_used="2026-01-10",
+            source="EHRM Win",
+            tags=["VA", "interoperability", "FHIR", "integration"],
+            created_by="John Smith",
+        ),
+        PlaybookLesson(
+            id="L003",
+            title="SDVOSB Compliance Boilerplate",
+            category=LessonCategory.BOILERPLATE,
+            content="""rockITdata is a verified Service-Disabled Veteran-Owned Small Business (SDVOSB) and Woman-Owned Small Business (WOSB), registered in SAM.gov (UEI: [NUMBER]) and verified through the SBA VetCert program.
 
 **Set-Aside Compliance:**
 - Primary NAICS: 541512 (Computer Systems Design Services)
@@ -762,18 +800,18 @@ Unlike competitors who bolt on interoperability, our platform was built ground-u
 
 **Subcontracting Approach:**
 For this effort, rockITdata will perform at least [X]% of the work with our own employees, in full compliance with FAR 52.219-14 and 13 CFR 125.6.""",
-        rating=5,
-        uses=45,
-        last_used="2026-01-14",
-        source="Standard Library",
-        tags=["compliance", "SDVOSB", "WOSB", "set-aside", "boilerplate"],
-        created_by="Contracts Team",
-    ),
-    PlaybookLesson(
-        id="L004",
-        title="Key Personnel Resume Format",
-        category=LessonCategory.TEMPLATE,
-        content="""**[NAME], [TITLE]**
+            rating=5,
+            uses=45,
+            last_used="2026-01-14",
+            source="Standard Library",
+            tags=["compliance", "SDVOSB", "WOSB", "set-aside", "boilerplate"],
+            created_by="Contracts Team",
+        ),
+        PlaybookLesson(
+            id="L004",
+            title="Key Personnel Resume Format",
+            category=LessonCategory.TEMPLATE,
+            content="""**[NAME], [TITLE]**
 
 **Qualifications Summary**
 [2-3 sentences highlighting directly relevant experience]
@@ -801,18 +839,18 @@ For this effort, rockITdata will perform at least [X]% of the work with our own
 - Lead with most relevant experience
 - Quantify achievements wherever possible
 - Include clearance date to show currency""",
-        rating=4,
-        uses=31,
-        last_used="2026-01-13",
-        source="Best Practice",
-        tags=["resume", "personnel", "format", "template"],
-        created_by="HR Team",
-    ),
-    PlaybookLesson(
-        id="L005",
-        title="Transition Risk Mitigation Approach",
-        category=LessonCategory.BEST_PRACTICE,
-        content="""**Transition Risk Mitigation Framework**
+            rating=4,
+            uses=31,
+            last_used="2026-01-13",
+            source="Best Practice",
+            tags=["resume", "personnel", "format", "template"],
+            created_by="HR Team",
+        ),
+        PlaybookLesson(
+            id="L005",
+            title="Transition Risk Mitigation Approach",
+            category=LessonCategory.BEST_PRACTICE,
+            content="""**Transition Risk Mitigation Framework**
 
 **Phase 1: Knowledge Transfer (Days 1-30)**
 - Conduct incumbent knowledge transfer sessions
@@ -835,145 +873,271 @@ For this effort, rockITdata will perform at least [X]% of the work with our own
 | Data Loss | Any migration error | Immediate rollback, root cause analysis |
 | Performance | >10% degradation | Scale resources, optimize queries |
 | Staff | Key person departure | Cross-trained backup, knowledge base |""",
-        rating=5,
-        uses=15,
-        last_used="2026-01-11",
-        source="DHA MIDS Lessons Learned",
-        tags=["transition", "risk", "mitigation", "methodology"],
-        created_by="Mary Womack",
-    ),
-]
-
-USERS_DATA: list[User] = [
-    User(
-        id="U001",
-        name="Mary Womack",
-        email="mary.womack@rockitdata.com",
-        role="capture_lead",
-        status="ACTIVE",
-        last_login="2026-01-15 09:23",
-        deals_count=4,
-        avatar_initials="MW",
-    ),
-    User(
-        id="U002",
-        name="John Smith",
-        email="john.smith@rockitdata.com",
-        role="pm",
-        status="ACTIVE",
-        last_login="2026-01-15 08:45",
-        deals_count=2,
-        avatar_initials="JS",
-    ),
-    User(
-        id="U003",
-        name="Sarah Davis",
-        email="sarah.davis@rockitdata.com",
-        role="analyst",
-        status="ACTIVE",
-        last_login="2026-01-14 16:30",
-        deals_count=3,
-        avatar_initials="SD",
-    ),
-    User(
-        id="U004",
-        name="Mike Thompson",
-        email="mike.thompson@rockitdata.com",
-        role="finance",
-        status="ACTIVE",
-        last_login="2026-01-15 07:15",
-        deals_count=5,
-        avatar_initials="MT",
-    ),
-    User(
-        id="U005",
-        name="Lisa Chen",
-        email="lisa.chen@rockitdata.com",
-        role="contracts",
-        status="ACTIVE",
-        last_login="2026-01-14 14:20",
-        deals_count=4,
-        avatar_initials="LC",
-    ),
-    User(
-        id="U006",
-        name="External Partner",
-        email="partner@triwest.com",
-        role="partner",
-        status="ACTIVE",
-        last_login="2026-01-13 11:00",
-        deals_count=1,
-        avatar_initials="EP",
-    ),
-]
+            rating=5,
+            uses=15,
+            last_used="2026-01-11",
+            source="DHA MIDS Lessons Learned",
+            tags=["transition", "risk", "mitigation", "methodology"],
+            created_by="Mary Womack",
+        ),
+    )
+
+@cache
+def _build_users() -> tuple[User, ...]:
+    return (
+        User(
+            id="U001",
+            name="Mary Womack",
+            email="mary.womack@rockitdata.com",
+            role="capture_lead",
+            status="ACTIVE",
+            last_login="2026-01-15 09:23",
+            deals_count=4,
+            avatar_initials="MW",
+        ),
+        User(
+            id="U002",
+            name="John Smith",
+            email="john.smith@rockitdata.com",
+            role="pm",
+            status="ACTIVE",
+            last_login="2026-01-15 08:45",
+            deals_count=2,
+            avatar_initials="JS",
+        ),
+        User(
+            id="U003",
+            name="Sarah Davis",
+            email="sarah.davis@rockitdata.com",
+            role="analyst",
+            status="ACTIVE",
+            last_login="2026-01-14 16:30",
+            deals_count=3,
+            avatar_initials="SD",
+        ),
+        User(
+            id="U004",
+            name="Mike Thompson",
+            email="mike.thompson@rockitdata.com",
+            role="finance",
+            status="ACTIVE",
+            last_login="2026-01-15 07:15",
+            deals_count=5,
+            avatar_initials="MT",
+        ),
+        User(
+            id="U005",
+            name="Lisa Chen",
+            email="lisa.chen@rockitdata.com",
+            role="contracts",
+            status="ACTIVE",
+            last_login="2026-01-14 14:20",
+            deals_count=4,
+            avatar_initials="LC",
+        ),
+        User(
+            id="U006",
+            name="External Partner",
+            email="partner@triwest.com",
+            role="partner",
+            status="ACTIVE",
+            last_login="2026-01-13 11:00",
+            deals_count=1,
+            avatar_initials="EP",
+        ),
+    )
+
+
+# =============================================================================
+# COLUMNAR VIEWS
+# =============================================================================
+# Parallel per-field columns over the deals (structure-of-arrays) so the
+# aggregate stats only walk the fields they need instead of whole Deal rows.
+
+_PHASES: tuple[str, ...] = ("P0", "P1", "P2", "P3", "P4")
+_PHASE_INDEX: dict[str, int] = {p: i for i, p in enumerate(_PHASES)}
+
+# Deal status is stored as a one-byte code; only the stats kernel reads it.
+_DEAL_STATUS_CODE: dict[DealStatus, int] = {s: i for i, s in enumerate(DealStatus)}
+_AT_RISK_CODE: int = _DEAL_STATUS_CODE[DealStatus.AT_RISK]
+
+
+class _DealColumns(NamedTuple):
+    values: tuple[int, ...]
+    weighted: tuple[float, ...]
+    status_code: array
+    phase_idx: array
+
+
+@cache
+def _deal_columns() -> _DealColumns:
+    deals = _build_deals()
+    return _DealColumns(
+        values=tuple(d.value for d in deals),
+        # pWin-weighted value per deal.
+        weighted=tuple(d.value * d.p_win / 100 for d in deals),
+        status_code=array("B", (_DEAL_STATUS_CODE[d.status] for d in deals)),
+        phase_idx=array("b", (_PHASE_INDEX.get(d.phase, -1) for d in deals)),
+    )
+
+
+_LAZY_DATA = {
+    "DEALS_DATA": _build_deals,
+    "ARTIFACTS_DATA": _build_artifacts,
+    "REQUIREMENTS_DATA": _build_requirements,
+    "REVIEWS_DATA": _build_reviews,
+    "ISSUES_DATA": _build_issues,
+    "PARTNERS_DATA": _build_partners,
+    "PLAYBOOK_DATA": _build_playbook,
+    "USERS_DATA": _build_users,
+}
+
+
+def __getattr__(name: str):
+    """Build seed collections on first attribute access (PEP 562)."""
+    builder = _LAZY_DATA.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = builder()
+    globals()[name] = value
+    return value
 
 
 # =============================================================================
 # DATABASE ACCESS FUNCTIONS
 # =============================================================================
+# Collections handed out by these getters are immutable (tuples and
+# MappingProxyType views) so callers can share them without defensive copies.
 
-def get_deals() -> list[Deal]:
+def get_deals() -> tuple[Deal, ...]:
     """Get all deals."""
-    return DEALS_DATA
+    return _build_deals()
 
 
 def get_deal_by_id(deal_id: str) -> Optional[Deal]:
     """Get a deal by ID."""
-    for deal in DEALS_DATA:
+    for deal in _build_deals():
         if deal.id == deal_id:
             return deal
     return None
 
 
-def get_artifacts(deal_id: Optional[str] = None) -> list[Artifact]:
-    """Get artifacts, optionally filtered by deal."""
+_MULTI_DEAL_ID = "MULTI"
+
+
+@cache
+def _multi_artifacts() -> tuple[Artifact, ...]:
+    """Artifacts shared across every deal (deal_id == "MULTI")."""
+    return tuple(a for a in _build_artifacts() if a.deal_id == _MULTI_DEAL_ID)
+
+
+@cache
+def _artifacts_by_deal() -> dict[str, tuple[Artifact, ...]]:
+    """Deal-specific artifacts bucketed by deal_id (shared ones excluded)."""
+    buckets: dict[str, list[Artifact]] = {}
+    for a in _build_artifacts():
+        if a.deal_id != _MULTI_DEAL_ID:
+            buckets.setdefault(a.deal_id, []).append(a)
+    return {deal_id: tuple(bucket) for deal_id, bucket in buckets.items()}
+
+
+def iter_artifacts(deal_id: Optional[str] = None) -> Iterator[Artifact]:
+    """Iterate artifacts, optionally filtered by deal, without building a tuple."""
     if deal_id:
-        return [a for a in ARTIFACTS_DATA if a.deal_id == deal_id or a.deal_id == "MULTI"]
-    return ARTIFACTS_DATA
+        return chain(_artifacts_by_deal().get(deal_id, ()), _multi_artifacts())
+    return iter(_build_artifacts())
+
+
+def get_artifacts(deal_id: Optional[str] = None) -> tuple[Artifact, ...]:
+    """Get artifacts, optionally filtered by deal (shared artifacts listed last)."""
+    if deal_id:
+        return _artifacts_by_deal().get(deal_id, ()) + _multi_artifacts()
+    return _build_artifacts()
+
+
+def iter_requirements(deal_id: str) -> Iterator[Requirement]:
+    """Iterate requirements for a deal without building a tuple."""
+    return (r for r in _build_requirements() if r.deal_id == deal_id)
 
 
-def get_requirements(deal_id: str) -> list[Requirement]:
+def get_requirements(deal_id: str) -> tuple[Requirement, ...]:
     """Get requirements for a deal."""
-    return [r for r in REQUIREMENTS_DATA if r.deal_id == deal_id]
+    return tuple(iter_requirements(deal_id))
 
 
-def get_reviews(deal_id: Optional[str] = None) -> list[Review]:
+def iter_reviews(deal_id: Optional[str] = None) -> Iterator[Review]:
+    """Iterate reviews, optionally filtered by deal, without building a tuple."""
+    if deal_id:
+        return (r for r in _build_reviews() if r.deal_id == deal_id)
+    return iter(_build_reviews())
+
+
+def get_reviews(deal_id: Optional[str] = None) -> tuple[Review, ...]:
     """Get reviews, optionally filtered by deal."""
     if deal_id:
-        return [r for r in REVIEWS_DATA if r.deal_id == deal_id]
-    return REVIEWS_DATA
+        return tuple(iter_reviews(deal_id))
+    return _build_reviews()
+
+
+class _IssueIndex(NamedTuple):
+    by_deal: dict[str, tuple[Issue, ...]]
+    by_status: dict[str, tuple[Issue, ...]]
+    by_deal_status: dict[tuple[str, str], tuple[Issue, ...]]
 
 
-def get_issues(deal_id: Optional[str] = None, status: Optional[str] = None) -> list[Issue]:
+@cache
+def _issue_index() -> _IssueIndex:
+    """Issues bucketed by deal_id, status value, and (deal_id, status) pairs."""
+    by_deal: dict[str, list[Issue]] = {}
+    by_status: dict[str, list[Issue]] = {}
+    by_deal_status: dict[tuple[str, str], list[Issue]] = {}
+    for i in _build_issues():
+        by_deal.setdefault(i.deal_id, []).append(i)
+        by_status.setdefault(i.status.value, []).append(i)
+        by_deal_status.setdefault((i.deal_id, i.status.value), []).append(i)
+    return _IssueIndex(
+        by_deal={k: tuple(v) for k, v in by_deal.items()},
+        by_status={k: tuple(v) for k, v in by_status.items()},
+        by_deal_status={k: tuple(v) for k, v in by_deal_status.items()},
+    )
+
+
+def iter_issues(deal_id: Optional[str] = None, status: Optional[str] = None) -> Iterator[Issue]:
+    """Iterate issues, optionally filtered, without building a tuple."""
+    return iter(get_issues(deal_id, status))
+
+
+def get_issues(deal_id: Optional[str] = None, status: Optional[str] = None) -> tuple[Issue, ...]:
     """Get issues, optionally filtered."""
-    issues = ISSUES_DATA
+    if deal_id and status:
+        return _issue_index().by_deal_status.get((deal_id, status), ())
     if deal_id:
-        issues = [i for i in issues if i.deal_id == deal_id]
+        return _issue_index().by_deal.get(deal_id, ())
     if status:
-        issues = [i for i in issues if i.status.value == status]
-    return issues
+        return _issue_index().by_status.get(status, ())
+    return _build_issues()
 
 
-def get_partners() -> list[Partner]:
+def get_partners() -> tuple[Partner, ...]:
     """Get all partners."""
-    return PARTNERS_DATA
+    return _build_partners()
 
 
-def get_playbook_lessons(category: Optional[str] = None) -> list[PlaybookLesson]:
+def get_playbook_lessons(category: Optional[str] = None) -> tuple[PlaybookLesson, ...]:
     """Get playbook lessons, optionally filtered by category."""
     if category and category != "all":
-        return [l for l in PLAYBOOK_DATA if l.category.value == category]
-    return PLAYBOOK_DATA
+        return tuple(l for l in _build_playbook() if l.category.value == category)
+    return _build_playbook()
 
 
-def get_users() -> list[User]:
+def get_users() -> tuple[User, ...]:
     """Get all users."""
-    return USERS_DATA
+    return _build_users()
 
 
 def get_user_by_email(email: str) -> Optional[User]:
     """Get user by email."""
-    for user in USERS_DATA:
+    for user in _build_users():
         if user.email == email:
             return user
     return None
@@ -983,37 +1147,47 @@ def get_user_by_email(email: str) -> Optional[User]:
 # STATISTICS FUNCTIONS
 # =============================================================================
 
-def get_pipeline_stats() -> dict:
-    """Get pipeline statistics."""
-    deals = DEALS_DATA
-    total_value = sum(d.value for d in deals)
-    weighted_value = sum(d.value * d.p_win / 100 for d in deals)
-    at_risk = len([d for d in deals if d.status == DealStatus.AT_RISK])
+def _pipeline_kernel(values, weighted_values, status_code, phase_idx) -> tuple[int, float, int, list[int]]:
+    """Fused single pass over the deal columns: totals, at-risk and phase counts."""
+    total = 0
+    weighted = 0.0
+    at_risk = 0
+    phase_counts = [0] * len(_PHASES)
+    for i in range(len(values)):
+        total += values[i]
+        weighted += weighted_values[i]
+        at_risk += status_code[i] == _AT_RISK_CODE
+        if phase_idx[i] >= 0:
+            phase_counts[phase_idx[i]] += 1
+    return total, weighted, at_risk, phase_counts
+
+
+def _build_pipeline_stats() -> dict:
+    """Aggregate pipeline statistics from the deal columns."""
+    columns = _deal_columns()
+    total_value, weighted_value, at_risk, phase_counts = _pipeline_kernel(
+        columns.values, columns.weighted, columns.status_code, columns.phase_idx
+    )
     
     return {
-        "total_deals": len(deals),
+        "total_deals": len(columns.values),
         "total_value": total_value,
         "weighted_value": weighted_value,
         "at_risk_count": at_risk,
-        "by_phase": {
-            "P0": len([d for d in deals if d.phase == "P0"]),
-            "P1": len([d for d in deals if d.phase == "P1"]),
-            "P2": len([d for d in deals if d.phase == "P2"]),
-            "P3": len([d for d in deals if d.phase == "P3"]),
-            "P4": len([d for d in deals if d.phase == "P4"]),
-        }
+        "by_phase": dict(zip(_PHASES, phase_counts)),
     }
 
 
-def get_compliance_stats(deal_id: str) -> dict:
-    """Get compliance statistics for a deal."""
+def _build_compliance_stats(deal_id: str) -> dict:
+    """Aggregate compliance statistics for a deal's requirements."""
     reqs = get_requirements(deal_id)
     if not reqs:
         return {"total": 0, "addressed": 0, "partial": 0, "not_started": 0, "coverage_pct": 0}
     
-    addressed = len([r for r in reqs if r.status == RequirementStatus.ADDRESSED])
-    partial = len([r for r in reqs if r.status == RequirementStatus.PARTIAL])
-    not_started = len([r for r in reqs if r.status == RequirementStatus.NOT_STARTED])
+    status_counts = Counter(r.status for r in reqs)
+    addressed = status_counts[RequirementStatus.ADDRESSED]
+    partial = status_counts[RequirementStatus.PARTIAL]
+    not_started = status_counts[RequirementStatus.NOT_STARTED]
     
     return {
         "total": len(reqs),
@@ -1022,3 +1196,35 @@ def get_compliance_stats(deal_id: str) -> dict:
         "not_started": not_started,
         "coverage_pct": round((addressed / len(reqs)) * 100) if reqs else 0,
     }
+
+
+def _freeze_stats(stats: dict) -> MappingProxyType:
+    """Wrap a stats dict (and any nested dicts) in read-only views."""
+    return MappingProxyType({
+        key: _freeze_stats(value) if isinstance(value, dict) else value
+        for key, value in stats.items()
+    })
+
+
+# Seed data is static, so the aggregates are folded once on first use.
+@cache
+def _pipeline_stats() -> MappingProxyType:
+    return _freeze_stats(_build_pipeline_stats())
+
+
+@cache
+def _compliance_stats_by_deal() -> dict[str, MappingProxyType]:
+    return {d.id: _freeze_stats(_build_compliance_stats(d.id)) for d in _build_deals()}
+
+
+def get_pipeline_stats() -> MappingProxyType:
+    """Get pipeline statistics (read-only view)."""
+    return _pipeline_stats()
+
+
+def get_compliance_stats(deal_id: str) -> MappingProxyType:
+    """Get compliance statistics for a deal (read-only view)."""
+    stats = _compliance_stats_by_deal().get(deal_id)
+    if stats is None:
+        return _freeze_stats(_build_compliance_stats(deal_id))
+    return stats
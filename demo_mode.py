@@ -7,10 +7,14 @@ Author: rockITdata LLC
 Version: 2.0.0
 """
 
+import asyncio
+import json
 import time
 import random
-from typing import Generator, Optional
-from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncGenerator, Generator, Optional
+from dataclasses import dataclass, field
+from functools import cache, lru_cache
 
 # =============================================================================
 # DEMO SCENARIOS
@@ -24,286 +28,35 @@ class DemoScenario:
     description: str
     bot_id: str
     interactions: list[dict]
+    # Stripped "user" prompt per interaction, normalised once at load
+    user_prompts: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.user_prompts = tuple(i["user"].strip() for i in self.interactions)
 
 
-DEMO_SCENARIOS: list[DemoScenario] = [
-    DemoScenario(
-        id="win_theme_discovery",
-        name="Win Theme Discovery",
-        description="Develop win themes for CCN Next Gen opportunity",
-        bot_id="capture",
-        interactions=[
-            {
-                "user": "Help me develop 3 compelling win themes for CCN Next Gen.\n\nCustomer: DHA/TMA\nKey Hot Buttons:\n1. Continuity of care for beneficiaries\n2. Provider network stability\n\nOur Strengths:\n1. 15 years DHA healthcare IT experience\n2. Existing provider relationships",
-                "assistant": """## Win Theme Analysis for CCN Next Gen
-
-Based on DHA/TMA's priorities and your strengths, I recommend these three win themes:
-
----
-
-### 🏆 Win Theme 1: Seamless Continuity, Zero Disruption
-
-**Feature:** Our battle-tested transition methodology, refined across 12 DHA programs, ensures parallel operations throughout migration.
-
-**Benefit:** Beneficiaries experience uninterrupted access to care while DHA achieves modernization goals on schedule.
-
-**Proof Point:** On the DHA MIDS contract, we migrated 2.3M patient records with 99.97% accuracy and zero service disruption, completing 30 days ahead of schedule.
-
-*Evaluator Impact: Directly addresses their #1 hot button—continuity of care.*
-
----
-
-### 🏆 Win Theme 2: Provider Network Excellence Through Relationship
-
-**Feature:** Our team includes 8 staff with established relationships across the TRICARE provider network, including 3 former regional liaisons.
-
-**Benefit:** DHA gains immediate access to provider insights and accelerated network optimization without the typical 6-12 month relationship-building period.
-
-**Proof Point:** Our Provider Relations team achieved 94% provider satisfaction scores on CCN T-West, 12 points above the contract baseline.
-
-*Evaluator Impact: Addresses network stability concern with quantified proof.*
-
----
-
-### 🏆 Win Theme 3: Predictive Intelligence for Proactive Care
-
-**Feature:** Our AI-powered analytics platform identifies care gaps 45 days earlier than traditional methods.
-
-**Benefit:** DHA shifts from reactive to proactive beneficiary management, improving health outcomes while reducing emergency utilization costs.
-
-**Proof Point:** Pilot deployment at Naval Medical Center San Diego reduced ER visits by 23% for high-risk beneficiaries.
-
-*Evaluator Impact: Differentiates from competitors stuck in legacy approaches.*
-
----
-
-### Recommended Integration Strategy
-
-| Volume | Theme 1 | Theme 2 | Theme 3 |
-|--------|---------|---------|---------|
-| Executive Summary | Lead | Support | Support |
-| Technical | Support | Lead | Lead |
-| Management | Lead | Support | - |
-| Past Performance | Proof | Proof | Proof |
-
-Would you like me to develop ghost competitor profiles to stress-test these themes?"""
-            },
-            {
-                "user": "Yes, create ghost profiles for TriWest and Optum as likely competitors.",
-                "assistant": """## Ghost Competitor Analysis: CCN Next Gen
-
-### 👻 Ghost Profile: TriWest Healthcare Alliance
-
-**Likely Positioning:** "Incumbent Expertise & Network Depth"
-
-**Probable Win Themes:**
-1. **Network Continuity** - "Our established provider network ensures zero disruption"
-2. **Institutional Knowledge** - "10+ years operating CCN regions means we know what works"
-3. **Beneficiary Familiarity** - "Beneficiaries trust the TriWest name"
-
-**Anticipated Weaknesses:**
-| Weakness | Our Counter |
-|----------|-------------|
-| Recent OIG findings on claims processing accuracy | Emphasize our 99.97% accuracy rate and automated QA |
-| Static technology platform (legacy systems) | Highlight our AI/ML capabilities and modern architecture |
-| Provider satisfaction trending down (88% → 82%) | Lead with our 94% provider satisfaction proof point |
-| Resistance to change/innovation | Position our "modernization without disruption" approach |
-
-**Ghost Pricing:** Likely to bid aggressive on price to defend incumbent position. Estimate 8-12% below historical rates.
-
----
-
-### 👻 Ghost Profile: Optum/UnitedHealth
-
-**Likely Positioning:** "Commercial Scale Meets Federal Mission"
-
-**Probable Win Themes:**
-1. **Data Analytics Leadership** - "Largest healthcare data set in the nation powers predictive insights"
-2. **Financial Strength** - "Resources to invest in continuous improvement"
-3. **End-to-End Integration** - "Single platform for all care coordination needs"
-
-**Anticipated Weaknesses:**
-| Weakness | Our Counter |
-|----------|-------------|
-| Limited federal healthcare experience (mostly commercial) | Emphasize 15 years of DHA-specific experience |
-| "Big company" responsiveness concerns | Highlight our SDVOSB agility and dedicated team |
-| Recent DOJ investigation into Medicare practices | Position our clean compliance record |
-| History of provider payment disputes | Lead with provider relationship proof points |
-
-**Ghost Pricing:** Will likely bid at or slightly above market—relying on brand strength rather than price competition.
-
----
-
-### 🎯 Competitive Counter-Strategy
-
-**Against TriWest (Incumbent Defense):**
-- Don't attack directly—evaluators may have relationships
-- Focus on "building on success" language while introducing innovation
-- Emphasize transition risk mitigation to address switching concerns
-
-**Against Optum (New Entrant):**
-- Highlight federal healthcare complexity they'll underestimate
-- Question whether commercial approaches translate to TRICARE
-- Emphasize relationship depth vs. their resource depth
-
-**Differentiator Priority:**
-1. **AI-powered proactive care** (neither competitor has this)
-2. **Transition without disruption** (TriWest can't claim, Optum can't prove)
-3. **Provider relationship depth** (our unique asset)
-
-Would you like me to draft specific ghosting language for your technical volume?"""
-            },
-        ]
-    ),
-    DemoScenario(
-        id="rfp_shredding",
-        name="RFP Shredding",
-        description="Extract requirements from sample PWS",
-        bot_id="compliance",
-        interactions=[
-            {
-                "user": "Shred this PWS excerpt and create a requirements matrix:\n\nThe contractor shall provide healthcare IT support services for the Defense Health Agency. The contractor shall maintain a minimum of 95% system uptime. The contractor should implement continuous monitoring capabilities. Technical approach will be evaluated for innovation. Past performance may include commercial contracts if federal experience is limited.",
-                "assistant": """## RFP Shred Analysis
-
-### Requirements Matrix
-
-| ID | Section | Requirement Text | Type | Priority | Volume | Notes |
-|----|---------|-----------------|------|----------|--------|-------|
-| REQ-001 | PWS | Provide healthcare IT support services for DHA | SHALL | 🔴 Critical | Technical | Core scope - must address comprehensively |
-| REQ-002 | PWS | Maintain minimum 95% system uptime | SHALL | 🔴 Critical | Technical | Quantified metric - need proof points |
-| REQ-003 | PWS | Implement continuous monitoring capabilities | SHOULD | 🟡 Major | Technical | Not mandatory but expected |
-| REQ-004 | Eval | Technical approach evaluated for innovation | EVAL | 🔴 Critical | Technical | Discriminator opportunity |
-| REQ-005 | PWS | Past performance may include commercial contracts | MAY | 🟢 Minor | Past Perf | Flexibility for teaming partners |
-
----
-
-### 📊 Analysis Summary
-
-**SHALL Statements (Mandatory):** 2
-- REQ-001: Healthcare IT support services
-- REQ-002: 95% uptime SLA
-
-**SHOULD Statements (Expected):** 1
-- REQ-003: Continuous monitoring
-
-**EVALUATION Criteria:** 1
-- REQ-004: Innovation in technical approach
-
-**MAY Statements (Optional):** 1
-- REQ-005: Commercial PP acceptable
-
----
-
-### ⚠️ Risk Flags
-
-| Risk | Description | Mitigation |
-|------|-------------|------------|
-| 🔴 **Uptime SLA** | 95% is aggressive for healthcare systems | Document our historical 99.2% uptime; include redundancy architecture |
-| 🟡 **Innovation Eval** | Subjective criteria—need clear differentiators | Lead with AI/ML capabilities not in incumbent solution |
-| 🟡 **Continuous Monitoring** | "Should" often treated as "shall" in evaluation | Include comprehensive monitoring approach regardless |
-
----
-
-### 📝 Compliance Matrix Starter
-
-| Requirement | Response Location | Responsible | Status |
-|-------------|-------------------|-------------|--------|
-| REQ-001 | Tech Vol §2.1 | Mary W. | Not Started |
-| REQ-002 | Tech Vol §3.4 | John S. | Not Started |
-| REQ-003 | Tech Vol §3.5 | John S. | Not Started |
-| REQ-004 | Tech Vol §2.0 | Mary W. | Not Started |
-| REQ-005 | PP Vol §1.0 | Sarah D. | Not Started |
-
----
-
-### 🎯 Next Steps
-
-1. **Import full PWS** for complete shred
-2. **Cross-reference Section M** for evaluation weights
-3. **Assign section owners** to each requirement
-4. **Begin drafting** high-priority SHALL responses first
-
-Would you like me to create Section L compliance checklist for format requirements?"""
-            },
-        ]
-    ),
-    DemoScenario(
-        id="compliance_check",
-        name="Compliance Review",
-        description="Check draft against requirements",
-        bot_id="compliance",
-        interactions=[
-            {
-                "user": "Review this draft against Section L requirement:\n\nRequirement: The Offeror shall describe their approach to maintaining 99% system availability.\n\nDraft: Our team has extensive experience maintaining high-availability systems. We use industry best practices and modern monitoring tools to ensure systems remain operational.",
-                "assistant": """## Compliance Review Results
-
-### Overall Assessment: 🟡 NEEDS WORK
-
----
-
-### 🔴 CRITICAL Issues (Must Fix)
-
-**1. Missing Quantified Commitment**
-- **Requirement:** "99% system availability"
-- **Your Draft:** "high-availability" (vague)
-- **Fix:** State explicitly: "rockITdata commits to maintaining 99% system availability, measured monthly against the following SLA framework..."
-
-**2. No Proof Points**
-- **Requirement:** Asks for "approach" (implies methodology)
-- **Your Draft:** Generic claims without evidence
-- **Fix:** Add specific example: "On the DHA MIDS contract, we achieved 99.7% availability over 36 months, exceeding the 99% requirement by 0.7%."
-
----
-
-### 🟡 MAJOR Issues (Should Fix)
-
-**3. Vague Methodology**
-- **Problem:** "Industry best practices" is meaningless to evaluators
-- **Fix:** Name specific practices: "Our availability approach includes N+1 redundancy, automated failover within 30 seconds, and 24/7 NOC monitoring with 15-minute response SLA."
-
-**4. Missing Monitoring Specifics**
-- **Problem:** "Modern monitoring tools" lacks credibility
-- **Fix:** Name tools: "We deploy Datadog for APM, PagerDuty for incident management, and custom dashboards for real-time SLA tracking."
-
----
-
-### ✅ Compliant Elements
-
-- ✓ Addresses the topic (system availability)
-- ✓ Mentions experience (needs quantification)
-- ✓ References monitoring (needs specifics)
-
----
+# Scenario prose lives in demo_scenarios.json next to this module and is only
+# read the first time demo mode needs it.
+_SCENARIOS_PATH = Path(__file__).with_name("demo_scenarios.json")
 
-### 📝 Recommended Rewrite
 
-> **System Availability Approach**
->
-> rockITdata commits to maintaining **99% system availability**, measured monthly in accordance with [CONTRACT] SLA requirements. Our proven availability methodology includes:
->
-> **Redundancy Architecture:** All critical components deployed in N+1 configuration with automated failover completing within 30 seconds.
->
-> **Proactive Monitoring:** 24/7 Network Operations Center using Datadog APM and custom health dashboards, with 15-minute response SLA for P1 incidents.
->
-> **Proof of Performance:** On the DHA MIDS contract (2021-2024), rockITdata achieved **99.7% availability** over 36 months, exceeding the contractual 99% requirement while supporting 2.3M beneficiaries.
+@cache
+def get_scenarios() -> list[DemoScenario]:
+    """Load the demo scenarios (cached after the first call)."""
+    raw = json.loads(_SCENARIOS_PATH.read_text(encoding="utf-8"))
+    return [DemoScenario(**entry) for entry in raw]
 
----
 
-### Compliance Checklist
+@cache
+def _scenarios_by_id() -> dict[str, DemoScenario]:
+    return {s.id: s for s in get_scenarios()}
 
-| Item | Status | Notes |
-|------|--------|-------|
-| Addresses requirement explicitly | 🔴 Missing | Add "99%" commitment |
-| Provides methodology | 🟡 Weak | Add specific practices |
-| Includes proof points | 🔴 Missing | Add past performance data |
-| Uses active voice | ✅ Good | - |
-| Quantifies claims | 🔴 Missing | Add metrics throughout |
 
-Would you like me to review additional sections?"""
-            },
-        ]
-    ),
-]
+def __getattr__(name: str):
+    """Keep DEMO_SCENARIOS importable while loading it lazily (PEP 562)."""
+    if name == "DEMO_SCENARIOS":
+        return get_scenarios()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
@@ -473,17 +226,27 @@ Is there a specific aspect you'd like me to dive deeper into? I can also point y
 # DEMO ENGINE
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def _tokenize(text: str) -> tuple[str, ...]:
+    """Split a canned response into words once; the response texts are static."""
+    return tuple(text.split(' '))
+
+
 class DemoEngine:
     """Engine for running demo scenarios with simulated responses."""
     
-    def __init__(self):
+    def __init__(self, chunk_words: int = 16, delay_s: float = 0.0):
         self.active_scenario: Optional[DemoScenario] = None
         self.interaction_index: int = 0
         self.demo_mode_enabled: bool = False
+        # Streaming is simulated in bursts of words; pacing is opt-in.
+        self.chunk_words: int = max(1, chunk_words)
+        self.delay_s: float = delay_s
     
     def enable_demo_mode(self) -> None:
-        """Enable demo mode."""
+        """Enable demo mode and load the scenarios."""
         self.demo_mode_enabled = True
+        get_scenarios()
     
     def disable_demo_mode(self) -> None:
         """Disable demo mode."""
@@ -497,16 +260,17 @@ class DemoEngine:
     
     def get_scenarios(self) -> list[DemoScenario]:
         """Get all available demo scenarios."""
-        return DEMO_SCENARIOS
+        return get_scenarios()
     
     def start_scenario(self, scenario_id: str) -> Optional[dict]:
         """Start a demo scenario and return first interaction."""
-        for scenario in DEMO_SCENARIOS:
-            if scenario.id == scenario_id:
-                self.active_scenario = scenario
-                self.interaction_index = 0
-                if scenario.interactions:
-                    return scenario.interactions[0]
+        scenario = _scenarios_by_id().get(scenario_id)
+        if scenario is None:
+            return None
+        self.active_scenario = scenario
+        self.interaction_index = 0
+        if scenario.interactions:
+            return scenario.interactions[0]
         return None
     
     def get_next_interaction(self) -> Optional[dict]:
@@ -522,31 +286,45 @@ class DemoEngine:
     def get_demo_response(self, user_message: str, bot_id: str) -> Generator[str, None, None]:
         """
         Get a simulated response for demo mode.
-        Yields characters to simulate streaming.
+        Yields chunks of words to simulate streaming.
         """
+        yield from self._simulate_streaming(self._select_response(user_message, bot_id))
+    
+    async def get_demo_response_async(self, user_message: str, bot_id: str) -> AsyncGenerator[str, None]:
+        """
+        Async variant of get_demo_response.
+        Pacing (delay_s) awaits on the event loop instead of blocking a thread.
+        """
+        for chunk in self._iter_chunks(self._select_response(user_message, bot_id)):
+            yield chunk
+            if self.delay_s:
+                await asyncio.sleep(self.delay_s)
+    
+    def _select_response(self, user_message: str, bot_id: str) -> str:
+        """Pick the scripted scenario reply if the message matches, else a canned one."""
         # Check if we're in an active scenario with matching message
         if self.active_scenario and self.interaction_index < len(self.active_scenario.interactions):
-            interaction = self.active_scenario.interactions[self.interaction_index]
-            if user_message.strip() == interaction["user"].strip():
-                response = interaction["assistant"]
-                yield from self._simulate_streaming(response)
-                return
+            if user_message.strip() == self.active_scenario.user_prompts[self.interaction_index]:
+                return self.active_scenario.interactions[self.interaction_index]["assistant"]
         
         # Fall back to canned responses
         bot_responses = CANNED_RESPONSES.get(bot_id, CANNED_RESPONSES["general"])
-        response = bot_responses.get("default", CANNED_RESPONSES["general"]["default"])
-        
-        yield from self._simulate_streaming(response)
+        return bot_responses.get("default", CANNED_RESPONSES["general"]["default"])
+    
+    def _iter_chunks(self, text: str) -> Generator[str, None, None]:
+        """Split text into chunk_words-sized bursts that join back to the original."""
+        words = _tokenize(text)
+        step = self.chunk_words
+        for i in range(0, len(words), step):
+            chunk = ' '.join(words[i:i + step])
+            yield chunk if i + step >= len(words) else chunk + ' '
     
     def _simulate_streaming(self, text: str) -> Generator[str, None, None]:
-        """Simulate streaming by yielding characters with delays."""
-        words = text.split(' ')
-        for i, word in enumerate(words):
-            yield word
-            if i < len(words) - 1:
-                yield ' '
-            # Small delay to simulate streaming (handled by caller)
-            time.sleep(0.02)
+        """Simulate streaming by yielding word bursts, optionally paced by delay_s."""
+        for chunk in self._iter_chunks(text):
+            yield chunk
+            if self.delay_s:
+                time.sleep(self.delay_s)
 
 
 # Global demo engine instance
@@ -13,17 +13,31 @@ import json
 import hmac
 import hashlib
 import logging
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field, asdict
-from typing import Optional, List, Dict, Any, Callable
+import sys
+import random
+import statistics
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Callable, Iterator
 from enum import Enum
+from types import MappingProxyType
 import threading
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON (de)serialization
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,16 +55,61 @@ class HubSpotConfig:
     # Rate limiting: 100 requests per 10 seconds
     RATE_LIMIT_REQUESTS = 100
     RATE_LIMIT_WINDOW = 10  # seconds
+    # Client-side budget kept below the quota so clock/latency skew between
+    # our window and HubSpot's doesn't tip requests into 429s
+    RATE_LIMIT_BUDGET = 90
+    
+    # Refresh OAuth tokens this many seconds before they expire
+    TOKEN_REFRESH_MARGIN = 60
     
-    # Retry configuration
-    MAX_RETRIES = 3
+    # Retry configuration (backoff doubles per attempt, reaching ~8s by the last)
+    MAX_RETRIES = 5
     RETRY_BACKOFF = 0.5
     
+    # Batch endpoints accept at most 100 inputs per call
+    BATCH_SIZE = 100
+    
+    # Concurrent in-flight requests for multi-batch operations
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    # Deal payloads kept for ETag revalidation in get_deal
+    DEAL_CACHE_SIZE = 10000
+    
+    # Keep-alive connections held open per host; sized above
+    # MAX_CONCURRENT_REQUESTS so parallel batches never re-handshake
+    CONNECTION_POOL_SIZE = 32
+    
+    # Error messages kept per SyncResult; further errors are only counted
+    MAX_SYNC_ERRORS = 100
+    
+    # How long a connection check result is reused by status widgets
+    STATUS_CACHE_TTL = 60  # seconds
+    
+    # Recent requests kept for latency stats, and the per-app daily API cap
+    REQUEST_LOG_SIZE = 200
+    DAILY_REQUEST_LIMIT = 500_000
+    
+    # Webhook receiver: path served, largest accepted body, deals kept
+    WEBHOOK_PATH = "/api/hubspot/webhook"
+    WEBHOOK_MAX_BODY = 1_048_576  # bytes
+    DEAL_STORE_SIZE = 10000
+    
     # Custom property group
     AMANDA_PROPERTY_GROUP = "amanda_portal"
 
 
-class HubSpotStage(Enum):
+# Endpoint paths, resolved once against the configured API version
+_DEALS_URL = f"crm/{HubSpotConfig.API_VERSION}/objects/deals"
+_DEAL_URL_FMT = _DEALS_URL + "/{}"
+_DEALS_SEARCH_URL = _DEALS_URL + "/search"
+_BATCH_READ_URL = _DEALS_URL + "/batch/read"
+_BATCH_UPDATE_URL = _DEALS_URL + "/batch/update"
+_BATCH_CREATE_URL = _DEALS_URL + "/batch/create"
+_DEAL_PROPERTIES_URL = f"crm/{HubSpotConfig.API_VERSION}/properties/deals"
+_DEAL_PROPERTY_GROUPS_URL = _DEAL_PROPERTIES_URL + "/groups"
+
+
+class HubSpotStage(str, Enum):
     """HubSpot deal stages mapped to AMANDA phases."""
     APPOINTMENT_SCHEDULED = "appointmentscheduled"
     QUALIFIED_TO_BUY = "qualifiedtobuy"
@@ -61,7 +120,7 @@ class HubSpotStage(Enum):
     CLOSED_LOST = "closedlost"
 
 
-class AmandaPhase(Enum):
+class AmandaPhase(str, Enum):
     """AMANDA proposal phases."""
     QUALIFICATION = "qualification"
     GATE_1 = "gate_1"
@@ -73,7 +132,7 @@ class AmandaPhase(Enum):
 
 
 # Stage mapping: HubSpot → AMANDA
-STAGE_MAPPING = {
+STAGE_MAPPING = MappingProxyType({
     HubSpotStage.APPOINTMENT_SCHEDULED: AmandaPhase.QUALIFICATION,
     HubSpotStage.QUALIFIED_TO_BUY: AmandaPhase.GATE_1,
     HubSpotStage.PRESENTATION_SCHEDULED: AmandaPhase.CAPTURE,
@@ -81,17 +140,81 @@ STAGE_MAPPING = {
     HubSpotStage.CONTRACT_SENT: AmandaPhase.REVIEW,
     HubSpotStage.CLOSED_WON: AmandaPhase.SUBMITTED,
     HubSpotStage.CLOSED_LOST: AmandaPhase.ARCHIVED,
-}
+})
 
 # Reverse mapping: AMANDA → HubSpot
-REVERSE_STAGE_MAPPING = {v: k for k, v in STAGE_MAPPING.items()}
+REVERSE_STAGE_MAPPING = MappingProxyType({v: k for k, v in STAGE_MAPPING.items()})
+
+# Terminal stages and the sync callback each fires; anything else is "deal_updated"
+_WON_STAGE = HubSpotStage.CLOSED_WON.value
+_LOST_STAGE = HubSpotStage.CLOSED_LOST.value
+_TERMINAL_STAGE_CALLBACKS = MappingProxyType({
+    _WON_STAGE: "deal_won",
+    _LOST_STAGE: "deal_lost",
+})
 
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+# HubSpot property -> (HubSpotDeal attribute, send as string?), in API order.
+_DEAL_PROPERTY_FIELDS: tuple[tuple[str, str, bool], ...] = (
+    ("dealname", "name", False),
+    ("amount", "amount", True),
+    ("dealstage", "stage", False),
+    ("closedate", "close_date", False),
+    ("pipeline", "pipeline", False),
+    ("hubspot_owner_id", "owner_id", False),
+    # AMANDA custom properties
+    ("amanda_pwin", "amanda_pwin", True),
+    ("amanda_gate_status", "amanda_gate_status", False),
+    ("amanda_phase", "amanda_phase", False),
+    ("amanda_compliance_coverage", "amanda_compliance_coverage", True),
+    ("amanda_solicitation_number", "amanda_solicitation_number", False),
+    ("amanda_agency", "amanda_agency", False),
+    ("amanda_priority_tier", "amanda_priority_tier", False),
+    ("amanda_contract_vehicle", "amanda_contract_vehicle", False),
+)
+
+
+def _compile_property_serializer(fields: tuple[tuple[str, str, bool], ...]) -> Callable:
+    """
+    Generate a serializer that builds the HubSpot properties dict as a
+    single dict literal, so the field layout is resolved once at import.
+    """
+    items = ", ".join(
+        f"{prop!r}: str(deal.{attr})" if as_str else f"{prop!r}: deal.{attr}"
+        for prop, attr, as_str in fields
+    )
+    return eval(f"lambda deal: {{{items}}}", {"str": str})
+
+
+_serialize_hubspot_properties = _compile_property_serializer(_DEAL_PROPERTY_FIELDS)
+
+# Property names requested on every deal read, shared by all fetchers
+_HUBSPOT_PROPERTY_NAMES: tuple[str, ...] = tuple(prop for prop, _, _ in _DEAL_PROPERTY_FIELDS)
+_HUBSPOT_PROPERTIES_PARAM = ",".join(_HUBSPOT_PROPERTY_NAMES)
+
+# Low-cardinality property values (stages, phases, gate statuses, priority
+# tiers) mapped to one interned copy each, so parsed deals share them.
+_CANONICAL_VALUES: Dict[str, str] = {
+    value: sys.intern(value)
+    for value in (
+        *(stage.value for stage in HubSpotStage),
+        *(phase.value for phase in AmandaPhase),
+        "PENDING", "GO", "CONDITIONAL_GO", "PAUSE", "NO_GO",
+        "P-0", "P-1", "P-2",
+    )
+}
+
+
+def _canonical(value: Optional[str]) -> Optional[str]:
+    """Return the shared interned copy of a known property value."""
+    return _CANONICAL_VALUES.get(value, value)
+
+
+@dataclass(slots=True)
 class HubSpotDeal:
     """Represents a HubSpot deal with AMANDA custom properties."""
     id: Optional[str] = None
@@ -122,23 +245,7 @@ class HubSpotDeal:
     
     def to_hubspot_properties(self) -> Dict[str, Any]:
         """Convert to HubSpot API format for create/update."""
-        return {
-            "dealname": self.name,
-            "amount": str(self.amount),
-            "dealstage": self.stage,
-            "closedate": self.close_date,
-            "pipeline": self.pipeline,
-            "hubspot_owner_id": self.owner_id,
-            # AMANDA custom properties
-            "amanda_pwin": str(self.amanda_pwin),
-            "amanda_gate_status": self.amanda_gate_status,
-            "amanda_phase": self.amanda_phase,
-            "amanda_compliance_coverage": str(self.amanda_compliance_coverage),
-            "amanda_solicitation_number": self.amanda_solicitation_number,
-            "amanda_agency": self.amanda_agency,
-            "amanda_priority_tier": self.amanda_priority_tier,
-            "amanda_contract_vehicle": self.amanda_contract_vehicle,
-        }
+        return _serialize_hubspot_properties(self)
     
     @classmethod
     def from_hubspot_response(cls, data: Dict[str, Any]) -> "HubSpotDeal":
@@ -148,7 +255,7 @@ class HubSpotDeal:
             id=data.get("id"),
             name=props.get("dealname", ""),
             amount=float(props.get("amount", 0) or 0),
-            stage=props.get("dealstage", ""),
+            stage=_canonical(props.get("dealstage", "")),
             close_date=props.get("closedate"),
             pipeline=props.get("pipeline", "default"),
             owner_id=props.get("hubspot_owner_id"),
@@ -156,17 +263,22 @@ class HubSpotDeal:
             updated_at=data.get("updatedAt"),
             # AMANDA properties (with defaults for missing)
             amanda_pwin=float(props.get("amanda_pwin", 0) or 0),
-            amanda_gate_status=props.get("amanda_gate_status", "PENDING"),
-            amanda_phase=props.get("amanda_phase", "qualification"),
+            amanda_gate_status=_canonical(props.get("amanda_gate_status", "PENDING")),
+            amanda_phase=_canonical(props.get("amanda_phase", "qualification")),
             amanda_compliance_coverage=float(props.get("amanda_compliance_coverage", 0) or 0),
             amanda_solicitation_number=props.get("amanda_solicitation_number", ""),
             amanda_agency=props.get("amanda_agency", ""),
-            amanda_priority_tier=props.get("amanda_priority_tier", "P-2"),
+            amanda_priority_tier=_canonical(props.get("amanda_priority_tier", "P-2")),
             amanda_contract_vehicle=props.get("amanda_contract_vehicle", ""),
         )
 
 
-@dataclass
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string (second precision)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime())
+
+
+@dataclass(slots=True)
 class SyncResult:
     """Result of a sync operation."""
     success: bool
@@ -175,10 +287,18 @@ class SyncResult:
     deals_updated: int = 0
     deals_failed: int = 0
     errors: List[str] = field(default_factory=list)
-    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    errors_truncated: int = 0
+    timestamp: str = field(default_factory=_utc_timestamp)
+    
+    def add_error(self, message: str) -> None:
+        """Record an error, counting rather than storing past MAX_SYNC_ERRORS."""
+        if len(self.errors) < HubSpotConfig.MAX_SYNC_ERRORS:
+            self.errors.append(message)
+        else:
+            self.errors_truncated += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookEvent:
     """Parsed HubSpot webhook event."""
     event_id: str
@@ -190,24 +310,57 @@ class WebhookEvent:
     portal_id: Optional[str] = None
 
 
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+# Bind the codec once at import so the request path pays no per-call branch
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize a request body to UTF-8 JSON bytes."""
+        return json.dumps(obj).encode()
+    
+    _json_loads = json.loads
+
+
+def _chunked(items, size: int):
+    """Yield successive lists of at most `size` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
 # =============================================================================
 # RATE LIMITER
 # =============================================================================
 
 class RateLimiter:
     """
-    Thread-safe rate limiter for HubSpot API.
-    Allows 100 requests per 10 seconds.
+    Thread-safe sliding-window rate limiter for HubSpot API.
+    Counts every request in the trailing window (not fixed buckets), so
+    there is no double burst at window boundaries. Defaults to 90 requests
+    per 10 seconds, just under HubSpot's 100/10s quota.
     """
     
     def __init__(
         self,
-        max_requests: int = HubSpotConfig.RATE_LIMIT_REQUESTS,
+        max_requests: int = HubSpotConfig.RATE_LIMIT_BUDGET,
         window_seconds: int = HubSpotConfig.RATE_LIMIT_WINDOW
     ):
+        # The ring buffer is indexed modulo max_requests
+        if max_requests < 1:
+            raise ValueError(f"max_requests must be at least 1, got {max_requests}")
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests: List[float] = []
+        # Request timestamps (monotonic microseconds) in a fixed-size ring
+        # buffer: _head is the oldest live entry, _count the live entries.
+        self._window_us = int(window_seconds * 1_000_000)
+        self._buf = array("q", [0] * max_requests)
+        self._head = 0
+        self._count = 0
         self._lock = threading.Lock()
     
     def acquire(self) -> float:
@@ -216,37 +369,100 @@ class RateLimiter:
         Returns wait time in seconds (0 if no wait needed).
         """
         with self._lock:
-            now = time.time()
-            
-            # Remove expired timestamps
-            cutoff = now - self.window_seconds
-            self.requests = [t for t in self.requests if t > cutoff]
+            now = time.monotonic_ns() // 1000
+            buf = self._buf
+            size = self.max_requests
+            self._expire_locked(now)
             
-            if len(self.requests) >= self.max_requests:
+            if self._count >= size:
                 # Calculate wait time
-                oldest = self.requests[0]
-                wait_time = oldest + self.window_seconds - now
-                return max(0, wait_time)
+                wait_us = buf[self._head] + self._window_us - now
+                return max(0, wait_us / 1_000_000)
             
             # Record this request
-            self.requests.append(now)
+            buf[(self._head + self._count) % size] = now
+            self._count += 1
             return 0
     
+    def _expire_locked(self, now: int) -> None:
+        """Drop timestamps that have left the window; caller holds _lock."""
+        buf = self._buf
+        size = self.max_requests
+        cutoff = now - self._window_us
+        while self._count and buf[self._head] <= cutoff:
+            self._head = (self._head + 1) % size
+            self._count -= 1
+    
+    def remaining(self) -> int:
+        """Requests that can be made right now without waiting."""
+        with self._lock:
+            self._expire_locked(time.monotonic_ns() // 1000)
+            return self.max_requests - self._count
+    
     def wait_and_acquire(self) -> None:
-        """Wait if necessary, then acquire permission."""
-        wait_time = self.acquire()
-        if wait_time > 0:
+        """
+        Wait until a slot is free and record the request in it. Loops,
+        since concurrent callers may claim the slot while this one sleeps.
+        """
+        while (wait_time := self.acquire()) > 0:
             logger.info(f"Rate limit: waiting {wait_time:.2f}s")
             time.sleep(wait_time)
-            self.acquire()
+    
+    def observe_usage(self, used: int) -> None:
+        """
+        Reconcile with the server's count of requests used in its window.
+        If HubSpot has seen more requests than we recorded (other workers
+        or processes sharing the app's quota), pad the window with
+        now-stamped entries so we back off accordingly.
+        """
+        with self._lock:
+            now = time.monotonic_ns() // 1000
+            size = self.max_requests
+            target = min(used, size)
+            while self._count < target:
+                self._buf[(self._head + self._count) % size] = now
+                self._count += 1
+
+
+class _NullRateLimiter:
+    """No-op limiter for clients constructed without a RateLimiter."""
+    
+    def wait_and_acquire(self) -> None:
+        pass
+    
+    def observe_usage(self, used: int) -> None:
+        pass
+    
+    def remaining(self) -> Optional[int]:
+        return None
+
+
+class _JitteredRetry(Retry):
+    """
+    urllib3 Retry that adds random jitter to backoff and Retry-After waits,
+    so parallel workers throttled together don't all retry in lockstep.
+    """
+    
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, backoff / 2) if backoff else 0
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return retry_after + random.uniform(0, HubSpotConfig.RETRY_BACKOFF)
 
 
 def rate_limited(func: Callable) -> Callable:
-    """Decorator to apply rate limiting to API calls."""
+    """
+    Decorator to apply rate limiting to API calls.
+    The instance must provide `_rate_limiter` (HubSpotClient defaults it to a
+    no-op limiter), so no attribute check is needed per call.
+    """
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        if hasattr(self, '_rate_limiter'):
-            self._rate_limiter.wait_and_acquire()
+        self._rate_limiter.wait_and_acquire()
         return func(self, *args, **kwargs)
     return wrapper
 
@@ -260,6 +476,9 @@ class HubSpotClient:
     HubSpot API client with OAuth support, rate limiting, and retry logic.
     """
     
+    # Fallback for instances that bypass __init__ (e.g. test doubles)
+    _rate_limiter = _NullRateLimiter()
+    
     def __init__(
         self,
         access_token: Optional[str] = None,
@@ -283,35 +502,133 @@ class HubSpotClient:
         
         self._rate_limiter = RateLimiter()
         self._session = self._create_session()
-        self._token_expires_at: Optional[datetime] = None
+        # Refresh deadline on the time.monotonic() clock (None = unknown)
+        self._token_expires_at: Optional[float] = None
+        self._token_lock = threading.Lock()
+        
+        # deal_id -> (ETag, payload) for conditional get_deal requests
+        self._deal_cache: OrderedDict[str, tuple[str, Dict[str, Any]]] = OrderedDict()
+        self._deal_cache_lock = threading.Lock()
+        
+        # (monotonic time, result) of the last connection_status check
+        self._status_cache: Optional[tuple[float, Dict[str, Any]]] = None
+        
+        # (request, elapsed ms, status code) of recent requests, newest last;
+        # status 0 means the request never got a response
+        self._request_log: deque[tuple[str, float, int]] = deque(maxlen=HubSpotConfig.REQUEST_LOG_SIZE)
+        self._request_count = 0
+        self._request_count_lock = threading.Lock()
+        self._created_at = time.monotonic()
         
         # Webhook secret for signature verification
         self.webhook_secret = os.getenv("HUBSPOT_WEBHOOK_SECRET")
     
+    @property
+    def access_token(self) -> Optional[str]:
+        """Current API access token."""
+        return self._access_token
+    
+    @access_token.setter
+    def access_token(self, value: Optional[str]) -> None:
+        # Request headers only change with the token, so build them here once
+        self._access_token = value
+        self._headers = {
+            "Authorization": f"Bearer {value}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+    
+    @property
+    def webhook_secret(self) -> Optional[str]:
+        """Webhook signing secret."""
+        return self._webhook_secret
+    
+    @webhook_secret.setter
+    def webhook_secret(self, value: Optional[str]) -> None:
+        # Key the HMAC once; verification copies this primed state per request
+        self._webhook_secret = value
+        self._webhook_hmac = hmac.new(value.encode(), digestmod=hashlib.sha256) if value else None
+    
     def _create_session(self) -> requests.Session:
         """Create requests session with retry logic."""
         session = requests.Session()
         
-        retry_strategy = Retry(
+        adapter = self._retry_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # batch/create is not idempotent: after a read timeout HubSpot may
+        # already have created the deals, so a resend would duplicate the
+        # batch. Throttled and 5xx responses are still retried on status.
+        session.mount(
+            f"{HubSpotConfig.BASE_URL}/{_BATCH_CREATE_URL}",
+            self._retry_adapter(read=0, other=0),
+        )
+        
+        return session
+    
+    @staticmethod
+    def _retry_adapter(**retry_overrides: int) -> HTTPAdapter:
+        """
+        Build a pooled adapter that retries 429/5xx responses with backoff.
+        
+        Args:
+            retry_overrides: Per-category Retry limits (e.g. read=0) that
+                override the shared MAX_RETRIES budget
+            
+        Returns:
+            HTTPAdapter with the jittered retry policy
+        """
+        retry_strategy = _JitteredRetry(
             total=HubSpotConfig.MAX_RETRIES,
             backoff_factor=HubSpotConfig.RETRY_BACKOFF,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "POST", "PATCH", "DELETE"],
+            **retry_overrides,
+        )
+        return HTTPAdapter(
+            pool_connections=HubSpotConfig.CONNECTION_POOL_SIZE,
+            pool_maxsize=HubSpotConfig.CONNECTION_POOL_SIZE,
+            max_retries=retry_strategy,
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        
-        return session
     
     @property
-    def _headers(self) -> Dict[str, str]:
-        """Get request headers with current access token."""
+    def rate_limit_remaining(self) -> Optional[int]:
+        """Requests left in the current rate-limit window (None if unlimited)."""
+        return self._rate_limiter.remaining()
+    
+    def _record_request(self, method: str, endpoint: str, started: float, status_code: int) -> None:
+        """Log one request's latency for request_stats."""
+        elapsed_ms = (time.monotonic() - started) * 1000
+        self._request_log.append((f"{method} {endpoint}", elapsed_ms, status_code))
+        with self._request_count_lock:
+            self._request_count += 1
+    
+    def request_stats(self) -> Dict[str, Any]:
+        """
+        Summarize API usage since this client was created.
+        
+        Returns:
+            Dictionary with total requests; error count and p50/p95 latency
+            (ms) over the recent requests kept in the log; and the projected
+            daily request count at the current rate against the daily limit
+        """
+        recent = list(self._request_log)
+        latencies = [elapsed for _, elapsed, _ in recent]
+        if len(latencies) >= 2:
+            cuts = statistics.quantiles(latencies, n=20)
+            p50, p95 = cuts[9], cuts[18]
+        else:
+            p50 = p95 = latencies[0] if latencies else None
+        
+        uptime = max(time.monotonic() - self._created_at, 60.0)  # damp early spikes
         return {
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
+            "requests": self._request_count,
+            "recent_requests": len(recent),
+            "recent_errors": sum(1 for _, _, status in recent if status == 0 or status >= 400),
+            "p50_ms": p50,
+            "p95_ms": p95,
+            "projected_daily_requests": int(self._request_count * 86400 / uptime),
+            "daily_limit": HubSpotConfig.DAILY_REQUEST_LIMIT,
         }
     
     def _refresh_token_if_needed(self) -> None:
@@ -319,7 +636,22 @@ class HubSpotClient:
         if not self.refresh_token or not self.client_id or not self.client_secret:
             return
         
-        if self._token_expires_at and datetime.utcnow() < self._token_expires_at:
+        # Lock-free fast path while the current token is still fresh
+        if self._token_is_fresh():
+            return
+        
+        with self._token_lock:
+            self._refresh_token_locked()
+    
+    def _token_is_fresh(self) -> bool:
+        """True if the access token is known to be valid past the refresh margin."""
+        expires_at = self._token_expires_at
+        return expires_at is not None and time.monotonic() < expires_at
+    
+    def _refresh_token_locked(self) -> None:
+        """Refresh the token; caller holds _token_lock so concurrent requests refresh once."""
+        # Another thread may have refreshed while we waited for the lock
+        if self._token_is_fresh():
             return
         
         logger.info("Refreshing HubSpot OAuth token...")
@@ -335,68 +667,137 @@ class HubSpotClient:
         )
         
         if response.status_code == 200:
-            data = response.json()
+            try:
+                data = _json_loads(response.content)
+            except ValueError:
+                raise HubSpotAuthError("Token refresh returned an invalid response")
             self.access_token = data["access_token"]
             self.refresh_token = data.get("refresh_token", self.refresh_token)
             expires_in = data.get("expires_in", 1800)
-            self._token_expires_at = datetime.utcnow() + timedelta(seconds=expires_in - 60)
+            self._token_expires_at = time.monotonic() + expires_in - HubSpotConfig.TOKEN_REFRESH_MARGIN
             logger.info("Token refreshed successfully")
         else:
             logger.error(f"Token refresh failed: {response.text}")
             raise HubSpotAuthError(f"Token refresh failed: {response.status_code}")
     
     @rate_limited
-    def _request(
+    def _send(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict] = None,
         params: Optional[Dict] = None,
-    ) -> Dict[str, Any]:
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
         """
-        Make an API request with rate limiting and error handling.
+        Send an API request with rate limiting; returns the raw response.
         
         Args:
             method: HTTP method (GET, POST, PATCH, DELETE)
             endpoint: API endpoint (relative to base URL)
             data: Request body data
             params: Query parameters
+            headers: Header override (defaults to the auth headers)
             
         Returns:
-            Response JSON data
+            Unparsed HTTP response
         """
         self._refresh_token_if_needed()
         
         url = f"{HubSpotConfig.BASE_URL}/{endpoint}"
         
+        started = time.monotonic()
         try:
             response = self._session.request(
                 method=method,
                 url=url,
-                headers=self._headers,
-                json=data,
+                headers=headers or self._headers,
+                data=_json_dumps(data) if data is not None else None,
                 params=params,
             )
-            
-            # Log for debugging
-            logger.debug(f"{method} {endpoint}: {response.status_code}")
-            
-            if response.status_code == 204:
-                return {"success": True}
-            
-            if response.status_code >= 400:
-                error_data = response.json() if response.text else {}
-                raise HubSpotAPIError(
-                    message=error_data.get("message", f"HTTP {response.status_code}"),
-                    status_code=response.status_code,
-                    details=error_data,
-                )
-            
-            return response.json()
-            
         except requests.exceptions.RequestException as e:
+            self._record_request(method, endpoint, started, 0)
             logger.error(f"Request failed: {e}")
             raise HubSpotConnectionError(str(e))
+        self._record_request(method, endpoint, started, response.status_code)
+        
+        # Log for debugging
+        logger.debug(f"{method} {endpoint}: {response.status_code}")
+        
+        # Server-side usage is ground truth for the shared per-app quota
+        remaining = response.headers.get("X-HubSpot-RateLimit-Remaining")
+        if remaining is not None:
+            limit = response.headers.get("X-HubSpot-RateLimit-Max")
+            try:
+                quota = int(limit) if limit else HubSpotConfig.RATE_LIMIT_REQUESTS
+                self._rate_limiter.observe_usage(quota - int(remaining))
+            except ValueError:
+                pass
+        
+        return response
+    
+    @staticmethod
+    def _parse_response(response: requests.Response) -> Dict[str, Any]:
+        """Decode a response body, raising HubSpotAPIError on error statuses."""
+        if response.status_code == 204:
+            return {"success": True}
+        
+        if response.status_code >= 400:
+            try:
+                error_data = _json_loads(response.content) if response.content else {}
+            except ValueError:
+                error_data = None
+            if not isinstance(error_data, dict):
+                # Not a HubSpot error body (e.g. a proxy's HTML error page)
+                error_data = {"raw": response.text}
+            raise HubSpotAPIError(
+                message=error_data.get("message", f"HTTP {response.status_code}"),
+                status_code=response.status_code,
+                details=error_data,
+            )
+        
+        try:
+            return _json_loads(response.content)
+        except ValueError:
+            raise HubSpotAPIError(
+                message=f"Invalid JSON in HTTP {response.status_code} response",
+                status_code=response.status_code,
+                details={"raw": response.text},
+            )
+    
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make an API request with rate limiting and error handling.
+        
+        Args:
+            method: HTTP method (GET, POST, PATCH, DELETE)
+            endpoint: API endpoint (relative to base URL)
+            data: Request body data
+            params: Query parameters
+            
+        Returns:
+            Response JSON data
+        """
+        return self._parse_response(self._send(method, endpoint, data, params))
+    
+    def _remember_deal(self, deal_id: str, etag: str, payload: Dict[str, Any]) -> None:
+        """Cache a deal payload under its ETag, evicting least recently used."""
+        with self._deal_cache_lock:
+            self._deal_cache[deal_id] = (etag, payload)
+            self._deal_cache.move_to_end(deal_id)
+            if len(self._deal_cache) > HubSpotConfig.DEAL_CACHE_SIZE:
+                self._deal_cache.popitem(last=False)
+    
+    def _forget_deal(self, deal_id: str) -> None:
+        """Drop a cached deal payload that can no longer be revalidated."""
+        with self._deal_cache_lock:
+            self._deal_cache.pop(deal_id, None)
     
     # -------------------------------------------------------------------------
     # DEAL OPERATIONS
@@ -412,75 +813,125 @@ class HubSpotClient:
         Returns:
             HubSpotDeal instance
         """
-        properties = [
-            "dealname", "amount", "dealstage", "closedate", "pipeline",
-            "hubspot_owner_id", "amanda_pwin", "amanda_gate_status",
-            "amanda_phase", "amanda_compliance_coverage",
-            "amanda_solicitation_number", "amanda_agency",
-            "amanda_priority_tier", "amanda_contract_vehicle",
-        ]
+        with self._deal_cache_lock:
+            cached = self._deal_cache.get(deal_id)
         
-        response = self._request(
+        # Revalidate a cached copy so an unchanged deal costs a bodiless 304
+        headers = {**self._headers, "If-None-Match": cached[0]} if cached else None
+        response = self._send(
             "GET",
-            f"crm/{HubSpotConfig.API_VERSION}/objects/deals/{deal_id}",
-            params={"properties": ",".join(properties)},
+            _DEAL_URL_FMT.format(deal_id),
+            params={"properties": _HUBSPOT_PROPERTIES_PARAM},
+            headers=headers,
         )
         
-        return HubSpotDeal.from_hubspot_response(response)
+        if cached and response.status_code == 304:
+            payload = cached[1]
+        else:
+            payload = self._parse_response(response)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._remember_deal(deal_id, etag, payload)
+        
+        return HubSpotDeal.from_hubspot_response(payload)
     
     def list_deals(
         self,
         limit: int = 100,
         after: Optional[str] = None,
         pipeline_id: Optional[str] = None,
+        modified_since: Optional[datetime] = None,
     ) -> tuple[List[HubSpotDeal], Optional[str]]:
         """
         List deals with pagination.
         
+        Filtered listings go through the CRM search endpoint so HubSpot
+        drops non-matching deals server-side instead of paging them to us.
+        
         Args:
             limit: Number of deals to retrieve (max 100)
             after: Pagination cursor
             pipeline_id: Filter by pipeline
+            modified_since: Only deals modified at or after this time
             
         Returns:
             Tuple of (deals list, next page cursor)
         """
-        properties = [
-            "dealname", "amount", "dealstage", "closedate", "pipeline",
-            "hubspot_owner_id", "amanda_pwin", "amanda_gate_status",
-            "amanda_phase", "amanda_compliance_coverage",
-            "amanda_solicitation_number", "amanda_agency",
-            "amanda_priority_tier", "amanda_contract_vehicle",
-        ]
-        
-        params = {
-            "limit": min(limit, 100),
-            "properties": ",".join(properties),
-        }
-        
-        if after:
-            params["after"] = after
-        
-        response = self._request(
-            "GET",
-            f"crm/{HubSpotConfig.API_VERSION}/objects/deals",
-            params=params,
-        )
+        if pipeline_id or modified_since:
+            filters = []
+            if pipeline_id:
+                filters.append({
+                    "propertyName": "pipeline",
+                    "operator": "EQ",
+                    "value": pipeline_id,
+                })
+            if modified_since:
+                filters.append({
+                    "propertyName": "hs_lastmodifieddate",
+                    "operator": "GTE",
+                    "value": str(int(modified_since.timestamp() * 1000)),
+                })
+            
+            body = {
+                "filterGroups": [{"filters": filters}],
+                "properties": _HUBSPOT_PROPERTY_NAMES,
+                "limit": min(limit, 100),
+            }
+            if after:
+                body["after"] = after
+            
+            response = self._request(
+                "POST",
+                _DEALS_SEARCH_URL,
+                data=body,
+            )
+        else:
+            params = {
+                "limit": min(limit, 100),
+                "properties": _HUBSPOT_PROPERTIES_PARAM,
+            }
+            
+            if after:
+                params["after"] = after
+            
+            response = self._request(
+                "GET",
+                _DEALS_URL,
+                params=params,
+            )
         
         deals = [
             HubSpotDeal.from_hubspot_response(d)
             for d in response.get("results", [])
         ]
         
-        # Filter by pipeline if specified
-        if pipeline_id:
-            deals = [d for d in deals if d.pipeline == pipeline_id]
-        
         paging = response.get("paging", {})
         next_cursor = paging.get("next", {}).get("after")
         
         return deals, next_cursor
     
+    def iter_deals(
+        self,
+        page_size: int = 100,
+        pipeline_id: Optional[str] = None,
+    ) -> Iterator[HubSpotDeal]:
+        """
+        Yield deals across all pages, fetching each page only when needed.
+        
+        Args:
+            page_size: Deals per request (max 100)
+            pipeline_id: Filter by pipeline
+            
+        Yields:
+            HubSpotDeal instances
+        """
+        cursor = None
+        while True:
+            deals, cursor = self.list_deals(limit=page_size, after=cursor, pipeline_id=pipeline_id)
+            yield from deals
+            if not cursor:
+                return
+    
     def create_deal(self, deal: HubSpotDeal) -> HubSpotDeal:
         """
         Create a new deal in HubSpot.
@@ -493,7 +944,7 @@ class HubSpotClient:
         """
         response = self._request(
             "POST",
-            f"crm/{HubSpotConfig.API_VERSION}/objects/deals",
+            _DEALS_URL,
             data={"properties": deal.to_hubspot_properties()},
         )
         
@@ -512,7 +963,7 @@ class HubSpotClient:
         """
         response = self._request(
             "PATCH",
-            f"crm/{HubSpotConfig.API_VERSION}/objects/deals/{deal_id}",
+            _DEAL_URL_FMT.format(deal_id),
             data={"properties": deal.to_hubspot_properties()},
         )
         
@@ -530,41 +981,57 @@ class HubSpotClient:
         """
         self._request(
             "DELETE",
-            f"crm/{HubSpotConfig.API_VERSION}/objects/deals/{deal_id}",
+            _DEAL_URL_FMT.format(deal_id),
         )
+        self._forget_deal(deal_id)
         return True
     
     # -------------------------------------------------------------------------
     # BATCH OPERATIONS
     # -------------------------------------------------------------------------
     
-    def batch_get_deals(self, deal_ids: List[str]) -> List[HubSpotDeal]:
+    def batch_get_deals(
+        self,
+        deal_ids: List[str],
+        properties: Optional[tuple[str, ...]] = None,
+    ) -> List[HubSpotDeal]:
         """
-        Get multiple deals by ID in a single request.
+        Get multiple deals by ID via the batch read endpoint.
+        IDs are sent in chunks of up to 100 (the HubSpot batch limit), so each
+        chunk costs one request and one rate-limit slot.
         
         Args:
             deal_ids: List of HubSpot deal IDs
+            properties: Properties to fetch (defaults to all AMANDA deal fields)
             
         Returns:
             List of HubSpotDeal instances
         """
-        properties = [
-            "dealname", "amount", "dealstage", "closedate", "pipeline",
-            "hubspot_owner_id", "amanda_pwin", "amanda_gate_status",
-            "amanda_phase", "amanda_compliance_coverage",
-        ]
+        if properties is None:
+            properties = _HUBSPOT_PROPERTY_NAMES
         
-        response = self._request(
-            "POST",
-            f"crm/{HubSpotConfig.API_VERSION}/objects/deals/batch/read",
-            data={
-                "inputs": [{"id": did} for did in deal_ids],
-                "properties": properties,
-            },
-        )
+        def fetch(batch: List[str]) -> Dict[str, Any]:
+            return self._request(
+                "POST",
+                _BATCH_READ_URL,
+                data={
+                    "inputs": [{"id": did} for did in batch],
+                    "properties": properties,
+                },
+            )
+        
+        batches = list(_chunked(deal_ids, HubSpotConfig.BATCH_SIZE))
+        if len(batches) <= 1:
+            responses = [fetch(batch) for batch in batches]
+        else:
+            # Overlap network round-trips; the rate limiter is thread-safe
+            workers = min(len(batches), HubSpotConfig.MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                responses = list(pool.map(fetch, batches))
         
         return [
             HubSpotDeal.from_hubspot_response(d)
+            for response in responses
             for d in response.get("results", [])
         ]
     
@@ -580,36 +1047,168 @@ class HubSpotClient:
         """
         result = SyncResult(success=True)
         
-        # HubSpot batch limit is 100
-        for i in range(0, len(updates), 100):
-            batch = updates[i:i + 100]
-            
-            try:
-                response = self._request(
-                    "POST",
-                    f"crm/{HubSpotConfig.API_VERSION}/objects/deals/batch/update",
-                    data={
-                        "inputs": [
-                            {
-                                "id": deal_id,
-                                "properties": deal.to_hubspot_properties(),
-                            }
-                            for deal_id, deal in batch
-                        ]
-                    },
-                )
-                
-                result.deals_updated += len(response.get("results", []))
-                
-            except HubSpotAPIError as e:
-                result.errors.append(str(e))
-                result.deals_failed += len(batch)
+        batches = list(_chunked(updates, HubSpotConfig.BATCH_SIZE))
+        if len(batches) <= 1:
+            outcomes = [self._post_update_chunk(batch) for batch in batches]
+        else:
+            # Chunks are independent; the rate limiter is thread-safe
+            workers = min(len(batches), HubSpotConfig.MAX_CONCURRENT_REQUESTS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(self._post_update_chunk, batches))
+        
+        for batch, (updated, errors) in zip(batches, outcomes):
+            result.deals_updated += updated
+            result.deals_failed += len(batch) - updated
+            for error in errors:
+                result.add_error(error)
         
         result.deals_synced = result.deals_updated
         result.success = result.deals_failed == 0
         
         return result
     
+    def _post_update_chunk(
+        self, batch: List[tuple[str, HubSpotDeal]]
+    ) -> tuple[int, List[str]]:
+        """
+        POST one batch/update chunk. Deals the batch did not apply (a batch
+        rejected with a client error, or inputs missing from a partial
+        response) are retried one at a time, so a single stale ID cannot fail
+        the whole chunk. Throttling and server errors fail the chunk instead,
+        since per-deal retries would only multiply the load.
+        
+        Returns:
+            (deals updated, error messages)
+        """
+        try:
+            response = self._request(
+                "POST",
+                _BATCH_UPDATE_URL,
+                data={
+                    "inputs": [
+                        {
+                            "id": deal_id,
+                            "properties": deal.to_hubspot_properties(),
+                        }
+                        for deal_id, deal in batch
+                    ]
+                },
+            )
+        except HubSpotAPIError as e:
+            if not 400 <= e.status_code < 500 or e.status_code == 429:
+                return 0, [str(e)]
+            # Batch rejected as a whole; updates are idempotent, so retry singly
+            pending = batch
+        except HubSpotError as e:
+            return 0, [str(e)]
+        else:
+            applied = {str(r.get("id")) for r in response.get("results", [])}
+            pending = [(deal_id, deal) for deal_id, deal in batch if str(deal_id) not in applied]
+        
+        updated = len(batch) - len(pending)
+        errors: List[str] = []
+        for deal_id, deal in pending:
+            try:
+                self.update_deal(deal_id, deal)
+                updated += 1
+            except HubSpotError as e:
+                errors.append(f"Deal {deal_id}: {e}")
+        
+        return updated, errors
+    
+    def batch_create_deals(self, deals: List[HubSpotDeal]) -> SyncResult:
+        """
+        Create multiple deals in batches of up to 100 per request.
+        
+        Each input carries an objectWriteTraceId and each input deal's `id`
+        is set from the result echoing it back; HubSpot does not promise
+        results in input order, and a partial (207) response omits failures.
+        
+        Args:
+            deals: HubSpotDeal instances without IDs
+            
+        Returns:
+            SyncResult with operation counts
+        """
+        result = SyncResult(success=True)
+        
+        for batch in _chunked(deals, HubSpotConfig.BATCH_SIZE):
+            created, errors = self._post_create_chunk(batch)
+            result.deals_created += created
+            result.deals_failed += len(batch) - created
+            for error in errors:
+                result.add_error(error)
+        
+        result.deals_synced = result.deals_created
+        result.success = result.deals_failed == 0
+        
+        return result
+    
+    def _post_create_chunk(self, batch: List[HubSpotDeal]) -> tuple[int, List[str]]:
+        """
+        POST one batch/create chunk, setting `id` on each deal created.
+        
+        A batch rejected with a client error (nothing was created) falls back
+        to one create per deal. Timeouts and server errors are not retried
+        singly, since the batch may have been applied and a retry would
+        duplicate deals.
+        
+        Returns:
+            (deals created, error messages)
+        """
+        try:
+            response = self._request(
+                "POST",
+                _BATCH_CREATE_URL,
+                data={
+                    "inputs": [
+                        {
+                            "properties": deal.to_hubspot_properties(),
+                            "objectWriteTraceId": str(i),
+                        }
+                        for i, deal in enumerate(batch)
+                    ]
+                },
+            )
+        except HubSpotAPIError as e:
+            if not 400 <= e.status_code < 500 or e.status_code == 429:
+                return 0, [str(e)]
+            return self._create_singly(batch)
+        except HubSpotError as e:
+            return 0, [str(e)]
+        
+        by_trace_id = dict(enumerate(batch))
+        results = response.get("results", [])
+        unmatched = 0
+        for created in results:
+            try:
+                deal = by_trace_id.pop(int(created.get("objectWriteTraceId")))
+            except (KeyError, TypeError, ValueError):
+                unmatched += 1
+                continue
+            deal.id = created.get("id")
+        
+        errors = [
+            error.get("message", "Batch create error")
+            for error in response.get("errors", [])
+        ]
+        if unmatched:
+            errors.append(f"{unmatched} created deals could not be matched to their inputs")
+        
+        return len(results), errors
+    
+    def _create_singly(self, batch: List[HubSpotDeal]) -> tuple[int, List[str]]:
+        """Create deals one request at a time; returns (deals created, error messages)."""
+        created = 0
+        errors: List[str] = []
+        for deal in batch:
+            try:
+                deal.id = self.create_deal(deal).id
+                created += 1
+            except HubSpotError as e:
+                errors.append(f"Deal {deal.name}: {e}")
+        return created, errors
+    
     # -------------------------------------------------------------------------
     # CUSTOM PROPERTIES
     # -------------------------------------------------------------------------
@@ -622,20 +1221,31 @@ class HubSpotClient:
         Returns:
             True if successful
         """
+        # Look up what is already provisioned so re-runs only POST what's missing
+        existing_groups = {
+            g.get("name")
+            for g in self._request("GET", _DEAL_PROPERTY_GROUPS_URL).get("results", [])
+        }
+        existing_properties = {
+            p.get("name")
+            for p in self._request("GET", _DEAL_PROPERTIES_URL).get("results", [])
+        }
+        
         # First, create the property group
-        try:
-            self._request(
-                "POST",
-                f"crm/{HubSpotConfig.API_VERSION}/properties/deals/groups",
-                data={
-                    "name": HubSpotConfig.AMANDA_PROPERTY_GROUP,
-                    "label": "AMANDA Portal",
-                    "displayOrder": 0,
-                },
-            )
-        except HubSpotAPIError as e:
-            if "already exists" not in str(e).lower():
-                logger.warning(f"Could not create property group: {e}")
+        if HubSpotConfig.AMANDA_PROPERTY_GROUP not in existing_groups:
+            try:
+                self._request(
+                    "POST",
+                    _DEAL_PROPERTY_GROUPS_URL,
+                    data={
+                        "name": HubSpotConfig.AMANDA_PROPERTY_GROUP,
+                        "label": "AMANDA Portal",
+                        "displayOrder": 0,
+                    },
+                )
+            except HubSpotAPIError as e:
+                if "already exists" not in str(e).lower():
+                    logger.warning(f"Could not create property group: {e}")
         
         # Define AMANDA properties
         properties = [
@@ -728,12 +1338,11 @@ class HubSpotClient:
         
         created_count = 0
         for prop in properties:
+            if prop["name"] in existing_properties:
+                logger.info(f"Property already exists: {prop['name']}")
+                continue
             try:
-                self._request(
-                    "POST",
-                    f"crm/{HubSpotConfig.API_VERSION}/properties/deals",
-                    data=prop,
-                )
+                self._request("POST", _DEAL_PROPERTIES_URL, data=prop)
                 created_count += 1
                 logger.info(f"Created property: {prop['name']}")
             except HubSpotAPIError as e:
@@ -770,11 +1379,9 @@ class HubSpotClient:
             return True
         
         # HubSpot v2 signature: SHA-256(client_secret + request_body)
-        expected = hmac.new(
-            self.webhook_secret.encode(),
-            request_body,
-            hashlib.sha256,
-        ).hexdigest()
+        mac = self._webhook_hmac.copy()
+        mac.update(request_body)
+        expected = mac.hexdigest()
         
         return hmac.compare_digest(expected, signature.lower())
     
@@ -788,9 +1395,8 @@ class HubSpotClient:
         Returns:
             List of WebhookEvent instances
         """
-        events = []
-        for item in payload:
-            events.append(WebhookEvent(
+        return [
+            WebhookEvent(
                 event_id=str(item.get("eventId", "")),
                 subscription_type=item.get("subscriptionType", ""),
                 object_id=str(item.get("objectId", "")),
@@ -798,8 +1404,9 @@ class HubSpotClient:
                 property_value=item.get("propertyValue"),
                 occurred_at=item.get("occurredAt"),
                 portal_id=str(item.get("portalId", "")),
-            ))
-        return events
+            )
+            for item in payload
+        ]
     
     # -------------------------------------------------------------------------
     # CONNECTION TEST
@@ -832,6 +1439,20 @@ class HubSpotClient:
                 "connected": False,
                 "error": str(e),
             }
+    
+    def connection_status(self, max_age: float = HubSpotConfig.STATUS_CACHE_TTL) -> Dict[str, Any]:
+        """
+        Connection status, re-checked at most once per max_age seconds.
+        Lets UI widgets that render on every Streamlit rerun avoid a
+        round-trip to HubSpot each time; pass max_age=0 to force a check.
+        """
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+        
+        status = self.test_connection()
+        self._status_cache = (time.monotonic(), status)
+        return status
 
 
 # =============================================================================
@@ -873,6 +1494,35 @@ class HubSpotSyncService:
             except Exception as e:
                 logger.error(f"Callback error for {event_type}: {e}")
     
+    def _iter_deals(
+        self,
+        pipeline_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> Iterator[HubSpotDeal]:
+        """
+        Yield matching HubSpot deals one at a time across all pages.
+        The next page is prefetched on a worker while the caller consumes
+        the current one, overlapping network waits with processing.
+        """
+        def fetch_page(cursor: Optional[str]) -> tuple[List[HubSpotDeal], Optional[str]]:
+            return self.client.list_deals(
+                limit=100,
+                after=cursor,
+                pipeline_id=pipeline_id,
+                modified_since=since,
+            )
+        
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            deals, cursor = fetch_page(None)
+            
+            while True:
+                next_page = pool.submit(fetch_page, cursor) if cursor else None
+                yield from deals
+                
+                if next_page is None:
+                    break
+                deals, cursor = next_page.result()
+    
     def sync_from_hubspot(
         self,
         pipeline_id: Optional[str] = None,
@@ -889,35 +1539,21 @@ class HubSpotSyncService:
             SyncResult with operation counts
         """
         result = SyncResult(success=True)
-        cursor = None
         
-        while True:
-            deals, cursor = self.client.list_deals(
-                limit=100,
-                after=cursor,
-                pipeline_id=pipeline_id,
-            )
-            
-            for deal in deals:
-                try:
-                    # Check if deal exists in AMANDA
-                    # This would be implemented with actual DB operations
-                    result.deals_synced += 1
+        for deal in self._iter_deals(pipeline_id, since):
+            try:
+                # Check if deal exists in AMANDA
+                # This would be implemented with actual DB operations
+                result.deals_synced += 1
+                
+                # Trigger callbacks
+                self._trigger_callbacks(
+                    _TERMINAL_STAGE_CALLBACKS.get(deal.stage, "deal_updated"), deal
+                )
                     
-                    # Trigger callbacks
-                    if deal.stage == HubSpotStage.CLOSED_WON.value:
-                        self._trigger_callbacks("deal_won", deal)
-                    elif deal.stage == HubSpotStage.CLOSED_LOST.value:
-                        self._trigger_callbacks("deal_lost", deal)
-                    else:
-                        self._trigger_callbacks("deal_updated", deal)
-                        
-                except Exception as e:
-                    result.errors.append(f"Deal {deal.id}: {e}")
-                    result.deals_failed += 1
-            
-            if not cursor:
-                break
+            except Exception as e:
+                result.add_error(f"Deal {deal.id}: {e}")
+                result.deals_failed += 1
         
         result.success = result.deals_failed == 0
         return result
@@ -932,43 +1568,64 @@ class HubSpotSyncService:
         Returns:
             SyncResult with operation counts
         """
-        result = SyncResult(success=True)
-        
+        updates: List[tuple[str, HubSpotDeal]] = []
+        creates: List[tuple[Dict, HubSpotDeal]] = []
         for deal_data in amanda_deals:
-            try:
-                deal = HubSpotDeal(
-                    id=deal_data.get("hubspot_deal_id"),
-                    name=deal_data.get("name", ""),
-                    amount=deal_data.get("value", 0),
-                    amanda_pwin=deal_data.get("pwin", 0),
-                    amanda_gate_status=deal_data.get("gate_status", "PENDING"),
-                    amanda_phase=deal_data.get("phase", "qualification"),
-                    amanda_compliance_coverage=deal_data.get("compliance_pct", 0),
-                    amanda_solicitation_number=deal_data.get("solicitation", ""),
-                    amanda_agency=deal_data.get("agency", ""),
-                    amanda_priority_tier=deal_data.get("priority", "P-2"),
-                )
-                
-                if deal.id:
-                    # Update existing
-                    self.client.update_deal(deal.id, deal)
-                    result.deals_updated += 1
-                else:
-                    # Create new
-                    created = self.client.create_deal(deal)
-                    result.deals_created += 1
-                    # Return new ID to caller
-                    deal_data["hubspot_deal_id"] = created.id
-                
-                result.deals_synced += 1
-                
-            except Exception as e:
-                result.errors.append(f"Deal {deal_data.get('name')}: {e}")
-                result.deals_failed += 1
+            deal = self._to_hubspot_deal(deal_data)
+            if deal.id:
+                updates.append((deal.id, deal))
+            else:
+                creates.append((deal_data, deal))
         
+        # One batch call per 100 deals instead of one call per deal
+        result = self.client.batch_update_deals(updates)
+        
+        created = self.client.batch_create_deals([deal for _, deal in creates])
+        result.deals_created = created.deals_created
+        result.deals_failed += created.deals_failed
+        for error in created.errors:
+            result.add_error(error)
+        result.errors_truncated += created.errors_truncated
+        
+        # Return new IDs to caller
+        for deal_data, deal in creates:
+            if deal.id:
+                deal_data["hubspot_deal_id"] = deal.id
+        
+        result.deals_synced = result.deals_updated + result.deals_created
         result.success = result.deals_failed == 0
         return result
     
+    @staticmethod
+    def _to_hubspot_deal(deal_data: Dict) -> HubSpotDeal:
+        """Build a HubSpotDeal from an AMANDA deal dictionary."""
+        return HubSpotDeal(
+            id=deal_data.get("hubspot_deal_id"),
+            name=deal_data.get("name", ""),
+            amount=deal_data.get("value", 0),
+            amanda_pwin=deal_data.get("pwin", 0),
+            amanda_gate_status=deal_data.get("gate_status", "PENDING"),
+            amanda_phase=deal_data.get("phase", "qualification"),
+            amanda_compliance_coverage=deal_data.get("compliance_pct", 0),
+            amanda_solicitation_number=deal_data.get("solicitation", ""),
+            amanda_agency=deal_data.get("agency", ""),
+            amanda_priority_tier=deal_data.get("priority", "P-2"),
+        )
+    
+    @staticmethod
+    def _webhook_callback_type(event: WebhookEvent) -> Optional[str]:
+        """Callback type a webhook event dispatches, or None if it needs no deal fetch."""
+        if event.subscription_type == "deal.creation":
+            return "deal_created"
+        
+        if event.subscription_type == "deal.propertyChange":
+            # Check for stage changes
+            if event.property_name == "dealstage":
+                return _TERMINAL_STAGE_CALLBACKS.get(event.property_value, "deal_updated")
+            return "deal_updated"
+        
+        return None
+    
     def handle_webhook_event(self, event: WebhookEvent) -> None:
         """
         Process a webhook event from HubSpot.
@@ -978,27 +1635,113 @@ class HubSpotSyncService:
         """
         logger.info(f"Processing webhook: {event.subscription_type} for {event.object_id}")
         
-        if event.subscription_type == "deal.creation":
+        callback_type = self._webhook_callback_type(event)
+        if callback_type:
             deal = self.client.get_deal(event.object_id)
-            self._trigger_callbacks("deal_created", deal)
-            
-        elif event.subscription_type == "deal.propertyChange":
-            deal = self.client.get_deal(event.object_id)
-            
-            # Check for stage changes
-            if event.property_name == "dealstage":
-                if event.property_value == HubSpotStage.CLOSED_WON.value:
-                    self._trigger_callbacks("deal_won", deal)
-                elif event.property_value == HubSpotStage.CLOSED_LOST.value:
-                    self._trigger_callbacks("deal_lost", deal)
-                else:
-                    self._trigger_callbacks("deal_updated", deal)
-            else:
-                self._trigger_callbacks("deal_updated", deal)
+            self._trigger_callbacks(callback_type, deal)
         
         elif event.subscription_type == "deal.deletion":
             # Handle archived deals
             logger.info(f"Deal {event.object_id} was deleted/archived")
+    
+    def handle_webhook_events(self, events: List[WebhookEvent]) -> None:
+        """
+        Process a batch of webhook events from HubSpot.
+        Deals are fetched with one batch read per 100 distinct IDs instead of
+        one GET per event; callbacks still fire once per event, in order.
+        
+        Args:
+            events: Parsed webhook events
+        """
+        pending: List[tuple[WebhookEvent, str]] = []
+        for event in events:
+            logger.info(f"Processing webhook: {event.subscription_type} for {event.object_id}")
+            callback_type = self._webhook_callback_type(event)
+            if callback_type:
+                pending.append((event, callback_type))
+            elif event.subscription_type == "deal.deletion":
+                logger.info(f"Deal {event.object_id} was deleted/archived")
+        
+        if not pending:
+            return
+        
+        deal_ids = list(dict.fromkeys(event.object_id for event, _ in pending))
+        deals = {deal.id: deal for deal in self.client.batch_get_deals(deal_ids)}
+        
+        for event, callback_type in pending:
+            deal = deals.get(event.object_id)
+            if deal is None:
+                logger.warning(f"Deal {event.object_id} not found for webhook {event.event_id}")
+                continue
+            self._trigger_callbacks(callback_type, deal)
+
+
+class WebhookBatcher:
+    """
+    Coalesces bursts of webhook events into batch deal reads.
+    
+    Events are buffered until max_batch accumulate or flush_ms has passed
+    since the first buffered event, then handed to
+    HubSpotSyncService.handle_webhook_events as a single batch.
+    """
+    
+    def __init__(
+        self,
+        service: HubSpotSyncService,
+        flush_ms: int = 200,
+        max_batch: int = HubSpotConfig.BATCH_SIZE,
+    ):
+        """
+        Initialize webhook batcher.
+        
+        Args:
+            service: Sync service that dispatches the batched events
+            flush_ms: Maximum time an event waits in the buffer
+            max_batch: Buffer size that triggers an immediate flush
+        """
+        self.service = service
+        self.flush_s = flush_ms / 1000
+        self.max_batch = max_batch
+        self._pending: List[WebhookEvent] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+    
+    def submit(self, event: WebhookEvent) -> None:
+        """Buffer an event, flushing inline once the batch is full."""
+        with self._lock:
+            self._pending.append(event)
+            if len(self._pending) < self.max_batch:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.flush_s, self._flush_on_timer)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            batch = self._take_locked()
+        
+        self.service.handle_webhook_events(batch)
+    
+    def flush(self) -> None:
+        """Dispatch all buffered events now."""
+        with self._lock:
+            batch = self._take_locked()
+        
+        if batch:
+            self.service.handle_webhook_events(batch)
+    
+    def _flush_on_timer(self) -> None:
+        """Timer-thread flush; errors are logged since there is no caller to raise to."""
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Webhook batch failed")
+    
+    def _take_locked(self) -> List[WebhookEvent]:
+        """Detach the buffer and cancel the pending timer; caller holds _lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        return batch
 
 
 # =============================================================================
@@ -1034,6 +1777,128 @@ class HubSpotConnectionError(HubSpotError):
     pass
 
 
+# =============================================================================
+# WEBHOOK RECEIVER
+# =============================================================================
+
+class DealStore:
+    """
+    Thread-safe record of the latest deal state pushed by webhooks for one
+    portal. Every change bumps `version`, so readers can ask for just the
+    deals changed since the version they last saw. Holds at most
+    `max_deals` deals, dropping the least recently changed.
+    """
+    
+    def __init__(self, max_deals: int = HubSpotConfig.DEAL_STORE_SIZE):
+        # Ordered oldest change first
+        self._deals: OrderedDict[str, tuple[int, HubSpotDeal]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_deals = max_deals
+        self.version = 0
+    
+    def put(self, deal: HubSpotDeal) -> None:
+        """Record the current state of a deal."""
+        with self._lock:
+            self.version += 1
+            self._deals[deal.id] = (self.version, deal)
+            self._deals.move_to_end(deal.id)
+            if len(self._deals) > self.max_deals:
+                self._deals.popitem(last=False)
+    
+    def changes_since(self, version: int) -> tuple[int, List[HubSpotDeal]]:
+        """Return (current version, deals changed after `version`)."""
+        with self._lock:
+            if version >= self.version:
+                return self.version, []
+            return self.version, [
+                deal for changed_at, deal in self._deals.values() if changed_at > version
+            ]
+
+
+def start_webhook_receiver(
+    client: HubSpotClient,
+    store: DealStore,
+    port: int,
+    host: str = "127.0.0.1",
+) -> ThreadingHTTPServer:
+    """
+    Serve HubSpot webhooks on a background thread.
+    
+    Signed POSTs to HubSpotConfig.WEBHOOK_PATH are parsed, coalesced by a
+    WebhookBatcher into batch deal reads, and the refreshed deals are
+    written to `store`. Binds to localhost by default; expose it through a
+    reverse proxy.
+    
+    Args:
+        client: Client used to verify signatures and fetch deals
+        store: Destination for updated deal state
+        port: TCP port to listen on
+        host: Interface to bind
+        
+    Returns:
+        The running server (call shutdown() to stop it)
+        
+    Raises:
+        HubSpotAuthError: If the client has no webhook secret, since
+            unsigned requests could not be told apart from HubSpot's
+    """
+    if not client.webhook_secret:
+        raise HubSpotAuthError("Webhook secret not configured; refusing to start the receiver")
+    
+    service = HubSpotSyncService(client)
+    for event_type in ("deal_created", "deal_updated", "deal_won", "deal_lost"):
+        service.register_callback(event_type, store.put)
+    batcher = WebhookBatcher(service)
+    
+    class WebhookHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            if self.path != HubSpotConfig.WEBHOOK_PATH:
+                self.send_error(404)
+                return
+            
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+            except ValueError:
+                self.send_error(400)
+                return
+            if length < 0:
+                self.send_error(400)
+                return
+            if length > HubSpotConfig.WEBHOOK_MAX_BODY:
+                self.send_error(413)
+                return
+            
+            body = self.rfile.read(length)
+            signature = self.headers.get("X-HubSpot-Signature", "")
+            if not client.verify_webhook_signature(body, signature):
+                self.send_error(401)
+                return
+            
+            try:
+                events = client.parse_webhook_events(_json_loads(body))
+            except (ValueError, AttributeError, TypeError):
+                self.send_error(400)
+                return
+            
+            # Acknowledge first; HubSpot retries webhooks that respond slowly
+            self.send_response(204)
+            self.end_headers()
+            
+            for event in events:
+                try:
+                    batcher.submit(event)
+                except HubSpotError as e:
+                    logger.error(f"Webhook batch failed: {e}")
+        
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format % args)
+    
+    server = ThreadingHTTPServer((host, port), WebhookHandler)
+    threading.Thread(target=server.serve_forever, name="hubspot-webhooks", daemon=True).start()
+    logger.info(f"Listening for HubSpot webhooks on {host}:{port}{HubSpotConfig.WEBHOOK_PATH}")
+    return server
+
+
 # =============================================================================
 # STREAMLIT INTEGRATION
 # =============================================================================
@@ -1068,7 +1933,7 @@ def render_hubspot_status() -> None:
     client = get_hubspot_client()
     
     if client:
-        status = client.test_connection()
+        status = client.connection_status()
         if status["connected"]:
             st.success(f"✓ Connected to HubSpot ({status.get('hub_domain', 'Unknown')})")
         else:
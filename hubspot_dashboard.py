@@ -8,22 +8,32 @@ Version: 7.3 (Phase 1B)
 """
 
 import streamlit as st
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterable, Iterator
+import importlib
+import importlib.util
 import os
+import time
+import hashlib
+import tempfile
+from pathlib import Path
+from types import MappingProxyType
+from bisect import bisect_right
+from itertools import islice
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# HubSpot connector is imported on first use (handle gracefully if not
+# available); only its presence is checked at load so the disconnected
+# dashboard renders without paying for the import.
+HUBSPOT_AVAILABLE = importlib.util.find_spec("hubspot_connector") is not None
+
+if TYPE_CHECKING:
+    from hubspot_connector import HubSpotClient, HubSpotDeal, SyncResult, DealStore
 
-# Import HubSpot connector (handle gracefully if not available)
-try:
-    from hubspot_connector import (
-        HubSpotClient,
-        HubSpotSyncService,
-        HubSpotDeal,
-        SyncResult,
-        get_hubspot_client,
-    )
-    HUBSPOT_AVAILABLE = True
-except ImportError:
-    HUBSPOT_AVAILABLE = False
+
+def _connector():
+    """Import and return the hubspot_connector module (cached by Python)."""
+    return importlib.import_module("hubspot_connector")
 
 
 # =============================================================================
@@ -32,6 +42,50 @@ except ImportError:
 
 HUBSPOT_ORANGE = "#FF7A59"
 
+# Upper bound on deals pulled per sync (pages are fetched lazily up to this)
+MAX_SYNCED_DEALS = 1000
+
+# Webhook deployment settings, read once at import. The receiver listens on
+# WEBHOOK_HOST:WEBHOOK_PORT (localhost by default); WEBHOOK_URL is the public
+# URL a reverse proxy forwards to it, which is what HubSpot must call.
+WEBHOOK_PATH = "/api/hubspot/webhook"  # must match HubSpotConfig.WEBHOOK_PATH
+WEBHOOK_HOST = os.getenv("HUBSPOT_WEBHOOK_HOST", "127.0.0.1")
+WEBHOOK_PORT = os.getenv("HUBSPOT_WEBHOOK_PORT")
+WEBHOOK_URL = os.getenv("HUBSPOT_WEBHOOK_URL")
+WEBHOOK_SECRET_SET = bool(os.getenv("HUBSPOT_WEBHOOK_SECRET"))
+
+# Last synced deal table, persisted so a restarted worker (or another
+# session) can show deals without a HubSpot roundtrip
+# (one file per portal, see deal_snapshot_path)
+DEAL_SNAPSHOT_DIR = Path(os.getenv("AMANDA_CACHE_DIR", Path.home() / ".amanda"))
+
+# Arrow schema of the synced deals table
+_DICT_STRING = pa.dictionary(pa.int16(), pa.string())
+_DEAL_COLUMNS = {
+    "id": pa.string(),
+    "name": pa.string(),
+    "agency": pa.string(),
+    "solicitation": pa.string(),
+    "amount": pa.float64(),
+    "stage": _DICT_STRING,
+    "stage_label": _DICT_STRING,
+    "pwin": pa.float64(),
+    "gate_status": _DICT_STRING,
+}
+
+# Terminal HubSpot deal stages
+WON_STAGE = "closedwon"
+LOST_STAGE = "closedlost"
+
+# Stage badges for the deals table (read-only, shared by every render)
+STAGE_ICONS = MappingProxyType({
+    "closedwon": "🏆",
+    "closedlost": "❌",
+    "contractsent": "📝",
+    "qualifiedtobuy": "✓",
+})
+DEFAULT_STAGE_ICON = "📋"
+
 HUBSPOT_STYLES = """
 <style>
 .hubspot-header {
@@ -146,6 +200,79 @@ HUBSPOT_STYLES = """
 """
 
 
+# Stat card markup; fill with value, label and an optional value style attribute
+SYNC_CARD_TEMPLATE = """
+<div class="sync-card">
+    <div class="sync-stat">
+        <div class="sync-stat-value"{style}>{value}</div>
+        <div class="sync-stat-label">{label}</div>
+    </div>
+</div>
+"""
+
+# Logo header, shipped together with the stylesheet in a single element
+HUBSPOT_HEADER_HTML = HUBSPOT_STYLES + """
+<div class="hubspot-header">
+    <svg class="hubspot-logo" viewBox="0 0 24 24" fill="#FF7A59">
+        <path d="M18.164 7.93V5.652a2.277 2.277 0 0 0 1.31-2.054 2.293 2.293 0 0 0-4.586 0c0 .9.52 1.678 1.278 2.054V7.93a5.675 5.675 0 0 0-3.156 1.49L6.018 4.28a2.5 2.5 0 0 0 .478-1.478 2.52 2.52 0 1 0-2.52 2.52c.478 0 .92-.135 1.297-.365l6.924 5.088a5.7 5.7 0 0 0-.53 2.396c0 .862.19 1.68.53 2.413l-2.25 1.653a2.1 2.1 0 0 0-1.296-.443 2.127 2.127 0 1 0 2.127 2.127c0-.306-.068-.595-.184-.858l2.143-1.575a5.692 5.692 0 1 0 5.427-7.828zm.01 8.863a3.187 3.187 0 1 1 0-6.373 3.187 3.187 0 0 1 0 6.373z"/>
+    </svg>
+    <h1 style="margin: 0;">HubSpot Integration</h1>
+</div>
+"""
+
+ABOUT_HUBSPOT_MD = """
+**HubSpot serves as the single source of truth for opportunity data.**
+
+### What syncs from HubSpot → AMANDA:
+- Deal name, value, stage
+- Close date and pipeline
+- Associated contacts
+
+### What syncs from AMANDA → HubSpot:
+- Win Probability (pWin)
+- Gate Status (GO/NO-GO)
+- Proposal Phase
+- Compliance Coverage %
+
+### Pipeline Stage Mapping:
+
+| HubSpot Stage | AMANDA Phase | Auto-Action |
+|---------------|--------------|-------------|
+| Appointment Scheduled | Qualification | Create deal |
+| Qualified to Buy | Gate 1 | Trigger Go/No-Go |
+| Presentation Scheduled | Capture | Enable win themes |
+| Decision Maker Bought-In | Development | Unlock drafting |
+| Contract Sent | Review | Enable review cycles |
+| Closed Won | Submitted | 🎉 Aurora celebration |
+| Closed Lost | Archived | Capture lessons |
+"""
+
+CONNECTION_INSTRUCTIONS_MD = """
+**To connect HubSpot:**
+1. Go to HubSpot → Settings → Integrations → Private Apps
+2. Create a new Private App with these scopes:
+   - `crm.objects.deals.read`
+   - `crm.objects.deals.write`
+   - `crm.schemas.deals.read`
+3. Copy the Access Token below
+"""
+
+WEBHOOK_STEPS_MD = """
+**Real-time sync with HubSpot Webhooks**
+
+To receive real-time deal updates from HubSpot:
+
+1. In HubSpot, go to Settings → Integrations → Private Apps
+2. Select your AMANDA app → Webhooks
+3. Create subscription for `deal.propertyChange`
+4. Set target URL to:
+"""
+
+WEBHOOK_SECRET_STEP_MD = """
+5. Copy the Webhook Secret and add it to your environment:
+"""
+
+
 # =============================================================================
 # SESSION STATE
 # =============================================================================
@@ -155,9 +282,10 @@ def init_hubspot_state() -> None:
     defaults = {
         "hubspot_connected": False,
         "hubspot_status": None,
-        "hubspot_last_sync": None,
+        "hubspot_last_sync": None,  # epoch seconds of the last successful sync
+        "hubspot_webhook_version": 0,
         "hubspot_sync_result": None,
-        "hubspot_deals": [],
+        "hubspot_deals": deals_to_table([]),
         "hubspot_config": {
             "access_token": "",
             "portal_id": "",
@@ -174,6 +302,26 @@ def init_hubspot_state() -> None:
 # CONNECTION MANAGEMENT
 # =============================================================================
 
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _get_client(token_hash: str, _token: str) -> "HubSpotClient":
+    """
+    One HubSpotClient (and its pooled HTTPS session) per access token,
+    reused across reruns and sessions. Keyed by a hash of the token so the
+    raw secret is not part of the cache key.
+    """
+    return _connector().HubSpotClient(access_token=_token)
+
+
+def _token_hash(access_token: str) -> str:
+    """Short hash of an access token, for cache keys that must not hold the token."""
+    return hashlib.blake2b(access_token.encode(), digest_size=8).hexdigest()
+
+
+def get_client_for_token(access_token: str) -> "HubSpotClient":
+    """Get the shared client for an access token."""
+    return _get_client(_token_hash(access_token), access_token)
+
+
 def test_hubspot_connection(access_token: str) -> Dict[str, Any]:
     """
     Test HubSpot connection with provided token.
@@ -188,8 +336,7 @@ def test_hubspot_connection(access_token: str) -> Dict[str, Any]:
         return {"connected": False, "error": "HubSpot connector module not available"}
     
     try:
-        client = HubSpotClient(access_token=access_token)
-        return client.test_connection()
+        return get_client_for_token(access_token).test_connection()
     except Exception as e:
         return {"connected": False, "error": str(e)}
 
@@ -209,12 +356,18 @@ def connect_hubspot(access_token: str) -> bool:
     if status["connected"]:
         st.session_state.hubspot_connected = True
         st.session_state.hubspot_status = status
-        st.session_state.hubspot_client = HubSpotClient(access_token=access_token)
+        st.session_state.hubspot_client = get_client_for_token(access_token)
         
         # Store token securely (in production, use secrets management)
         st.session_state.hubspot_config["access_token"] = access_token
         st.session_state.hubspot_config["portal_id"] = status.get("portal_id", "")
         
+        # Hydrate from the last snapshot of this portal until the next sync
+        if st.session_state.hubspot_deals.num_rows == 0:
+            snapshot = load_deal_snapshot(str(status.get("portal_id", "")))
+            if snapshot is not None:
+                st.session_state.hubspot_deals, st.session_state.hubspot_last_sync = snapshot
+        
         return True
     
     return False
@@ -225,7 +378,7 @@ def disconnect_hubspot() -> None:
     st.session_state.hubspot_connected = False
     st.session_state.hubspot_status = None
     st.session_state.hubspot_client = None
-    st.session_state.hubspot_deals = []
+    st.session_state.hubspot_deals = deals_to_table([])
     st.session_state.hubspot_config["access_token"] = ""
 
 
@@ -233,35 +386,162 @@ def disconnect_hubspot() -> None:
 # SYNC OPERATIONS
 # =============================================================================
 
-def sync_deals_from_hubspot() -> Optional[SyncResult]:
+def deals_to_table(deals: Iterable["HubSpotDeal"]) -> pa.Table:
+    """
+    Convert deals to a columnar Arrow table, once per sync.
+    Stats, search and st.dataframe all work on the columns directly, and
+    low-cardinality columns are dictionary-encoded.
+    """
+    columns: Dict[str, list] = {name: [] for name in _DEAL_COLUMNS}
+    stage_labels: Dict[str, str] = {}  # one label string per distinct stage
+    for d in deals:
+        columns["id"].append(d.id)
+        columns["name"].append(d.name)
+        columns["agency"].append(d.amanda_agency)
+        columns["solicitation"].append(d.amanda_solicitation_number)
+        columns["amount"].append(d.amount)
+        columns["stage"].append(d.stage)
+        label = stage_labels.get(d.stage)
+        if label is None:
+            label = stage_labels[d.stage] = f"{STAGE_ICONS.get(d.stage, DEFAULT_STAGE_ICON)} {d.stage}"
+        columns["stage_label"].append(label)
+        columns["pwin"].append(d.amanda_pwin)
+        columns["gate_status"].append(d.amanda_gate_status)
+    
+    return pa.table(
+        {name: pa.array(values, type=_DEAL_COLUMNS[name]) for name, values in columns.items()}
+    )
+
+
+def deal_snapshot_path(portal_id: str) -> Path:
+    """Snapshot file for a portal, under DEAL_SNAPSHOT_DIR."""
+    safe_id = "".join(c for c in portal_id if c.isalnum()) or "unknown"
+    return DEAL_SNAPSHOT_DIR / f"hubspot_deals_{safe_id}.arrow"
+
+
+def save_deal_snapshot(deals: pa.Table, portal_id: str, synced_at: float) -> None:
+    """
+    Write the deal table to the portal's snapshot file as an Arrow IPC file,
+    tagged with its portal and sync time. Each write goes to its own temp
+    file and is renamed into place, so concurrent syncs never interleave.
+    Best effort: a failed write only costs the next cold start a refetch.
     """
-    Pull deals from HubSpot.
+    metadata = {b"portal_id": portal_id.encode(), b"synced_at": repr(synced_at).encode()}
+    path = deal_snapshot_path(portal_id)
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = deals.replace_schema_metadata(metadata)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp", delete=False
+        ) as tmp:
+            tmp_path = tmp.name
+            with pa.ipc.new_file(tmp, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def load_deal_snapshot(portal_id: str) -> Optional[tuple]:
+    """
+    Read the persisted deal table for a portal.
     
+    Args:
+        portal_id: HubSpot portal the snapshot must belong to
+        
     Returns:
-        SyncResult or None if failed
+        (deals table, synced_at epoch seconds), or None if there is no
+        usable snapshot for this portal
     """
-    if not st.session_state.hubspot_connected:
+    try:
+        with pa.memory_map(str(deal_snapshot_path(portal_id))) as source:
+            table = pa.ipc.open_file(source).read_all()
+    except (OSError, pa.ArrowInvalid):
         return None
     
-    try:
-        client = st.session_state.hubspot_client
-        deals, _ = client.list_deals(limit=100)
-        
-        st.session_state.hubspot_deals = deals
-        st.session_state.hubspot_last_sync = datetime.utcnow().isoformat()
+    metadata = table.schema.metadata or {}
+    if metadata.get(b"portal_id", b"").decode() != portal_id:
+        return None
+    if not table.schema.equals(pa.schema(_DEAL_COLUMNS)):
+        return None  # written by an older layout of the table
+    
+    return table.replace_schema_metadata(None), float(metadata[b"synced_at"])
+
+
+def _store_synced_deals(deals: pa.Table, webhook_version: int) -> None:
+    """
+    Make a freshly pulled deal table current and persist its snapshot.
+    
+    Args:
+        deals: Synced deal table
+        webhook_version: Webhook store version read before the pull started;
+            webhook changes up to it are already reflected in `deals`
+    """
+    st.session_state.hubspot_deals = deals
+    st.session_state.hubspot_webhook_version = webhook_version
+    st.session_state.hubspot_last_sync = time.time()
+    save_deal_snapshot(
+        deals,
+        str(st.session_state.hubspot_config.get("portal_id", "")),
+        st.session_state.hubspot_last_sync,
+    )
+
+
+def sync_deals_from_hubspot_stream(page_size: int = 100) -> Iterator[int]:
+    """
+    Pull deals from HubSpot page by page.
+    The SyncResult is left in `st.session_state.hubspot_sync_result`.
+    
+    Args:
+        page_size: Deals per HubSpot request (max 100)
         
-        return SyncResult(
+    Yields:
+        Number of deals fetched so far, after each page
+    """
+    if not st.session_state.hubspot_connected:
+        st.session_state.hubspot_sync_result = None
+        return
+    
+    fetched = []
+    try:
+        webhook_version = _webhook_version()
+        deals = st.session_state.hubspot_client.iter_deals(page_size=page_size)
+        for deal in islice(deals, MAX_SYNCED_DEALS):
+            fetched.append(deal)
+            if len(fetched) % page_size == 0:
+                yield len(fetched)
+        
+        table = deals_to_table(fetched)
+        _store_synced_deals(table, webhook_version)
+        st.session_state.hubspot_sync_result = _connector().SyncResult(
             success=True,
-            deals_synced=len(deals),
+            deals_synced=table.num_rows,
         )
         
     except Exception as e:
-        return SyncResult(
+        st.session_state.hubspot_sync_result = _connector().SyncResult(
             success=False,
             errors=[str(e)],
         )
 
 
+def sync_deals_from_hubspot() -> Optional["SyncResult"]:
+    """
+    Pull deals from HubSpot without progress reporting.
+    
+    Returns:
+        SyncResult or None if not connected
+    """
+    for _ in sync_deals_from_hubspot_stream():
+        pass
+    return st.session_state.hubspot_sync_result
+
+
 def push_deal_to_hubspot(deal_data: Dict) -> Optional[str]:
     """
     Push a single deal to HubSpot.
@@ -278,7 +558,7 @@ def push_deal_to_hubspot(deal_data: Dict) -> Optional[str]:
     try:
         client = st.session_state.hubspot_client
         
-        deal = HubSpotDeal(
+        deal = _connector().HubSpotDeal(
             name=deal_data.get("name", ""),
             amount=deal_data.get("value", 0),
             amanda_pwin=deal_data.get("pwin", 0),
@@ -303,6 +583,63 @@ def push_deal_to_hubspot(deal_data: Dict) -> Optional[str]:
         return None
 
 
+@st.cache_resource(show_spinner=False)
+def _webhook_store(portal_id: str, token_hash: str, _client: "HubSpotClient") -> Optional["DealStore"]:
+    """
+    Start a webhook receiver for one portal and token, if HUBSPOT_WEBHOOK_PORT
+    and HUBSPOT_WEBHOOK_SECRET are set; returns the store it writes deal
+    updates into. The port serves a single receiver per process, so a
+    second portal gets None (no live updates) rather than another portal's
+    deals.
+    """
+    if not WEBHOOK_PORT or not WEBHOOK_SECRET_SET:
+        return None
+    
+    hc = _connector()
+    store = hc.DealStore()
+    try:
+        hc.start_webhook_receiver(_client, store, int(WEBHOOK_PORT), host=WEBHOOK_HOST)
+    except (OSError, ValueError, hc.HubSpotError):
+        return None
+    return store
+
+
+def _session_webhook_store() -> Optional["DealStore"]:
+    """Webhook store for this session's portal and token (None if not running)."""
+    config = st.session_state.hubspot_config
+    return _webhook_store(
+        str(config.get("portal_id", "")),
+        _token_hash(config.get("access_token", "")),
+        st.session_state.hubspot_client,
+    )
+
+
+def _webhook_version() -> int:
+    """Current webhook store version, to pair with a sync about to start."""
+    store = _session_webhook_store()
+    return store.version if store is not None else 0
+
+
+def apply_webhook_updates() -> None:
+    """
+    Merge deals changed by webhooks since this session last looked into
+    the session's deal table, replacing only the affected rows.
+    """
+    store = _session_webhook_store()
+    if store is None:
+        return
+    
+    version, changed = store.changes_since(st.session_state.hubspot_webhook_version)
+    if not changed:
+        return
+    
+    deals = st.session_state.hubspot_deals
+    changed_ids = pa.array([d.id for d in changed], type=pa.string())
+    kept = deals.filter(pc.invert(pc.is_in(deals["id"], value_set=changed_ids)))
+    st.session_state.hubspot_deals = pa.concat_tables([kept, deals_to_table(changed)])
+    st.session_state.hubspot_webhook_version = version
+
+
 # =============================================================================
 # UI COMPONENTS
 # =============================================================================
@@ -331,15 +668,7 @@ def render_connection_form() -> None:
     st.subheader("🔧 Connection Settings")
     
     with st.form("hubspot_connection_form"):
-        st.markdown("""
-        **To connect HubSpot:**
-        1. Go to HubSpot → Settings → Integrations → Private Apps
-        2. Create a new Private App with these scopes:
-           - `crm.objects.deals.read`
-           - `crm.objects.deals.write`
-           - `crm.schemas.deals.read`
-        3. Copy the Access Token below
-        """)
+        st.markdown(CONNECTION_INSTRUCTIONS_MD)
         
         access_token = st.text_input(
             "Access Token",
@@ -362,73 +691,95 @@ def render_connection_form() -> None:
                     st.error("✗ Connection failed. Please check your access token.")
 
 
+# Elapsed-time buckets: upper bounds in seconds, and (unit size, suffix) per bucket
+_ELAPSED_BOUNDS = (60, 3600, 86400)
+_ELAPSED_UNITS = ((1, None), (60, "m"), (3600, "h"), (86400, "d"))
+
+
+def humanize_elapsed(seconds: float) -> str:
+    """Format an elapsed duration as 'Just now', '5m ago', '3h ago' or '2d ago'."""
+    unit, suffix = _ELAPSED_UNITS[bisect_right(_ELAPSED_BOUNDS, seconds)]
+    if suffix is None:
+        return "Just now"
+    return f"{int(seconds // unit)}{suffix} ago"
+
+
 def render_sync_stats() -> None:
     """Render sync statistics cards."""
     deals = st.session_state.hubspot_deals
     last_sync = st.session_state.hubspot_last_sync
     
+    # Vectorized over the stage column
+    not_lost = pc.not_equal(deals["stage"], LOST_STAGE)
+    open_deals = pc.sum(pc.and_(not_lost, pc.not_equal(deals["stage"], WON_STAGE))).as_py() or 0
+    total_value = pc.sum(pc.filter(deals["amount"], not_lost)).as_py() or 0
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.markdown(f"""
-            <div class="sync-card">
-                <div class="sync-stat">
-                    <div class="sync-stat-value">{len(deals)}</div>
-                    <div class="sync-stat-label">Total Deals</div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(SYNC_CARD_TEMPLATE.format(value=deals.num_rows, label="Total Deals", style=""), unsafe_allow_html=True)
     
     with col2:
-        open_deals = len([d for d in deals if d.stage not in ["closedwon", "closedlost"]])
-        st.markdown(f"""
-            <div class="sync-card">
-                <div class="sync-stat">
-                    <div class="sync-stat-value">{open_deals}</div>
-                    <div class="sync-stat-label">Open Deals</div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(SYNC_CARD_TEMPLATE.format(value=open_deals, label="Open Deals", style=""), unsafe_allow_html=True)
     
     with col3:
-        total_value = sum(d.amount for d in deals if d.stage not in ["closedlost"])
-        st.markdown(f"""
-            <div class="sync-card">
-                <div class="sync-stat">
-                    <div class="sync-stat-value">${total_value:,.0f}</div>
-                    <div class="sync-stat-label">Pipeline Value</div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            SYNC_CARD_TEMPLATE.format(value=f"${total_value:,.0f}", label="Pipeline Value", style=""),
+            unsafe_allow_html=True,
+        )
     
     with col4:
-        if last_sync:
-            sync_time = datetime.fromisoformat(last_sync)
-            time_ago = datetime.utcnow() - sync_time
-            if time_ago.seconds < 60:
-                time_str = "Just now"
-            elif time_ago.seconds < 3600:
-                time_str = f"{time_ago.seconds // 60}m ago"
-            else:
-                time_str = f"{time_ago.seconds // 3600}h ago"
-        else:
-            time_str = "Never"
+        time_str = humanize_elapsed(time.time() - last_sync) if last_sync else "Never"
         
-        st.markdown(f"""
-            <div class="sync-card">
-                <div class="sync-stat">
-                    <div class="sync-stat-value" style="font-size: 18px;">{time_str}</div>
-                    <div class="sync-stat-label">Last Sync</div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            SYNC_CARD_TEMPLATE.format(value=time_str, label="Last Sync", style=' style="font-size: 18px;"'),
+            unsafe_allow_html=True,
+        )
+
+
+def render_rate_limit_budget() -> None:
+    """Show how much of the HubSpot request window is left, for operators."""
+    client = st.session_state.get("hubspot_client")
+    remaining = client.rate_limit_remaining if client else None
+    if remaining is not None:
+        st.sidebar.metric("HubSpot budget", f"{remaining} req / 10s")
 
 
+def render_hubspot_ops_panel() -> None:
+    """Render API latency and projected daily API usage."""
+    client = st.session_state.get("hubspot_client")
+    if client is None:
+        return
+    
+    with st.expander("📈 Ops"):
+        stats = client.request_stats()
+        daily_share = stats["projected_daily_requests"] / stats["daily_limit"]
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric("p50 latency", f"{stats['p50_ms']:.0f} ms" if stats["p50_ms"] is not None else "—")
+        col2.metric("p95 latency", f"{stats['p95_ms']:.0f} ms" if stats["p95_ms"] is not None else "—")
+        col3.metric(
+            "Daily API budget",
+            f"{daily_share:.1%}",
+            help=f"{stats['projected_daily_requests']:,} requests/day projected from {stats['requests']:,} sent",
+        )
+        
+        if stats["recent_errors"]:
+            st.warning(f"{stats['recent_errors']} of the last {stats['recent_requests']} requests failed")
+
+
+DEAL_TABLE_COLUMNS = ("name", "agency", "solicitation", "amount", "stage_label", "pwin", "gate_status")
+
+
+@st.fragment
 def render_deals_table() -> None:
-    """Render deals from HubSpot."""
+    """
+    Render deals from HubSpot. Runs as a fragment so typing in the search
+    box reruns only the table, not the whole dashboard.
+    """
     deals = st.session_state.hubspot_deals
     
-    if not deals:
+    if deals.num_rows == 0:
         st.info("No deals synced yet. Click 'Sync Now' to pull deals from HubSpot.")
         return
     
@@ -437,47 +788,28 @@ def render_deals_table() -> None:
     # Search/filter
     search = st.text_input("🔍 Search deals", placeholder="Filter by name, agency...")
     
-    filtered_deals = deals
     if search:
-        search_lower = search.lower()
-        filtered_deals = [
-            d for d in deals
-            if search_lower in d.name.lower() or search_lower in d.amanda_agency.lower()
-        ]
-    
-    # Display deals
-    for deal in filtered_deals[:20]:  # Limit to 20 for performance
-        stage_colors = {
-            "closedwon": ("🏆", "#059669", "#DCFCE7"),
-            "closedlost": ("❌", "#DC2626", "#FEE2E2"),
-            "contractsent": ("📝", "#7C3AED", "#EDE9FE"),
-            "qualifiedtobuy": ("✓", "#2563EB", "#DBEAFE"),
-        }
-        
-        icon, color, bg = stage_colors.get(deal.stage, ("📋", "#475569", "#F1F5F9"))
-        
-        col1, col2, col3, col4, col5 = st.columns([3, 1, 1, 1, 1])
-        
-        with col1:
-            st.markdown(f"**{deal.name}**")
-            st.caption(f"{deal.amanda_agency} • {deal.amanda_solicitation_number}")
-        
-        with col2:
-            st.markdown(f"<span style='color: #059669; font-weight: 600;'>${deal.amount:,.0f}</span>", unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"<span style='background: {bg}; color: {color}; padding: 2px 8px; border-radius: 4px; font-size: 12px;'>{icon} {deal.stage}</span>", unsafe_allow_html=True)
-        
-        with col4:
-            if deal.amanda_pwin > 0:
-                st.progress(deal.amanda_pwin / 100, text=f"{deal.amanda_pwin:.0f}%")
-            else:
-                st.caption("—")
-        
-        with col5:
-            st.caption(deal.amanda_gate_status)
-        
-        st.divider()
+        deals = deals.filter(pc.or_(
+            pc.match_substring(deals["name"], search, ignore_case=True),
+            pc.match_substring(deals["agency"], search, ignore_case=True),
+        ))
+    
+    # Display deals as one table payload instead of a widget grid per row
+    st.dataframe(
+        deals,
+        use_container_width=True,
+        hide_index=True,
+        column_order=DEAL_TABLE_COLUMNS,
+        column_config={
+            "name": st.column_config.TextColumn("Deal"),
+            "agency": st.column_config.TextColumn("Agency"),
+            "solicitation": st.column_config.TextColumn("Solicitation"),
+            "amount": st.column_config.NumberColumn("Amount", format="$%,d"),
+            "stage_label": st.column_config.TextColumn("Stage"),
+            "pwin": st.column_config.ProgressColumn("pWin", min_value=0, max_value=100, format="%.0f%%"),
+            "gate_status": st.column_config.TextColumn("Gate"),
+        },
+    )
 
 
 def render_sync_actions() -> None:
@@ -486,12 +818,16 @@ def render_sync_actions() -> None:
     
     with col1:
         if st.button("🔄 Sync Now", type="primary", use_container_width=True):
-            with st.spinner("Syncing deals from HubSpot..."):
-                result = sync_deals_from_hubspot()
+            # Report progress as each page arrives
+            with st.status("Syncing deals from HubSpot...") as status:
+                for fetched in sync_deals_from_hubspot_stream():
+                    status.update(label=f"Fetched {fetched} deals...")
+                result = st.session_state.hubspot_sync_result
                 if result and result.success:
-                    st.success(f"✓ Synced {result.deals_synced} deals")
+                    status.update(label=f"✓ Synced {result.deals_synced} deals", state="complete")
                     st.rerun()
                 else:
+                    status.update(label="Sync failed", state="error")
                     st.error(f"Sync failed: {result.errors if result else 'Unknown error'}")
     
     with col2:
@@ -521,35 +857,26 @@ def render_sync_actions() -> None:
 def render_webhook_config() -> None:
     """Render webhook configuration section."""
     with st.expander("🔔 Webhook Configuration (Advanced)"):
-        st.markdown("""
-        **Real-time sync with HubSpot Webhooks**
-        
-        To receive real-time deal updates from HubSpot:
-        
-        1. In HubSpot, go to Settings → Integrations → Private Apps
-        2. Select your AMANDA app → Webhooks
-        3. Create subscription for `deal.propertyChange`
-        4. Set target URL to:
-        """)
-        
-        # Get the app URL (would come from environment in production)
-        app_url = os.getenv("APP_URL", "https://your-app.streamlit.app")
-        webhook_url = f"{app_url}/api/hubspot/webhook"
-        
-        st.code(webhook_url, language=None)
-        
-        st.markdown("""
-        5. Copy the Webhook Secret and add it to your environment:
-        """)
-        
+        st.markdown(WEBHOOK_STEPS_MD)
+        if WEBHOOK_URL:
+            st.code(WEBHOOK_URL, language=None)
+        else:
+            st.code(f"https://<public host proxied to the receiver>{WEBHOOK_PATH}", language=None)
+        if WEBHOOK_PORT:
+            st.caption(
+                f"The receiver listens on {WEBHOOK_HOST}:{WEBHOOK_PORT}; route the public "
+                "URL there and set HUBSPOT_WEBHOOK_URL to show it here."
+            )
+        else:
+            st.caption("Set HUBSPOT_WEBHOOK_PORT to start the webhook receiver.")
+        st.markdown(WEBHOOK_SECRET_STEP_MD)
         st.code("HUBSPOT_WEBHOOK_SECRET=your-webhook-secret", language="bash")
         
         # Show current webhook secret status
-        webhook_secret = os.getenv("HUBSPOT_WEBHOOK_SECRET")
-        if webhook_secret:
+        if WEBHOOK_SECRET_SET:
             st.success("✓ Webhook secret configured")
         else:
-            st.warning("⚠ Webhook secret not configured")
+            st.warning("⚠ Webhook secret not configured; the receiver will not start without it")
 
 
 # =============================================================================
@@ -563,18 +890,8 @@ def render_hubspot_dashboard() -> None:
     """
     init_hubspot_state()
     
-    # Inject styles
-    st.markdown(HUBSPOT_STYLES, unsafe_allow_html=True)
-    
-    # Header
-    st.markdown("""
-        <div class="hubspot-header">
-            <svg class="hubspot-logo" viewBox="0 0 24 24" fill="#FF7A59">
-                <path d="M18.164 7.93V5.652a2.277 2.277 0 0 0 1.31-2.054 2.293 2.293 0 0 0-4.586 0c0 .9.52 1.678 1.278 2.054V7.93a5.675 5.675 0 0 0-3.156 1.49L6.018 4.28a2.5 2.5 0 0 0 .478-1.478 2.52 2.52 0 1 0-2.52 2.52c.478 0 .92-.135 1.297-.365l6.924 5.088a5.7 5.7 0 0 0-.53 2.396c0 .862.19 1.68.53 2.413l-2.25 1.653a2.1 2.1 0 0 0-1.296-.443 2.127 2.127 0 1 0 2.127 2.127c0-.306-.068-.595-.184-.858l2.143-1.575a5.692 5.692 0 1 0 5.427-7.828zm.01 8.863a3.187 3.187 0 1 1 0-6.373 3.187 3.187 0 0 1 0 6.373z"/>
-            </svg>
-            <h1 style="margin: 0;">HubSpot Integration</h1>
-        </div>
-    """, unsafe_allow_html=True)
+    # Styles and header go out as one static element
+    st.markdown(HUBSPOT_HEADER_HTML, unsafe_allow_html=True)
     
     # Connection status
     render_connection_status()
@@ -586,8 +903,12 @@ def render_hubspot_dashboard() -> None:
         return
     
     if st.session_state.hubspot_connected:
+        # Fold in real-time updates received since the last rerun
+        apply_webhook_updates()
+        
         # Sync stats
         render_sync_stats()
+        render_rate_limit_budget()
         
         st.divider()
         
@@ -602,38 +923,16 @@ def render_hubspot_dashboard() -> None:
         # Webhook config
         render_webhook_config()
         
+        # API latency and budget
+        render_hubspot_ops_panel()
+        
     else:
         # Connection form
         render_connection_form()
         
         # Info about HubSpot integration
         with st.expander("ℹ️ About HubSpot Integration"):
-            st.markdown("""
-            **HubSpot serves as the single source of truth for opportunity data.**
-            
-            ### What syncs from HubSpot → AMANDA:
-            - Deal name, value, stage
-            - Close date and pipeline
-            - Associated contacts
-            
-            ### What syncs from AMANDA → HubSpot:
-            - Win Probability (pWin)
-            - Gate Status (GO/NO-GO)
-            - Proposal Phase
-            - Compliance Coverage %
-            
-            ### Pipeline Stage Mapping:
-            
-            | HubSpot Stage | AMANDA Phase | Auto-Action |
-            |---------------|--------------|-------------|
-            | Appointment Scheduled | Qualification | Create deal |
-            | Qualified to Buy | Gate 1 | Trigger Go/No-Go |
-            | Presentation Scheduled | Capture | Enable win themes |
-            | Decision Maker Bought-In | Development | Unlock drafting |
-            | Contract Sent | Review | Enable review cycles |
-            | Closed Won | Submitted | 🎉 Aurora celebration |
-            | Closed Lost | Archived | Capture lessons |
-            """)
+            st.markdown(ABOUT_HUBSPOT_MD)
 
 
 # =============================================================================
@@ -8,15 +8,16 @@ Version: 2.0.0
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence
 
 # =============================================================================
 # TOUR STEP DEFINITIONS
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TourStep:
-    """A single step in the onboarding tour."""
+    """A single step in the onboarding tour (immutable, shared across sessions)."""
     id: str
     title: str
     content: str
@@ -29,7 +30,7 @@ class TourStep:
 # GENERAL TOUR (All Users)
 # =============================================================================
 
-GENERAL_TOUR: list[TourStep] = [
+GENERAL_TOUR: tuple[TourStep, ...] = (
     TourStep(
         id="welcome",
         title="Welcome to AMANDA™",
@@ -157,14 +158,14 @@ Different roles see different AI assistants and features.
         highlight="none",
         tip="Click 'Finish Tour' to start exploring!"
     ),
-]
+)
 
 
 # =============================================================================
 # ROLE-SPECIFIC TOURS
 # =============================================================================
 
-CAPTURE_LEAD_TOUR: list[TourStep] = [
+CAPTURE_LEAD_TOUR: tuple[TourStep, ...] = (
     TourStep(
         id="capture_welcome",
         title="Capture Lead View",
@@ -214,9 +215,9 @@ Build your winning team from the Partners page.
         page="partners",
         highlight="partners"
     ),
-]
+)
 
-PROPOSAL_MANAGER_TOUR: list[TourStep] = [
+PROPOSAL_MANAGER_TOUR: tuple[TourStep, ...] = (
     TourStep(
         id="pm_welcome",
         title="Proposal Manager View",
@@ -265,9 +266,9 @@ Track findings, assign issues, and monitor resolution.
         page="reviews",
         highlight="reviews"
     ),
-]
+)
 
-FINANCE_TOUR: list[TourStep] = [
+FINANCE_TOUR: tuple[TourStep, ...] = (
     TourStep(
         id="finance_welcome",
         title="Finance View",
@@ -300,9 +301,9 @@ Go to AI Chat and select "Pricing Analyst" to get started.
         highlight="pricing_bot",
         tip="This is a PRIVATE assistant – only Finance, Capture Lead, COO, and Admins can see it."
     ),
-]
+)
 
-ANALYST_TOUR: list[TourStep] = [
+ANALYST_TOUR: tuple[TourStep, ...] = (
     TourStep(
         id="analyst_welcome",
         title="Analyst/Writer View",
@@ -351,14 +352,14 @@ Use these as starting points – don't reinvent the wheel!
         page="playbook",
         highlight="playbook"
     ),
-]
+)
 
 
 # =============================================================================
 # TOUR REGISTRY
 # =============================================================================
 
-ROLE_TOURS: dict[str, list[TourStep]] = {
+ROLE_TOURS: Mapping[str, Sequence[TourStep]] = MappingProxyType({
     "admin": GENERAL_TOUR,
     "coo": GENERAL_TOUR,
     "capture_lead": CAPTURE_LEAD_TOUR,
@@ -370,14 +371,15 @@ ROLE_TOURS: dict[str, list[TourStep]] = {
     "partner": GENERAL_TOUR,
     "vendor": GENERAL_TOUR,
     "consultant": GENERAL_TOUR,
-}
+})
 
 
-def get_tour_for_role(role: str) -> list[TourStep]:
+def get_tour_for_role(role: str) -> Sequence[TourStep]:
     """Get the appropriate tour for a user role."""
     return ROLE_TOURS.get(role, GENERAL_TOUR)
 
 
-def get_general_tour() -> list[TourStep]:
+def get_general_tour() -> Sequence[TourStep]:
     """Get the general tour for all users."""
     return GENERAL_TOUR
+
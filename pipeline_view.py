@@ -4,9 +4,15 @@ Visual deal board with Shipley methodology stages
 """
 
 import streamlit as st
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from bisect import bisect_right
+from datetime import date, timedelta
+from functools import lru_cache
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Any
 import json
+import sys
+import numpy as np
 
 # ============================================================================
 # SHIPLEY STAGE CONFIGURATION
@@ -23,192 +29,337 @@ SHIPLEY_STAGES = [
     {"id": "submitted", "name": "Submitted", "subtitle": "Complete", "color": "#22c55e", "icon": "✅", "order": 8},
 ]
 
+# Stage lookups by id, for O(1) access from a deal's stage
+STAGE_BY_ID = {stage["id"]: stage for stage in SHIPLEY_STAGES}
+STAGE_INDEX_BY_ID = {stage["id"]: i for i, stage in enumerate(SHIPLEY_STAGES)}
+STAGE_NAMES = [stage["name"] for stage in SHIPLEY_STAGES]
+
 PRIORITY_CONFIG = {
     "P-0": {"label": "Must Win", "color": "#dc2626", "bg": "#fef2f2", "border": "#fecaca"},
     "P-1": {"label": "Strategic", "color": "#d97706", "bg": "#fffbeb", "border": "#fde68a"},
     "P-2": {"label": "Gap Filler", "color": "#2563eb", "bg": "#eff6ff", "border": "#bfdbfe"},
 }
 
+# Keys interned so they are the same objects as PipelineDeal priorities
+PRIORITY_CONFIG = {sys.intern(priority): config for priority, config in PRIORITY_CONFIG.items()}
+
+
+def _priority_badge_html(priority: str, config: Dict[str, str]) -> str:
+    """Build the priority pill shown on deal cards."""
+    return f"""<span style="
+                background: {config['bg']};
+                color: {config['color']};
+                border: 1px solid {config['border']};
+                padding: 2px 8px;
+                border-radius: 9999px;
+                font-size: 11px;
+                font-weight: 500;
+            ">{priority}</span>"""
+
+
+# Priority pill HTML, rendered once per priority instead of once per card
+PRIORITY_BADGE_HTML = {
+    priority: _priority_badge_html(priority, config) for priority, config in PRIORITY_CONFIG.items()
+}
+
+# Stage tab banner per stage with only the pipeline value left to fill in
+STAGE_BANNER_TEMPLATES = {
+    stage["id"]: f"""
+            <div style="
+                background: linear-gradient(135deg, {stage['color']}22 0%, {stage['color']}11 100%);
+                border-left: 4px solid {stage['color']};
+                padding: 16px;
+                border-radius: 8px;
+                margin-bottom: 16px;
+            ">
+                <div style="font-weight: 600; color: #111827;">{stage['name']}</div>
+                <div style="font-size: 13px; color: #6b7280;">{stage['subtitle']}</div>
+                <div style="font-size: 14px; font-weight: 600; color: {stage['color']}; margin-top: 8px;">
+                    {{value}} pipeline value
+                </div>
+            </div>
+            """
+    for stage in SHIPLEY_STAGES
+}
+
+# Static part of each stage tab label; the deal count is appended per render
+STAGE_TAB_PREFIXES = tuple(f"{stage['icon']} {stage['name']}" for stage in SHIPLEY_STAGES)
+
+# Sort rank of each priority (unknown priorities rank after all of these)
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(PRIORITY_CONFIG)}
+
 GATE_STATUS_OPTIONS = ["GO", "CONDITIONAL GO", "PAUSE", "NO-GO"]
 
+# ============================================================================
+# DEAL RECORD
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class PipelineDeal:
+    """A deal on the pipeline board, with display fields derived once at load."""
+    id: int
+    name: str
+    client: str
+    value: float
+    pwin: int
+    stage: str
+    priority: str
+    due_date: str
+    capture_lead: str
+    compliance: int
+    gate_status: str = "GO"
+    solicitation: str = "N/A"
+    proposal_manager: str = "TBD"
+    naics: str = "N/A"
+    set_aside: str = "N/A"
+    created_at: str = ""
+    # Derived in from_dict
+    priority_cfg: Optional[Dict[str, str]] = field(default=None, repr=False, compare=False)
+    is_p0: bool = field(default=False, repr=False, compare=False)
+    due: Optional[date] = field(default=None, repr=False, compare=False)  # None if malformed
+    search_text: str = field(default="", repr=False, compare=False)  # lowercased name + client
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PipelineDeal":
+        """Build a record from a deal dict, ignoring unknown keys."""
+        values = {name: data[name] for name in _DEAL_FIELDS if name in data}
+        # Low-cardinality keys are interned so dict lookups and == checks
+        # short-circuit on identity; this holds because the board shares
+        # these records via cache_resource instead of unpickling copies
+        priority = values["priority"] = sys.intern(values["priority"])
+        values["stage"] = sys.intern(values["stage"])
+        values["gate_status"] = sys.intern(values.get("gate_status", "GO"))
+        try:
+            due = _parse_due(values["due_date"])
+        except (TypeError, ValueError):
+            due = None
+        return cls(
+            **values,
+            priority_cfg=PRIORITY_CONFIG.get(priority, PRIORITY_CONFIG["P-2"]),
+            is_p0=priority == "P-0",
+            due=due,
+            # NUL separator keeps a query from matching across name and client
+            search_text=f"{values['name']}\0{values['client']}".lower(),
+        )
+
+
+# Input fields accepted by PipelineDeal.from_dict
+_DEAL_FIELDS = tuple(
+    f.name for f in fields(PipelineDeal) if f.name not in ("priority_cfg", "is_p0", "due", "search_text")
+)
+
 # ============================================================================
 # SAMPLE DATA (Replace with database queries in production)
 # ============================================================================
 
+# Due dates are stored as offsets in days from today ("_due_offset")
+_SAMPLE_DEALS_TEMPLATE = (
+    {
+        "id": 1, 
+        "name": "VA EHR Modernization", 
+        "client": "Dept of Veterans Affairs",
+        "solicitation": "36C10X24R0001",
+        "value": 45000000, 
+        "pwin": 75, 
+        "stage": "red", 
+        "priority": "P-0",
+        "gate_status": "GO",
+        "_due_offset": 26,
+        "capture_lead": "Sarah Chen",
+        "proposal_manager": "Mike Rodriguez",
+        "compliance": 92,
+        "created_at": "2024-11-15",
+        "naics": "541512",
+        "set_aside": "SDVOSB"
+    },
+    {
+        "id": 2, 
+        "name": "DHA Telehealth Platform", 
+        "client": "Defense Health Agency",
+        "solicitation": "HT0015-24-R-0042",
+        "value": 28000000, 
+        "pwin": 60, 
+        "stage": "pink", 
+        "priority": "P-1",
+        "gate_status": "GO",
+        "_due_offset": 40,
+        "capture_lead": "Mike Rodriguez",
+        "proposal_manager": "Sarah Chen",
+        "compliance": 78,
+        "created_at": "2024-12-01",
+        "naics": "541519",
+        "set_aside": "8(a)"
+    },
+    {
+        "id": 3, 
+        "name": "CMS Data Analytics", 
+        "client": "Centers for Medicare",
+        "solicitation": "75FCMC24R0089",
+        "value": 15000000, 
+        "pwin": 45, 
+        "stage": "blue", 
+        "priority": "P-1",
+        "gate_status": "CONDITIONAL GO",
+        "_due_offset": 80,
+        "capture_lead": "Sarah Chen",
+        "proposal_manager": "James Wilson",
+        "compliance": 65,
+        "created_at": "2024-12-10",
+        "naics": "541512",
+        "set_aside": "Small Business"
+    },
+    {
+        "id": 4, 
+        "name": "FDA Cloud Migration", 
+        "client": "Food & Drug Admin",
+        "solicitation": "FDA-SOL-1234567",
+        "value": 8500000, 
+        "pwin": 80, 
+        "stage": "gold", 
+        "priority": "P-0",
+        "gate_status": "GO",
+        "_due_offset": 10,
+        "capture_lead": "James Wilson",
+        "proposal_manager": "Maria Santos",
+        "compliance": 98,
+        "created_at": "2024-10-20",
+        "naics": "541519",
+        "set_aside": "WOSB"
+    },
+    {
+        "id": 5, 
+        "name": "IHS Patient Portal", 
+        "client": "Indian Health Service",
+        "solicitation": "IHS-RFP-2024-0156",
+        "value": 12000000, 
+        "pwin": 55, 
+        "stage": "kickoff", 
+        "priority": "P-2",
+        "gate_status": "GO",
+        "_due_offset": 59,
+        "capture_lead": "Maria Santos",
+        "proposal_manager": "Sarah Chen",
+        "compliance": 45,
+        "created_at": "2025-01-05",
+        "naics": "541511",
+        "set_aside": "Indian Economic Enterprise"
+    },
+    {
+        "id": 6, 
+        "name": "NIH Research Platform", 
+        "client": "National Institutes of Health",
+        "solicitation": "NIHOD2024000789",
+        "value": 22000000, 
+        "pwin": 70, 
+        "stage": "gate1", 
+        "priority": "P-1",
+        "gate_status": "GO",
+        "_due_offset": 100,
+        "capture_lead": "Mike Rodriguez",
+        "proposal_manager": "James Wilson",
+        "compliance": 30,
+        "created_at": "2025-01-10",
+        "naics": "541715",
+        "set_aside": "Full & Open"
+    },
+    {
+        "id": 7, 
+        "name": "SAMHSA Mental Health", 
+        "client": "SAMHSA",
+        "solicitation": "SAMHSA-2024-MH-001",
+        "value": 9000000, 
+        "pwin": 85, 
+        "stage": "whiteglove", 
+        "priority": "P-0",
+        "gate_status": "GO",
+        "_due_offset": 5,
+        "capture_lead": "Sarah Chen",
+        "proposal_manager": "Maria Santos",
+        "compliance": 100,
+        "created_at": "2024-09-15",
+        "naics": "541611",
+        "set_aside": "SDVOSB"
+    },
+    {
+        "id": 8, 
+        "name": "CDC Surveillance System", 
+        "client": "CDC",
+        "solicitation": "CDC-RFP-2025-0023",
+        "value": 35000000, 
+        "pwin": 40, 
+        "stage": "gate1", 
+        "priority": "P-2",
+        "gate_status": "PAUSE",
+        "_due_offset": 150,
+        "capture_lead": "James Wilson",
+        "proposal_manager": "Mike Rodriguez",
+        "compliance": 15,
+        "created_at": "2025-01-15",
+        "naics": "541512",
+        "set_aside": "Small Business"
+    },
+    {
+        "id": 9, 
+        "name": "ACF Case Management", 
+        "client": "Admin for Children & Families",
+        "solicitation": "ACF-OTPS-2024-0089",
+        "value": 6000000, 
+        "pwin": 90, 
+        "stage": "submitted", 
+        "priority": "P-1",
+        "gate_status": "GO",
+        "_due_offset": -5,
+        "capture_lead": "Maria Santos",
+        "proposal_manager": "Sarah Chen",
+        "compliance": 100,
+        "created_at": "2024-08-01",
+        "naics": "541611",
+        "set_aside": "WOSB"
+    },
+)
+
+
 def get_sample_deals() -> List[Dict[str, Any]]:
     """Return sample deal data for demonstration."""
-    return [
-        {
-            "id": 1, 
-            "name": "VA EHR Modernization", 
-            "client": "Dept of Veterans Affairs",
-            "solicitation": "36C10X24R0001",
-            "value": 45000000, 
-            "pwin": 75, 
-            "stage": "red", 
-            "priority": "P-0",
-            "gate_status": "GO",
-            "due_date": (datetime.now() + timedelta(days=26)).strftime("%Y-%m-%d"),
-            "capture_lead": "Sarah Chen",
-            "proposal_manager": "Mike Rodriguez",
-            "compliance": 92,
-            "created_at": "2024-11-15",
-            "naics": "541512",
-            "set_aside": "SDVOSB"
-        },
-        {
-            "id": 2, 
-            "name": "DHA Telehealth Platform", 
-            "client": "Defense Health Agency",
-            "solicitation": "HT0015-24-R-0042",
-            "value": 28000000, 
-            "pwin": 60, 
-            "stage": "pink", 
-            "priority": "P-1",
-            "gate_status": "GO",
-            "due_date": (datetime.now() + timedelta(days=40)).strftime("%Y-%m-%d"),
-            "capture_lead": "Mike Rodriguez",
-            "proposal_manager": "Sarah Chen",
-            "compliance": 78,
-            "created_at": "2024-12-01",
-            "naics": "541519",
-            "set_aside": "8(a)"
-        },
-        {
-            "id": 3, 
-            "name": "CMS Data Analytics", 
-            "client": "Centers for Medicare",
-            "solicitation": "75FCMC24R0089",
-            "value": 15000000, 
-            "pwin": 45, 
-            "stage": "blue", 
-            "priority": "P-1",
-            "gate_status": "CONDITIONAL GO",
-            "due_date": (datetime.now() + timedelta(days=80)).strftime("%Y-%m-%d"),
-            "capture_lead": "Sarah Chen",
-            "proposal_manager": "James Wilson",
-            "compliance": 65,
-            "created_at": "2024-12-10",
-            "naics": "541512",
-            "set_aside": "Small Business"
-        },
-        {
-            "id": 4, 
-            "name": "FDA Cloud Migration", 
-            "client": "Food & Drug Admin",
-            "solicitation": "FDA-SOL-1234567",
-            "value": 8500000, 
-            "pwin": 80, 
-            "stage": "gold", 
-            "priority": "P-0",
-            "gate_status": "GO",
-            "due_date": (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d"),
-            "capture_lead": "James Wilson",
-            "proposal_manager": "Maria Santos",
-            "compliance": 98,
-            "created_at": "2024-10-20",
-            "naics": "541519",
-            "set_aside": "WOSB"
-        },
-        {
-            "id": 5, 
-            "name": "IHS Patient Portal", 
-            "client": "Indian Health Service",
-            "solicitation": "IHS-RFP-2024-0156",
-            "value": 12000000, 
-            "pwin": 55, 
-            "stage": "kickoff", 
-            "priority": "P-2",
-            "gate_status": "GO",
-            "due_date": (datetime.now() + timedelta(days=59)).strftime("%Y-%m-%d"),
-            "capture_lead": "Maria Santos",
-            "proposal_manager": "Sarah Chen",
-            "compliance": 45,
-            "created_at": "2025-01-05",
-            "naics": "541511",
-            "set_aside": "Indian Economic Enterprise"
-        },
-        {
-            "id": 6, 
-            "name": "NIH Research Platform", 
-            "client": "National Institutes of Health",
-            "solicitation": "NIHOD2024000789",
-            "value": 22000000, 
-            "pwin": 70, 
-            "stage": "gate1", 
-            "priority": "P-1",
-            "gate_status": "GO",
-            "due_date": (datetime.now() + timedelta(days=100)).strftime("%Y-%m-%d"),
-            "capture_lead": "Mike Rodriguez",
-            "proposal_manager": "James Wilson",
-            "compliance": 30,
-            "created_at": "2025-01-10",
-            "naics": "541715",
-            "set_aside": "Full & Open"
-        },
-        {
-            "id": 7, 
-            "name": "SAMHSA Mental Health", 
-            "client": "SAMHSA",
-            "solicitation": "SAMHSA-2024-MH-001",
-            "value": 9000000, 
-            "pwin": 85, 
-            "stage": "whiteglove", 
-            "priority": "P-0",
-            "gate_status": "GO",
-            "due_date": (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d"),
-            "capture_lead": "Sarah Chen",
-            "proposal_manager": "Maria Santos",
-            "compliance": 100,
-            "created_at": "2024-09-15",
-            "naics": "541611",
-            "set_aside": "SDVOSB"
-        },
-        {
-            "id": 8, 
-            "name": "CDC Surveillance System", 
-            "client": "CDC",
-            "solicitation": "CDC-RFP-2025-0023",
-            "value": 35000000, 
-            "pwin": 40, 
-            "stage": "gate1", 
-            "priority": "P-2",
-            "gate_status": "PAUSE",
-            "due_date": (datetime.now() + timedelta(days=150)).strftime("%Y-%m-%d"),
-            "capture_lead": "James Wilson",
-            "proposal_manager": "Mike Rodriguez",
-            "compliance": 15,
-            "created_at": "2025-01-15",
-            "naics": "541512",
-            "set_aside": "Small Business"
-        },
-        {
-            "id": 9, 
-            "name": "ACF Case Management", 
-            "client": "Admin for Children & Families",
-            "solicitation": "ACF-OTPS-2024-0089",
-            "value": 6000000, 
-            "pwin": 90, 
-            "stage": "submitted", 
-            "priority": "P-1",
-            "gate_status": "GO",
-            "due_date": (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d"),
-            "capture_lead": "Maria Santos",
-            "proposal_manager": "Sarah Chen",
-            "compliance": 100,
-            "created_at": "2024-08-01",
-            "naics": "541611",
-            "set_aside": "WOSB"
-        },
-    ]
+    return _sample_deals(date.today().isoformat())
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _sample_deals(today: str) -> List[Dict[str, Any]]:
+    """
+    Build the sample deals once per day. Due dates are relative to `today`,
+    which is the cache key, so reruns on the same day reuse the result.
+    """
+    base = date.fromisoformat(today)
+    deals = []
+    for template in _SAMPLE_DEALS_TEMPLATE:
+        deal = dict(template)
+        deal["due_date"] = (base + timedelta(days=deal.pop("_due_offset"))).isoformat()
+        deals.append(deal)
+    return deals
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def normalize_deals(deals: List[Dict]) -> List[PipelineDeal]:
+    """
+    Convert raw deal dicts to PipelineDeal records once at load, so renders
+    read derived fields instead of recomputing them per card.
+    
+    Args:
+        deals: Deal dictionaries
+        
+    Returns:
+        PipelineDeal records in the same order
+    """
+    return [PipelineDeal.from_dict(d) for d in deals]
+
+
+@lru_cache(maxsize=256)
 def format_currency(value: float) -> str:
-    """Format value as currency string."""
+    """Format value as currency string (memoized; values repeat every rerun)."""
     if value >= 1_000_000:
         return f"${value / 1_000_000:.1f}M"
     elif value >= 1_000:
@@ -216,44 +367,132 @@ def format_currency(value: float) -> str:
     return f"${value:,.0f}"
 
 
-def days_until(date_str: str) -> int:
-    """Calculate days until a date."""
-    try:
-        due_date = datetime.strptime(date_str, "%Y-%m-%d")
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        return (due_date - today).days
-    except:
-        return 999
+@lru_cache(maxsize=512)
+def _parse_due(date_str: str) -> date:
+    """Parse a YYYY-MM-DD due date (memoized; due dates repeat across renders)."""
+    return date.fromisoformat(date_str)
+
+
+@lru_cache(maxsize=1)
+def _today() -> date:
+    """Today's date; cleared at the start of each pipeline render."""
+    return date.today()
+
+
+def days_until_deal(deal: PipelineDeal) -> int:
+    """Days until a deal is due (999 if it has no valid due date)."""
+    due = deal.due
+    return (due - _today()).days if due is not None else 999
+
+
+# Red / amber / green, indexed by how many thresholds a value reaches
+_STATUS_COLORS = ("#ef4444", "#f59e0b", "#22c55e")
+_PWIN_THRESHOLDS = (50, 70)
+_COMPLIANCE_THRESHOLDS = (70, 95)
 
 
 def get_pwin_color(pwin: int) -> str:
     """Get color based on pWin value."""
-    if pwin >= 70:
-        return "#22c55e"  # Green
-    elif pwin >= 50:
-        return "#f59e0b"  # Amber
-    return "#ef4444"  # Red
+    return _STATUS_COLORS[bisect_right(_PWIN_THRESHOLDS, pwin)]
 
 
 def get_compliance_color(compliance: int) -> str:
     """Get color based on compliance percentage."""
-    if compliance >= 95:
-        return "#22c55e"  # Green
-    elif compliance >= 70:
-        return "#f59e0b"  # Amber
-    return "#ef4444"  # Red
+    return _STATUS_COLORS[bisect_right(_COMPLIANCE_THRESHOLDS, compliance)]
 
 
 # ============================================================================
 # UI COMPONENTS
 # ============================================================================
 
-def render_stats_bar(deals: List[Dict]) -> None:
-    """Render the top statistics bar."""
-    total_value = sum(d["value"] for d in deals)
-    avg_pwin = round(sum(d["pwin"] for d in deals) / len(deals)) if deals else 0
-    urgent_count = sum(1 for d in deals if days_until(d["due_date"]) <= 7)
-    p0_count = sum(1 for d in deals if d["priority"] == "P-0")
+def deals_to_columns(deals: Sequence[PipelineDeal]) -> Dict[str, np.ndarray]:
+    """
+    Convert deals to one NumPy array per field used in aggregates,
+    so stats and per-stage totals are computed in C rather than per deal.
+    
+    Args:
+        deals: Pipeline deals
+        
+    Returns:
+        Arrays keyed "value", "pwin", "due_days", "is_p0" and "stage_idx"
+        (position in SHIPLEY_STAGES, or len(SHIPLEY_STAGES) if unknown)
+    """
+    n = len(deals)
+    unknown_stage = len(SHIPLEY_STAGES)
+    return {
+        "value": np.fromiter((d.value for d in deals), dtype=np.float64, count=n),
+        "pwin": np.fromiter((d.pwin for d in deals), dtype=np.float64, count=n),
+        "due_days": np.fromiter((days_until_deal(d) for d in deals), dtype=np.int64, count=n),
+        "is_p0": np.fromiter((d.is_p0 for d in deals), dtype=bool, count=n),
+        "stage_idx": np.fromiter(
+            (STAGE_INDEX_BY_ID.get(d.stage, unknown_stage) for d in deals), dtype=np.int64, count=n
+        ),
+    }
+
+
+def board_order_key(deal: PipelineDeal) -> tuple[int, int, int]:
+    """Sort key for board order: stage, then priority, then days until due."""
+    return (
+        STAGE_INDEX_BY_ID.get(deal.stage, len(SHIPLEY_STAGES)),
+        PRIORITY_RANK.get(deal.priority, len(PRIORITY_RANK)),
+        days_until_deal(deal),
+    )
+
+
+def bucket_by_stage(
+    deals: Sequence[PipelineDeal], columns: Dict[str, np.ndarray]
+) -> tuple[Sequence[PipelineDeal], ...]:
+    """
+    Group deals by stage by cutting the list at stage boundaries. Deals must
+    already be in board_order_key order (filtering keeps that order), so
+    no sort runs here.
+    
+    Args:
+        deals: Pipeline deals in board order
+        columns: deals_to_columns output for the same deals
+        
+    Returns:
+        One slice per entry in SHIPLEY_STAGES, in board order (deals in
+        unknown stages are dropped)
+    """
+    bounds = np.searchsorted(columns["stage_idx"], np.arange(len(SHIPLEY_STAGES) + 1))
+    return tuple(deals[start:end] for start, end in zip(bounds[:-1], bounds[1:]))
+
+
+def board_stats(columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """
+    Compute every board aggregate in one place, so the stats bar and the
+    stage tabs read precomputed numbers instead of re-scanning the deals.
+    
+    Args:
+        columns: deals_to_columns output for the filtered deals
+        
+    Returns:
+        Dict with "count", "total", "avg_pwin", "urgent", "p0" and
+        "stage_totals" (pipeline value per SHIPLEY_STAGES position)
+    """
+    deal_count = len(columns["value"])
+    # The extra slot collects unknown stages and is dropped
+    stage_totals = np.bincount(
+        columns["stage_idx"], weights=columns["value"], minlength=len(SHIPLEY_STAGES) + 1
+    )
+    return {
+        "count": deal_count,
+        "total": float(columns["value"].sum()),
+        "avg_pwin": round(float(columns["pwin"].mean())) if deal_count else 0,
+        "urgent": int((columns["due_days"] <= 7).sum()),
+        "p0": int(columns["is_p0"].sum()),
+        "stage_totals": tuple(stage_totals[:len(SHIPLEY_STAGES)].tolist()),
+    }
+
+
+def render_stats_bar(stats: Mapping[str, Any]) -> None:
+    """Render the top statistics bar from board_stats output."""
+    deal_count = stats["count"]
+    total_value = stats["total"]
+    avg_pwin = stats["avg_pwin"]
+    urgent_count = stats["urgent"]
+    p0_count = stats["p0"]
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -261,7 +500,7 @@ def render_stats_bar(deals: List[Dict]) -> None:
         st.metric(
             label="💰 Pipeline Value",
             value=format_currency(total_value),
-            delta=f"{len(deals)} opportunities"
+            delta=f"{deal_count} opportunities"
         )
     
     with col2:
@@ -287,14 +526,8 @@ def render_stats_bar(deals: List[Dict]) -> None:
         )
 
 
-def render_deal_card(deal: Dict, stage_color: str) -> None:
-    """Render a single deal card."""
-    priority_config = PRIORITY_CONFIG.get(deal["priority"], PRIORITY_CONFIG["P-2"])
-    days = days_until(deal["due_date"])
-    is_urgent = days <= 7
-    
-    # Card container with custom styling
-    card_style = f"""
+# Deal card markup; build_deal_card_html fills in the per-deal fields
+DEAL_CARD_TEMPLATE = """
     <div style="
         background: white;
         border-radius: 12px;
@@ -307,36 +540,28 @@ def render_deal_card(deal: Dict, stage_color: str) -> None:
         <!-- Header -->
         <div style="margin-bottom: 12px;">
             <div style="font-weight: 600; color: #111827; font-size: 14px; margin-bottom: 4px;">
-                {deal['name']}
+                {name}
             </div>
             <div style="font-size: 12px; color: #6b7280;">
-                {deal['client']}
+                {client}
             </div>
         </div>
         
         <!-- Priority & Value -->
         <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 12px;">
-            <span style="
-                background: {priority_config['bg']};
-                color: {priority_config['color']};
-                border: 1px solid {priority_config['border']};
-                padding: 2px 8px;
-                border-radius: 9999px;
-                font-size: 11px;
-                font-weight: 500;
-            ">{deal['priority']}</span>
+            {priority_badge}
             <span style="font-weight: 600; color: #111827; font-size: 14px;">
-                {format_currency(deal['value'])}
+                {value}
             </span>
         </div>
         
         <!-- Stats -->
         <div style="display: flex; gap: 16px; font-size: 12px; color: #6b7280; margin-bottom: 12px;">
-            <span style="color: {get_pwin_color(deal['pwin'])}; font-weight: 500;">
-                📈 {deal['pwin']}% pWin
+            <span style="color: {pwin_color}; font-weight: 500;">
+                📈 {pwin}% pWin
             </span>
-            <span style="color: {'#ef4444' if is_urgent else '#6b7280'}; font-weight: {'600' if is_urgent else '400'};">
-                📅 {days}d {'⚠️' if is_urgent else ''}
+            <span style="color: {due_color}; font-weight: {due_weight};">
+                📅 {days}d {due_flag}
             </span>
         </div>
         
@@ -344,15 +569,15 @@ def render_deal_card(deal: Dict, stage_color: str) -> None:
         <div style="margin-bottom: 12px;">
             <div style="display: flex; justify-content: space-between; font-size: 11px; margin-bottom: 4px;">
                 <span style="color: #6b7280;">Compliance</span>
-                <span style="color: {get_compliance_color(deal['compliance'])}; font-weight: 500;">
-                    {deal['compliance']}%
+                <span style="color: {compliance_color}; font-weight: 500;">
+                    {compliance}%
                 </span>
             </div>
             <div style="height: 6px; background: #f3f4f6; border-radius: 9999px; overflow: hidden;">
                 <div style="
                     height: 100%;
-                    width: {deal['compliance']}%;
-                    background: {get_compliance_color(deal['compliance'])};
+                    width: {compliance}%;
+                    background: {compliance_color};
                     border-radius: 9999px;
                 "></div>
             </div>
@@ -368,7 +593,7 @@ def render_deal_card(deal: Dict, stage_color: str) -> None:
             font-size: 12px;
         ">
             <span style="color: #6b7280;">
-                👤 {deal['capture_lead'].split()[0]}
+                👤 {capture_lead}
             </span>
             <span style="
                 background: {stage_color};
@@ -378,96 +603,81 @@ def render_deal_card(deal: Dict, stage_color: str) -> None:
             "></span>
         </div>
     </div>
+"""
+
+# (color, font weight, flag) of the due-days label, keyed by is_urgent
+_DUE_STYLES = {True: ("#ef4444", "600", "⚠️"), False: ("#6b7280", "400", "")}
+
+
+def build_deal_card_html(deal: PipelineDeal, stage_color: str) -> str:
+    """Build the HTML for a single deal card."""
+    priority_badge = PRIORITY_BADGE_HTML.get(deal.priority)
+    if priority_badge is None:
+        priority_badge = _priority_badge_html(deal.priority, deal.priority_cfg)
+    days = days_until_deal(deal)
+    due_color, due_weight, due_flag = _DUE_STYLES[days <= 7]
+    compliance = deal.compliance
+    
+    return DEAL_CARD_TEMPLATE.format(
+        name=deal.name,
+        client=deal.client,
+        priority_badge=priority_badge,
+        value=format_currency(deal.value),
+        pwin=deal.pwin,
+        pwin_color=get_pwin_color(deal.pwin),
+        days=days,
+        due_color=due_color,
+        due_weight=due_weight,
+        due_flag=due_flag,
+        compliance=compliance,
+        compliance_color=get_compliance_color(compliance),
+        capture_lead=deal.capture_lead.split()[0],
+        stage_color=stage_color,
+    )
+
+
+def _select_deal(deal: PipelineDeal) -> None:
+    """Button callback: open the detail panel for a deal."""
+    st.session_state.selected_deal = deal
+
+
+def render_deal_card(deal: PipelineDeal, stage_color: str, lead_html: str = "") -> None:
     """
+    Render a single deal card.
     
-    st.markdown(card_style, unsafe_allow_html=True)
+    Args:
+        deal: Deal to render
+        stage_color: Stage accent color
+        lead_html: Markup emitted in the same element ahead of the card
+            (e.g. the stage banner), saving a separate markdown call
+    """
+    st.markdown(lead_html + build_deal_card_html(deal, stage_color), unsafe_allow_html=True)
     
-    # Add view button
-    if st.button(f"📋 View Details", key=f"view_{deal['id']}", use_container_width=True):
-        st.session_state.selected_deal = deal
+    # View button selects via callback, before the next run starts
+    st.button(
+        "📋 View Details",
+        key=f"view_{deal.id}",
+        width="stretch",
+        on_click=_select_deal,
+        args=(deal,),
+    )
 
 
-def render_stage_column(stage: Dict, deals: List[Dict]) -> None:
-    """Render a single stage column with its deals."""
-    total_value = sum(d["value"] for d in deals)
-    
-    # Column header
-    st.markdown(f"""
-    <div style="
-        display: flex;
-        align-items: center;
-        gap: 12px;
-        margin-bottom: 16px;
-    ">
-        <div style="
-            width: 40px;
-            height: 40px;
-            background: {stage['color']};
-            border-radius: 10px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 20px;
-        ">{stage['icon']}</div>
-        <div>
-            <div style="display: flex; align-items: center; gap: 8px;">
-                <span style="font-weight: 600; color: #111827;">{stage['name']}</span>
-                <span style="
-                    background: #e5e7eb;
-                    color: #374151;
-                    padding: 2px 8px;
-                    border-radius: 9999px;
-                    font-size: 12px;
-                    font-weight: 500;
-                ">{len(deals)}</span>
-            </div>
-            <div style="font-size: 12px; color: #6b7280;">{stage['subtitle']}</div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Pipeline value for this stage
-    st.markdown(f"""
-    <div style="
-        background: white;
-        border-radius: 8px;
-        padding: 12px;
-        margin-bottom: 16px;
-        border: 1px solid #e5e7eb;
-    ">
-        <div style="display: flex; justify-content: space-between; align-items: center;">
-            <span style="font-size: 12px; color: #6b7280;">Pipeline Value</span>
-            <span style="font-weight: 700; color: #111827;">{format_currency(total_value)}</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Deal cards
-    for deal in deals:
-        render_deal_card(deal, stage["color"])
-    
-    # Empty state
-    if not deals:
-        st.markdown("""
-        <div style="
-            text-align: center;
-            padding: 32px 16px;
-            color: #9ca3af;
-        ">
-            <div style="font-size: 32px; margin-bottom: 8px;">📄</div>
-            <div style="font-size: 14px;">No deals in this stage</div>
-        </div>
-        """, unsafe_allow_html=True)
+# Row labels of the detail panel tables
+DETAIL_FIELD_LABELS = ("Priority", "Gate Status", "Solicitation", "NAICS", "Set-Aside", "Due Date")
+TEAM_ROLE_LABELS = ("Capture Lead", "Proposal Manager")
 
 
-def render_deal_detail_modal(deal: Dict) -> None:
-    """Render deal detail in an expander (modal simulation)."""
-    if not deal:
-        return
-    
-    stage = next((s for s in SHIPLEY_STAGES if s["id"] == deal["stage"]), SHIPLEY_STAGES[0])
-    priority_config = PRIORITY_CONFIG.get(deal["priority"], PRIORITY_CONFIG["P-2"])
-    days = days_until(deal["due_date"])
+@st.fragment
+def render_deal_detail_modal(deal: PipelineDeal) -> None:
+    """
+    Render deal detail in an expander (modal simulation). Runs as a
+    fragment, so its widgets rerun only the detail panel. Callers only
+    invoke it when a deal is selected.
+    """
+    stage = STAGE_BY_ID.get(deal.stage, SHIPLEY_STAGES[0])
+    priority_config = deal.priority_cfg
+    days = days_until_deal(deal)
     
     st.markdown("---")
     st.markdown(f"""
@@ -482,21 +692,21 @@ def render_deal_detail_modal(deal: Dict) -> None:
             <span style="font-size: 20px;">{stage['icon']}</span>
             <span>{stage['name']} • {stage['subtitle']}</span>
         </div>
-        <h2 style="margin: 0 0 8px 0; font-size: 24px;">{deal['name']}</h2>
-        <p style="margin: 0; opacity: 0.9;">{deal['client']}</p>
+        <h2 style="margin: 0 0 8px 0; font-size: 24px;">{deal.name}</h2>
+        <p style="margin: 0; opacity: 0.9;">{deal.client}</p>
     </div>
     """, unsafe_allow_html=True)
     
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("💰 Contract Value", format_currency(deal['value']))
+        st.metric("💰 Contract Value", format_currency(deal.value))
     with col2:
-        st.metric("📈 Win Probability", f"{deal['pwin']}%")
+        st.metric("📈 Win Probability", f"{deal.pwin}%")
     with col3:
         st.metric("📅 Days to Submit", f"{days}d")
     with col4:
-        st.metric("✅ Compliance", f"{deal['compliance']}%")
+        st.metric("✅ Compliance", f"{deal.compliance}%")
     
     st.markdown("---")
     
@@ -505,28 +715,35 @@ def render_deal_detail_modal(deal: Dict) -> None:
     
     with col1:
         st.markdown("#### Opportunity Details")
-        st.markdown(f"""
-        | Field | Value |
-        |-------|-------|
-        | **Priority** | {deal['priority']} - {priority_config['label']} |
-        | **Gate Status** | {deal.get('gate_status', 'GO')} |
-        | **Solicitation** | {deal.get('solicitation', 'N/A')} |
-        | **NAICS** | {deal.get('naics', 'N/A')} |
-        | **Set-Aside** | {deal.get('set_aside', 'N/A')} |
-        | **Due Date** | {deal['due_date']} |
-        """)
+        st.dataframe(
+            {
+                "Field": DETAIL_FIELD_LABELS,
+                "Value": [
+                    f"{deal.priority} - {priority_config['label']}",
+                    deal.gate_status,
+                    deal.solicitation,
+                    deal.naics,
+                    deal.set_aside,
+                    deal.due_date,
+                ],
+            },
+            hide_index=True,
+            width="stretch",
+        )
     
     with col2:
         st.markdown("#### Team")
-        st.markdown(f"""
-        | Role | Assigned |
-        |------|----------|
-        | **Capture Lead** | {deal['capture_lead']} |
-        | **Proposal Manager** | {deal.get('proposal_manager', 'TBD')} |
-        """)
+        st.dataframe(
+            {
+                "Role": TEAM_ROLE_LABELS,
+                "Assigned": [deal.capture_lead, deal.proposal_manager],
+            },
+            hide_index=True,
+            width="stretch",
+        )
         
         st.markdown("#### Compliance Progress")
-        compliance = deal['compliance']
+        compliance = deal.compliance
         st.progress(compliance / 100)
         if compliance < 95:
             st.warning(f"⚠️ Below 95% threshold. Review compliance items before advancing.")
@@ -543,9 +760,8 @@ def render_deal_detail_modal(deal: Dict) -> None:
         if st.button("✏️ Edit Deal", use_container_width=True):
             st.info("Edit functionality coming soon")
     with col3:
-        stage_names = [s["name"] for s in SHIPLEY_STAGES]
-        current_idx = next((i for i, s in enumerate(SHIPLEY_STAGES) if s["id"] == deal["stage"]), 0)
-        new_stage = st.selectbox("Move to Stage", stage_names, index=current_idx, key="move_stage")
+        current_idx = STAGE_INDEX_BY_ID.get(deal.stage, 0)
+        new_stage = st.selectbox("Move to Stage", STAGE_NAMES, index=current_idx, key="move_stage")
     with col4:
         if st.button("❌ Close", use_container_width=True):
             st.session_state.selected_deal = None
@@ -556,9 +772,66 @@ def render_deal_detail_modal(deal: Dict) -> None:
 # MAIN PIPELINE VIEW
 # ============================================================================
 
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _board_deals(today: str) -> tuple[PipelineDeal, ...]:
+    """
+    Load and normalize the day's deals, sorted once into board order so
+    filter changes never re-sort. A shared resource rather than cache_data:
+    the records are immutable, and pickling them per rerun would copy every
+    deal and lose the interned strings.
+    
+    Args:
+        today: ISO date the sample due dates and day counts are relative to
+        
+    Returns:
+        PipelineDeal records sorted by board_order_key
+    """
+    return tuple(sorted(normalize_deals(_sample_deals(today)), key=board_order_key))
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _load_board(
+    today: str, priority: str, search: str
+) -> tuple[tuple[PipelineDeal, ...], Mapping[str, Any], tuple[Sequence[PipelineDeal], ...]]:
+    """
+    Load deals (replace with database query in production), apply the
+    priority and search filters, and group them for the board. Cached on
+    the day and the filter inputs, so reruns that change neither (tab
+    clicks, opening a deal) skip the work. Results are shared read-only
+    across sessions, like _board_deals.
+    
+    Args:
+        today: ISO date the sample due dates and day counts are relative to
+        priority: Priority filter value ("All" for no filter)
+        search: Search text matched against deal name and client
+        
+    Returns:
+        (filtered deals, their board_stats, bucket_by_stage output)
+    """
+    # Priority and search filters in one pass
+    any_priority = priority == "All"
+    search_lower = search.lower()
+    filtered_deals = tuple(
+        d for d in _board_deals(today)
+        if (any_priority or d.priority == priority)
+        and (not search_lower or search_lower in d.search_text)
+    )
+    
+    columns = deals_to_columns(filtered_deals)
+    # Grouped by stage, already sorted by priority then due date
+    return (
+        filtered_deals,
+        MappingProxyType(board_stats(columns)),
+        bucket_by_stage(filtered_deals, columns),
+    )
+
+
 def render_pipeline_view() -> None:
     """Main entry point for the Pipeline View."""
     
+    # Pin "today" for every due-date calculation in this render
+    _today.cache_clear()
+    
     # Initialize session state
     if "selected_deal" not in st.session_state:
         st.session_state.selected_deal = None
@@ -566,24 +839,15 @@ def render_pipeline_view() -> None:
         st.session_state.pipeline_filter_priority = "All"
     if "pipeline_search" not in st.session_state:
         st.session_state.pipeline_search = ""
+    if "pipeline_stage_idx" not in st.session_state:
+        st.session_state.pipeline_stage_idx = 0
     
-    # Load deals (replace with database query in production)
-    all_deals = get_sample_deals()
-    
-    # Apply filters
-    filtered_deals = all_deals
-    
-    # Priority filter
-    if st.session_state.pipeline_filter_priority != "All":
-        filtered_deals = [d for d in filtered_deals if d["priority"] == st.session_state.pipeline_filter_priority]
-    
-    # Search filter
-    if st.session_state.pipeline_search:
-        search_lower = st.session_state.pipeline_search.lower()
-        filtered_deals = [
-            d for d in filtered_deals 
-            if search_lower in d["name"].lower() or search_lower in d["client"].lower()
-        ]
+    # Load, filter and group deals (memoized per day and filter inputs)
+    filtered_deals, stats, deals_by_stage = _load_board(
+        _today().isoformat(),
+        st.session_state.pipeline_filter_priority,
+        st.session_state.pipeline_search,
+    )
     
     # ========== HEADER ==========
     st.markdown("""
@@ -592,7 +856,7 @@ def render_pipeline_view() -> None:
     """, unsafe_allow_html=True)
     
     # ========== STATS BAR ==========
-    render_stats_bar(filtered_deals)
+    render_stats_bar(stats)
     
     st.markdown("---")
     
@@ -628,47 +892,36 @@ def render_pipeline_view() -> None:
         st.markdown("<br>", unsafe_allow_html=True)
     
     # ========== BOARD ==========
-    # Group deals by stage
-    deals_by_stage = {stage["id"]: [] for stage in SHIPLEY_STAGES}
-    for deal in filtered_deals:
-        if deal["stage"] in deals_by_stage:
-            deals_by_stage[deal["stage"]].append(deal)
-    
     # Create columns for each stage
-    # Using tabs for better mobile experience
-    stage_tabs = st.tabs([f"{s['icon']} {s['name']} ({len(deals_by_stage[s['id']])})" for s in SHIPLEY_STAGES])
+    # Using tabs for better mobile experience; on_change="rerun" makes them
+    # lazy, so only the open tab's cards are built. Labels carry deal counts
+    # that change with the filters, so the open stage is remembered by index.
+    tab_labels = [f"{prefix} ({len(d)})" for prefix, d in zip(STAGE_TAB_PREFIXES, deals_by_stage)]
+    stage_tabs = st.tabs(
+        tab_labels,
+        key="pipeline_stage_tab",
+        default=tab_labels[st.session_state.pipeline_stage_idx],
+        on_change="rerun",
+    )
     
     for i, (tab, stage) in enumerate(zip(stage_tabs, SHIPLEY_STAGES)):
+        if not tab.open:
+            continue
+        st.session_state.pipeline_stage_idx = i
         with tab:
-            stage_deals = deals_by_stage[stage["id"]]
+            stage_deals = deals_by_stage[i]
             
-            # Stage header
-            st.markdown(f"""
-            <div style="
-                background: linear-gradient(135deg, {stage['color']}22 0%, {stage['color']}11 100%);
-                border-left: 4px solid {stage['color']};
-                padding: 16px;
-                border-radius: 8px;
-                margin-bottom: 16px;
-            ">
-                <div style="font-weight: 600; color: #111827;">{stage['name']}</div>
-                <div style="font-size: 13px; color: #6b7280;">{stage['subtitle']}</div>
-                <div style="font-size: 14px; font-weight: 600; color: {stage['color']}; margin-top: 8px;">
-                    {format_currency(sum(d['value'] for d in stage_deals))} pipeline value
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            # Stage header, emitted with the first card when there is one
+            banner_html = STAGE_BANNER_TEMPLATES[stage["id"]].format(
+                value=format_currency(stats["stage_totals"][i])
+            )
             
             if stage_deals:
-                # Sort by priority then due date
-                stage_deals.sort(key=lambda d: (
-                    {"P-0": 0, "P-1": 1, "P-2": 2}.get(d["priority"], 3),
-                    d["due_date"]
-                ))
-                
-                for deal in stage_deals:
+                render_deal_card(stage_deals[0], stage["color"], lead_html=banner_html)
+                for deal in stage_deals[1:]:
                     render_deal_card(deal, stage["color"])
             else:
+                st.markdown(banner_html, unsafe_allow_html=True)
                 st.info("No opportunities in this stage")
 
 
@@ -4,8 +4,13 @@ Premium animations and interactions
 """
 
 import streamlit as st
-from typing import Optional, Literal
-import time
+from typing import Optional, Literal, Sequence
+from collections import deque
+from types import MappingProxyType
+from functools import lru_cache
+from math import pi
+import random
+import re
 
 # ============================================================================
 # CSS ANIMATIONS
@@ -342,10 +347,38 @@ ULTRA_DELIGHT_CSS = """
 """
 
 
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a <style> block."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,>])\s*", r"\1", css).strip()
+
+
+# Built once at import; init_ultra_delight emits this on every run
+ULTRA_DELIGHT_CSS_MIN = _minify_css(ULTRA_DELIGHT_CSS)
+
+
 # ============================================================================
 # VISOR COMPONENT
 # ============================================================================
 
+VISOR_STATUS_CONFIG = MappingProxyType({
+    "idle": {"label": "Ready", "icon": "⚪"},
+    "thinking": {"label": "Processing...", "icon": "🔵"},
+    "success": {"label": "Complete", "icon": "🟢"},
+    "warning": {"label": "Attention", "icon": "🟡"},
+    "error": {"label": "Error", "icon": "🔴"},
+    "celebrating": {"label": "Celebrating!", "icon": "🟣"},
+})
+
+VISOR_TEMPLATE = """
+        <div class="visor-container">
+            <div class="visor-dot visor-{status}"></div>
+            {label_html}
+        </div>
+    """
+
+
 def render_visor(
     status: Literal["idle", "thinking", "success", "warning", "error", "celebrating"] = "idle",
     show_label: bool = True
@@ -357,31 +390,38 @@ def render_visor(
         status: Current status (idle, thinking, success, warning, error, celebrating)
         show_label: Whether to show the status label
     """
-    status_config = {
-        "idle": {"label": "Ready", "icon": "⚪"},
-        "thinking": {"label": "Processing...", "icon": "🔵"},
-        "success": {"label": "Complete", "icon": "🟢"},
-        "warning": {"label": "Attention", "icon": "🟡"},
-        "error": {"label": "Error", "icon": "🔴"},
-        "celebrating": {"label": "Celebrating!", "icon": "🟣"},
-    }
-    
-    config = status_config.get(status, status_config["idle"])
+    config = VISOR_STATUS_CONFIG.get(status, VISOR_STATUS_CONFIG["idle"])
     
     label_html = f'<span class="visor-label">{config["label"]}</span>' if show_label else ''
     
-    st.markdown(f"""
-        <div class="visor-container">
-            <div class="visor-dot visor-{status}"></div>
-            {label_html}
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(VISOR_TEMPLATE.format(status=status, label_html=label_html), unsafe_allow_html=True)
 
 
 # ============================================================================
 # TOAST NOTIFICATIONS
 # ============================================================================
 
+# Toast placeholders kept in session state (oldest dropped past the cap)
+MAX_ACTIVE_TOASTS = 8
+
+TOAST_ICONS = MappingProxyType({
+    "success": "✓",
+    "info": "ℹ",
+    "warning": "⚠",
+    "error": "✕",
+    "celebration": "🎉",
+})
+
+TOAST_TEMPLATE = """
+        <div class="toast-container">
+            <div class="toast toast-{type}">
+                <div class="toast-icon">{icon}</div>
+                <div class="toast-message">{message}</div>
+            </div>
+        </div>
+    """
+
+
 def show_toast(
     message: str,
     type: Literal["success", "info", "warning", "error", "celebration"] = "info",
@@ -395,32 +435,17 @@ def show_toast(
         type: Type of toast (success, info, warning, error, celebration)
         duration: How long to show (seconds) - note: Streamlit will rerun
     """
-    icons = {
-        "success": "✓",
-        "info": "ℹ",
-        "warning": "⚠",
-        "error": "✕",
-        "celebration": "🎉",
-    }
+    icon = TOAST_ICONS.get(type, "ℹ")
     
-    icon = icons.get(type, "ℹ")
-    
-    toast_html = f"""
-        <div class="toast-container">
-            <div class="toast toast-{type}">
-                <div class="toast-icon">{icon}</div>
-                <div class="toast-message">{message}</div>
-            </div>
-        </div>
-    """
+    toast_html = TOAST_TEMPLATE.format(type=type, icon=icon, message=message)
     
     # Use a placeholder that can be cleared
     placeholder = st.empty()
     placeholder.markdown(toast_html, unsafe_allow_html=True)
     
-    # Store in session state for potential clearing
-    if "active_toasts" not in st.session_state:
-        st.session_state.active_toasts = []
+    # Store in session state for potential clearing (oldest dropped past the cap)
+    if not isinstance(st.session_state.get("active_toasts"), deque):
+        st.session_state.active_toasts = deque(maxlen=MAX_ACTIVE_TOASTS)
     st.session_state.active_toasts.append(placeholder)
 
 
@@ -428,6 +453,16 @@ def show_toast(
 # AURORA CELEBRATION
 # ============================================================================
 
+CONFETTI_COLORS = ("#990000", "#FFD700", "#22c55e", "#3b82f6", "#a855f7")
+CONFETTI_COUNT = 30
+CONFETTI_TEMPLATE = (
+    '<div class="confetti" style="left:{left}%;background:{color};'
+    'width:{size}px;height:{size}px;animation-delay:{delay:.2f}s"></div>'
+)
+_CONFETTI_LEFTS = range(101)
+_CONFETTI_SIZES = range(8, 17)
+
+
 def show_aurora_celebration(
     deal_name: str,
     deal_value: str,
@@ -445,25 +480,17 @@ def show_aurora_celebration(
         team_size: Number of team members involved
         final_pwin: Final win probability percentage
     """
-    # Generate confetti elements
-    confetti_colors = ["#990000", "#FFD700", "#22c55e", "#3b82f6", "#a855f7"]
-    confetti_html = ""
-    
-    import random
-    for i in range(30):
-        color = random.choice(confetti_colors)
-        left = random.randint(0, 100)
-        delay = random.uniform(0, 2)
-        size = random.randint(8, 16)
-        confetti_html += f"""
-            <div class="confetti" style="
-                left: {left}%;
-                background: {color};
-                width: {size}px;
-                height: {size}px;
-                animation-delay: {delay}s;
-            "></div>
-        """
+    # Generate confetti elements, drawing each attribute in bulk
+    n = CONFETTI_COUNT
+    confetti_html = "".join(
+        CONFETTI_TEMPLATE.format(left=left, color=color, size=size, delay=delay)
+        for color, left, size, delay in zip(
+            random.choices(CONFETTI_COLORS, k=n),
+            random.choices(_CONFETTI_LEFTS, k=n),
+            random.choices(_CONFETTI_SIZES, k=n),
+            [random.random() * 2 for _ in range(n)],
+        )
+    )
     
     celebration_html = f"""
         <div class="aurora-bg">
@@ -504,43 +531,21 @@ def show_aurora_celebration(
 # PROGRESS RING
 # ============================================================================
 
-def render_progress_ring(
-    progress: int,
-    size: int = 120,
-    stroke_width: int = 8,
-    color: str = "#990000",
-    label: str = ""
-) -> None:
-    """
-    Render an animated circular progress indicator.
-    
-    Args:
-        progress: Progress percentage (0-100)
-        size: Size of the ring in pixels
-        stroke_width: Width of the progress stroke
-        color: Color of the progress stroke
-        label: Optional label below the percentage
-    """
-    radius = (size - stroke_width) / 2
-    circumference = radius * 2 * 3.14159
-    offset = circumference - (progress / 100) * circumference
-    
-    label_html = f'<div style="font-size: 12px; color: #64748b; margin-top: 4px;">{label}</div>' if label else ''
-    
-    st.markdown(f"""
+# Ring markup; render_progress_ring fills in geometry, color and labels
+PROGRESS_RING_TEMPLATE = """
         <div class="progress-ring-container" style="width: {size}px; height: {size}px;">
             <svg width="{size}" height="{size}" style="transform: rotate(-90deg);">
                 <circle
-                    cx="{size/2}"
-                    cy="{size/2}"
+                    cx="{center}"
+                    cy="{center}"
                     r="{radius}"
                     fill="none"
                     stroke="#e5e7eb"
                     stroke-width="{stroke_width}"
                 />
                 <circle
-                    cx="{size/2}"
-                    cy="{size/2}"
+                    cx="{center}"
+                    cy="{center}"
                     r="{radius}"
                     fill="none"
                     stroke="{color}"
@@ -556,16 +561,56 @@ def render_progress_ring(
                 {label_html}
             </div>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+@lru_cache(maxsize=64)
+def _ring_geom(size: int, stroke_width: int) -> tuple[float, float, float]:
+    """Return (radius, center, circumference) of a ring, cached per shape."""
+    radius = (size - stroke_width) / 2
+    return radius, size / 2, 2 * pi * radius
+
+
+def render_progress_ring(
+    progress: int,
+    size: int = 120,
+    stroke_width: int = 8,
+    color: str = "#990000",
+    label: str = ""
+) -> None:
+    """
+    Render an animated circular progress indicator.
+    
+    Args:
+        progress: Progress percentage (0-100)
+        size: Size of the ring in pixels
+        stroke_width: Width of the progress stroke
+        color: Color of the progress stroke
+        label: Optional label below the percentage
+    """
+    radius, center, circumference = _ring_geom(size, stroke_width)
+    offset = circumference * (1 - progress / 100)
+    
+    label_html = f'<div style="font-size: 12px; color: #64748b; margin-top: 4px;">{label}</div>' if label else ''
+    
+    st.markdown(PROGRESS_RING_TEMPLATE.format(
+        size=size,
+        center=center,
+        radius=radius,
+        stroke_width=stroke_width,
+        color=color,
+        circumference=circumference,
+        offset=offset,
+        progress=progress,
+        label_html=label_html,
+    ), unsafe_allow_html=True)
 
 
 # ============================================================================
 # SKELETON LOADING
 # ============================================================================
 
-def render_skeleton_card() -> None:
-    """Render a skeleton loading card with shimmer effect."""
-    st.markdown("""
+SKELETON_CARD_HTML = """
         <div class="skeleton-card">
             <div class="skeleton skeleton-title"></div>
             <div class="skeleton skeleton-text" style="width: 80%;"></div>
@@ -575,17 +620,49 @@ def render_skeleton_card() -> None:
                 <div class="skeleton" style="width: 80px; height: 24px; border-radius: 12px;"></div>
             </div>
         </div>
-    """, unsafe_allow_html=True)
+    """
+
+
+# Line widths (%) used by render_skeleton_text when none are given
+SKELETON_TEXT_WIDTHS = (100, 80, 60)
+
+
+# Card markup on one line: indented or blank lines inside the grid <div>
+# would make Markdown render the following cards as code blocks
+_SKELETON_CARD_FLAT = "".join(line.strip() for line in SKELETON_CARD_HTML.splitlines())
+
+
+def render_skeleton_card() -> None:
+    """Render a skeleton loading card with shimmer effect."""
+    st.markdown(SKELETON_CARD_HTML, unsafe_allow_html=True)
+
+
+def render_skeleton_grid(count: int = 3) -> None:
+    """
+    Render a row of skeleton cards as a single element.
+    
+    Args:
+        count: Number of cards (one grid column each); nothing is rendered
+            if it is not positive
+    """
+    if count <= 0:
+        return
+    
+    st.markdown(
+        f'<div style="display: grid; grid-template-columns: repeat({count}, 1fr); gap: 16px;">'
+        f'{_SKELETON_CARD_FLAT * count}</div>',
+        unsafe_allow_html=True,
+    )
 
 
-def render_skeleton_text(lines: int = 3, widths: list = None) -> None:
+def render_skeleton_text(lines: int = 3, widths: Optional[Sequence[int]] = None) -> None:
     """Render skeleton text lines with shimmer effect."""
     if widths is None:
-        widths = [100, 80, 60][:lines]
+        widths = SKELETON_TEXT_WIDTHS[:lines]
     
-    lines_html = ""
-    for i, width in enumerate(widths):
-        lines_html += f'<div class="skeleton skeleton-text" style="width: {width}%;"></div>'
+    lines_html = "".join(
+        f'<div class="skeleton skeleton-text" style="width: {width}%;"></div>' for width in widths
+    )
     
     st.markdown(f"<div>{lines_html}</div>", unsafe_allow_html=True)
 
@@ -594,6 +671,27 @@ def render_skeleton_text(lines: int = 3, widths: list = None) -> None:
 # ANIMATED METRIC CARD
 # ============================================================================
 
+# Metric card markup; render_animated_metric fills in the fields
+METRIC_CARD_TEMPLATE = """
+        <div class="hover-lift fade-in" style="
+            background: white;
+            border: 1px solid #e2e8f0;
+            border-radius: 12px;
+            padding: 20px;
+        ">
+            <div style="display: flex; align-items: center; margin-bottom: 8px;">
+                {icon_html}
+                <span style="font-size: 14px; color: #64748b;">{label}</span>
+            </div>
+            <div style="font-size: 28px; font-weight: 700; color: #1e293b;">{value}</div>
+            {delta_html}
+        </div>
+    """
+
+# Delta text color per delta_color ("off" and unknown values fall back to gray)
+_DELTA_COLORS = {"normal": "#22c55e", "inverse": "#ef4444"}
+
+
 def render_animated_metric(
     label: str,
     value: str,
@@ -613,26 +711,17 @@ def render_animated_metric(
     """
     delta_html = ""
     if delta:
-        color = "#22c55e" if delta_color == "normal" else "#ef4444" if delta_color == "inverse" else "#64748b"
+        color = _DELTA_COLORS.get(delta_color, "#64748b")
         delta_html = f'<div style="font-size: 12px; color: {color}; margin-top: 4px;">{delta}</div>'
     
     icon_html = f'<span style="font-size: 24px; margin-right: 8px;">{icon}</span>' if icon else ''
     
-    st.markdown(f"""
-        <div class="hover-lift fade-in" style="
-            background: white;
-            border: 1px solid #e2e8f0;
-            border-radius: 12px;
-            padding: 20px;
-        ">
-            <div style="display: flex; align-items: center; margin-bottom: 8px;">
-                {icon_html}
-                <span style="font-size: 14px; color: #64748b;">{label}</span>
-            </div>
-            <div style="font-size: 28px; font-weight: 700; color: #1e293b;">{value}</div>
-            {delta_html}
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(METRIC_CARD_TEMPLATE.format_map({
+        "icon_html": icon_html,
+        "label": label,
+        "value": value,
+        "delta_html": delta_html,
+    }), unsafe_allow_html=True)
 
 
 # ============================================================================
@@ -640,8 +729,12 @@ def render_animated_metric(
 # ============================================================================
 
 def init_ultra_delight() -> None:
-    """Initialize Ultra-Delight CSS styles. Call this once at app start."""
-    st.markdown(ULTRA_DELIGHT_CSS, unsafe_allow_html=True)
+    """
+    Initialize Ultra-Delight CSS styles. Call this at the top of every run:
+    Streamlit drops elements a rerun does not emit, so the styles cannot be
+    injected only once per session.
+    """
+    st.markdown(ULTRA_DELIGHT_CSS_MIN, unsafe_allow_html=True)
 
 
 # ============================================================================
@@ -747,13 +840,7 @@ def show_ultra_delight_demo() -> None:
     st.markdown("---")
     
     st.markdown("### 💀 Skeleton Loading")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        render_skeleton_card()
-    with col2:
-        render_skeleton_card()
-    with col3:
-        render_skeleton_card()
+    render_skeleton_grid(3)
     
     st.markdown("---")
     